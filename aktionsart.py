@@ -1,15 +1,20 @@
 # -*- coding: utf-8 -*-
+import json
 import locale
 import logging
-import readline
-import subprocess
 import time
 import sys
 import os
 from dataclasses import dataclass
 from enum import Enum
-from typing import List, Optional, Sequence, Union
-import spacy
+from typing import Dict, Iterable, List, Optional, Sequence, TextIO, Tuple, Union
+import clasificacion
+from analizador_morfologico import analisis_posibles
+from cache_analisis import analizar_con_cache
+from conjugador_es import PERSONAS, conjugar
+from modelos import PERFILES, mostrar_tiempos, obtener_modelo_idioma, perfil_configurado, precargar_modelo_idioma, registrar_arranque
+from respuestas import ProveedorRespuestas, RespuestaNoDisponible, proveedor_actual, usar_proveedor
+from ritmo import establecer_ritmo, pausa, procesar_argumento_ritmo
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -17,11 +22,14 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 NEGRITA = '\033[1m'
 RESET = '\033[0m'
 
-# Intentamos cargar el modelo de spaCy. Si falla, el programa funcionará en modo manual.
-try:
-    nlp = spacy.load("es_core_news_sm")
-except OSError:
-    nlp = None
+# Modelo de spaCy (tamaño configurable con VENDLER_MODELO_ES, ver modelos.py).
+# Si no se puede cargar, el programa funcionará en modo manual.
+IDIOMA_SPACY = "es"
+
+
+def obtener_nlp(perfil: Optional[str] = None):
+    return obtener_modelo_idioma(IDIOMA_SPACY, perfil)
+
 
 class Respuesta(Enum):
     SI = ["sí", "si", "s"]
@@ -53,6 +61,15 @@ class RasgosPred:
     telico: bool = False
     dinamico: bool = False
 
+    @property
+    def mascara(self) -> int:
+        """Rasgos codificados en 5 bits (ver clasificacion.RASGOS), índice de TABLA_AKTIONSART."""
+        return clasificacion.a_mascara(self.causativo, self.estativo, self.puntual, self.telico, self.dinamico)
+
+    @classmethod
+    def desde_mascara(cls, mascara: int) -> "RasgosPred":
+        return cls(*clasificacion.desde_mascara(mascara))
+
 @dataclass
 class DatosClause:
     gerundio: str = ""
@@ -64,60 +81,23 @@ class DatosClause:
     rasgos_obtenidos: bool = False
 
 
-ESTAR = {
-    '1s': "estoy", '2s': "estás", '3s': "está",
-    '1p': "estamos", '2p': "están/estáis", '3p': "están"
-}
-
-ESTAR_PRETERITO = {
-    '1s': "estuve", '2s': "estuviste", '3s': "estuvo",
-    '1p': "estuvimos", '2p': "estuvieron/estuvisteis", '3p': "estuvieron"
-}
-
-ESTAR_SUBJUNTIVO = {
-    '1s': "estuviera", '2s': "estuvieras", '3s': "estuviera",
-    '1p': "estuviéramos", '2p': "estuvieran/estuvierais", '3p': "estuvieran"
-}
-
-HABER = {
-    '1s': "he", '2s': "has", '3s': "ha",
-    '1p': "hemos", '2p': "han/habeis", '3p': "han"
-}
-
-DEJAR = {
-    '1s': "dejara", '2s': "dejaras", '3s': "dejara",
-    '1p': "dejáramos", '2p': "dejaran/dejarais", '3p': "dejaran"
-}
-
-# Diccionario ampliado de irregulares y cambios de raíz (e>i, o>u)
-IRREGULARES = {
-    # Irregulares puros y participios fuertes
-    "abrir": {"pp": "abierto"}, "cubrir": {"pp": "cubierto"},
-    "decir": {"ger": "diciendo", "pp": "dicho"}, "escribir": {"pp": "escrito"},
-    "hacer": {"pp": "hecho"}, "freír": {"pp": "frito"},
-    "imprimir": {"pp": "impreso"}, "morir": {"ger": "muriendo", "pp": "muerto"},
-    "poner": {"pp": "puesto"}, "proveer": {"pp": "provisto"},
-    "romper": {"pp": "roto"}, "satisfacer": {"pp": "satisfecho"},
-    "soltar": {"pp": "suelto"}, "ver": {"pp": "visto"},
-    "volver": {"pp": "vuelto"}, "ir": {"ger": "yendo", "pp": "ido"},
-    "ser": {"ger": "siendo", "pp": "sido"}, "pudrir": {"pp": "podrido"},
-    "leer": {"ger": "leyendo", "pp": "leído"}, "traer": {"ger": "trayendo", "pp": "traído"},
-    "caer": {"ger": "cayendo", "pp": "caído"}, "oír": {"ger": "oyendo", "pp": "oído"},
-    
-    # Cambios vocálicos (e > i) en gerundio
-    "pedir": {"ger": "pidiendo"}, "sentir": {"ger": "sintiendo"},
-    "mentir": {"ger": "mintiendo"}, "seguir": {"ger": "siguiendo"},
-    "conseguir": {"ger": "consiguiendo"}, "perseguir": {"ger": "persiguiendo"},
-    "servir": {"ger": "sirviendo"}, "vestir": {"ger": "vistiendo"},
-    "repetir": {"ger": "repitiendo"}, "elegir": {"ger": "eligiendo"},
-    "corregir": {"ger": "corrigiendo"}, "reír": {"ger": "riendo"},
-    "sonreír": {"ger": "sonriendo"}, "venir": {"ger": "viniendo"},
-    "competir": {"ger": "compitiendo"}, "medir": {"ger": "midiendo"},
-    "despedir": {"ger": "despidiendo"}, "impedir": {"ger": "impidiendo"},
-    
-    # Cambios vocálicos (o > u) en gerundio
-    "dormir": {"ger": "durmiendo"}, "poder": {"ger": "pudiendo"}
-}
+# Campos de DatosClause que rellena el análisis automático
+CAMPOS_ANALISIS = ("infinitivo", "gerundio", "participio", "persona_numero", "sujeto", "complementos")
+
+
+def _tabla_auxiliar(infinitivo: str, modelo: str, tiempo: str) -> Dict[str, str]:
+    """Formas de un auxiliar por persona; la 2.ª plural lleva también la de «ustedes» (están/estáis)."""
+    formas = dict(zip(PERSONAS, conjugar(infinitivo, modelo).tiempos[tiempo]))
+    formas['2p'] = f"{formas['3p']}/{formas['2p']}"
+    return formas
+
+
+# Se indica el modelo para no cargar el léxico al importar
+ESTAR = _tabla_auxiliar("estar", "estar", "presente")
+ESTAR_PRETERITO = _tabla_auxiliar("estar", "estar", "preterito")
+ESTAR_SUBJUNTIVO = _tabla_auxiliar("estar", "estar", "imperfecto_subjuntivo")
+HABER = _tabla_auxiliar("haber", "haber", "presente")
+DEJAR = _tabla_auxiliar("dejar", "", "imperfecto_subjuntivo")
 
 
 def set_spanish_locale():
@@ -139,44 +119,45 @@ def mensaje_reinicio() -> None:
     print("Por favor, revisa con cuidado tus respuestas a las preguntas.")
 
 
-def peticion(prompt: str) -> str:
-    import sys
-    readline.set_startup_hook(lambda: readline.insert_text(""))
-    try:
-        if "\n" in prompt or len(prompt) > 60:
-            print(prompt, end="", flush=True)
-            user = input().strip()
-        else:
-            user = input(prompt).strip()
-        return user.encode('utf-8').decode('utf-8')
-    finally:
-        readline.set_startup_hook()
-        
+def peticion(prompt: str, clave: str = "") -> str:
+    return proveedor_actual().responder(clave, prompt)
+
+
+def respuesta_no_valida(respuesta: str, clave: str, mensaje: str) -> None:
+    # Un proveedor no interactivo no puede corregir su respuesta: repetir la pregunta sería un bucle infinito
+    if not proveedor_actual().interactivo:
+        raise RespuestaNoDisponible(f"Respuesta no válida «{respuesta}» para la pregunta «{clave}».")
+    print(mensaje)
 
-def respuesta_si_no(pregunta: str) -> bool:
+
+def respuesta_si_no(pregunta: str, clave: str = "") -> bool:
     while True:
         try:
-            respuesta = peticion(pregunta).lower()
+            respuesta = peticion(pregunta, clave).lower()
             if respuesta in Respuesta.SI.value:
                 return True
             elif respuesta in Respuesta.NO.value:
                 return False
-            print("\nPor favor, entrega una respuesta válida: «sí (s)» o «no (n)».")
+            respuesta_no_valida(respuesta, clave, "\nPor favor, entrega una respuesta válida: «sí (s)» o «no (n)».")
+        except (RespuestaNoDisponible, EOFError):
+            raise
         except Exception as e:
             logging.error(f"Error al obtener respuesta: {e}")
 
 
-def pedir_respuesta_multiple(pregunta: str, opciones: Sequence[Union[str, Sequence[str]]], prompt: str) -> str:
+def pedir_respuesta_multiple(pregunta: str, opciones: Sequence[Union[str, Sequence[str]]], prompt: str, clave: str = "") -> str:
     while True:
         try:
-            respuesta = peticion(f"{pregunta} {prompt}").lower()
+            respuesta = peticion(f"{pregunta} {prompt}", clave).lower()
             for opcion in opciones:
                 if isinstance(opcion, Sequence) and not isinstance(opcion, str):
                     if respuesta in opcion:
                         return opcion[0]
                 elif respuesta == opcion:
                     return opcion
-            print("\nPor favor, escribe una respuesta válida.")
+            respuesta_no_valida(respuesta, clave, "\nPor favor, escribe una respuesta válida.")
+        except (RespuestaNoDisponible, EOFError):
+            raise
         except Exception as e:
             logging.error(f"Error al obtener respuesta: {e}")
 
@@ -184,33 +165,12 @@ def pedir_respuesta_multiple(pregunta: str, opciones: Sequence[Union[str, Sequen
 # --- FUNCIONES DE ANÁLISIS AUTOMÁTICO ---
 
 def generar_formas_verbales(infinitivo):
-    """Genera gerundio y participio a partir del infinitivo usando reglas y diccionario de excepciones."""
-    inf = infinitivo.lower().strip()
-    
-    # 1. Buscamos en el diccionario de irregulares
-    ger = IRREGULARES.get(inf, {}).get("ger", "")
-    part = IRREGULARES.get(inf, {}).get("pp", "")
-
-    # 2. Generar GERUNDIO si no existe
-    if not ger:
-        # Caso especial: Verbos en -uir (huir -> huyendo), excepto -guir/-quir
-        if inf.endswith("uir") and not inf.endswith(("guir", "quir", "güir")):
-            ger = inf[:-2] + "yendo"
-        
-        # Reglas estándar (ahora sí funcionan como alternativas si no es -uir)
-        elif inf.endswith("ar"): 
-            ger = inf[:-2] + "ando"
-        elif inf.endswith(("er", "ir")): 
-            ger = inf[:-2] + "iendo"
-
-    # 3. Generar PARTICIPIO si no existe
-    if not part:
-        if inf.endswith("ar"): 
-            part = inf[:-2] + "ado"
-        elif inf.endswith(("er", "ir")): 
-            part = inf[:-2] + "ido"
-
-    return ger, part
+    """Gerundio y participio de «infinitivo» según su modelo de conjugación (ver conjugador_es)."""
+    try:
+        paradigma = conjugar(infinitivo)
+    except ValueError:
+        return "", ""
+    return paradigma.gerundio, paradigma.participio
 
 def analizar_automaticamente(oracion, datos_clausula):
     """
@@ -218,10 +178,17 @@ def analizar_automaticamente(oracion, datos_clausula):
     todas las personas, INCLUYENDO EL VOSOTROS Y PRETÉRITOS FUERTES (estuvisteis -> estar).
     Devuelve: (Éxito, Verbo_Visual, Infinitivo_Limpio)
     """
+    nlp = obtener_nlp()
     if not nlp: return False, "", ""
-    
-    doc = nlp(oracion)
-    
+
+    # Las cláusulas repetidas en la sesión no vuelven a pasar por spaCy (ver cache_analisis)
+    return analizar_con_cache(nlp, oracion, datos_clausula, analizar_doc, CAMPOS_ANALISIS)
+
+def analizar_doc(doc, datos_clausula):
+    """
+    Aplica las heurísticas de análisis automático a un Doc ya procesado por spaCy.
+    Permite reutilizar la misma lógica en el modo interactivo y en el modo por lotes.
+    """
     verbo_token = None
     
     # 1. Búsqueda prioritaria
@@ -257,46 +224,14 @@ def analizar_automaticamente(oracion, datos_clausula):
         else:
             break
             
-    # --- SANACIÓN DE LEMAS EXPANDIDA ---
+    # --- RECUPERACIÓN DEL LEMA ---
+    # El analizador morfológico corrige los lemas erróneos de spaCy (estuvisteis → estar) y da
+    # la persona y el número; si la forma no es verbal (ej: en la búsqueda agresiva), se usa el lema de spaCy.
     lema_limpio = verbo_token.lemma_.lower()
     texto_verbo = verbo_token.text.lower()
-    
-    # DICCIONARIO DE RAÍCES FUERTES (Pretéritos Irregulares)
-    PRETERITOS_FUERTES = {
-        "estuv": "estar", "tuv": "tener", "anduv": "andar",
-        "pud": "poder", "pus": "poner", "sup": "saber",
-        "hic": "hacer", "hiz": "hacer", "quis": "querer",
-        "vin": "venir", "dij": "decir", "traj": "traer"
-    }
-    
-    lemma_fixed = False
-
-    # 1. Revisar raíces irregulares primero
-    for raiz, infinitivo_real in PRETERITOS_FUERTES.items():
-        if texto_verbo.startswith(raiz):
-            lema_limpio = infinitivo_real
-            lemma_fixed = True
-            break
-    
-    # 2. Si no es irregular fuerte y el lema falla, heurística manual
-    if not lemma_fixed and not lema_limpio.endswith(("ar", "er", "ir", "ír")): 
-        
-        # Singular
-        if texto_verbo.endswith("é"):       lema_limpio = texto_verbo[:-1] + "ar"
-        elif texto_verbo.endswith("aste"):  lema_limpio = texto_verbo[:-4] + "ar"
-        elif texto_verbo.endswith("ó"):     lema_limpio = texto_verbo[:-1] + "ar"
-        elif texto_verbo.endswith("í"):     lema_limpio = texto_verbo[:-1] + "er"
-        elif texto_verbo.endswith("iste"):  lema_limpio = texto_verbo[:-4] + "er"
-            
-        # Plural
-        elif texto_verbo.endswith("amos"):  lema_limpio = texto_verbo[:-4] + "ar"
-        elif texto_verbo.endswith("aron"):  lema_limpio = texto_verbo[:-4] + "ar"
-        elif texto_verbo.endswith("imos"):  lema_limpio = texto_verbo[:-4] + "er"
-        elif texto_verbo.endswith("ieron"): lema_limpio = texto_verbo[:-5] + "er"
-            
-        # VOSOTROS
-        elif texto_verbo.endswith("asteis"): lema_limpio = texto_verbo[:-6] + "ar"
-        elif texto_verbo.endswith("isteis"): lema_limpio = texto_verbo[:-6] + "er"
+    analisis = analisis_posibles(texto_verbo, lema_limpio)
+    if analisis:
+        lema_limpio = analisis[0].infinitivo
 
     suffix = "".join(cliticos_encontrados)
     datos_clausula.infinitivo = lema_limpio + suffix 
@@ -310,24 +245,15 @@ def analizar_automaticamente(oracion, datos_clausula):
     datos_clausula.gerundio = ger
     datos_clausula.participio = part
     
-    # --- DETECCIÓN DE PERSONA EXPANDIDA ---
-    person_detected = None
-    
-    if texto_verbo.endswith(("é", "í")):
-        person_detected = "1s"
-    elif texto_verbo.endswith(("aste", "iste", "as", "es")): 
-        person_detected = "2s"
-    elif texto_verbo.endswith("ó"):
-        person_detected = "3s"
-    elif texto_verbo.endswith(("amos", "emos", "imos")):
-        person_detected = "1p"
-    elif texto_verbo.endswith(("asteis", "isteis", "áis", "éis", "ís")):
-        person_detected = "2p"
-    elif texto_verbo.endswith(("aron", "ieron", "an", "en")):
-        person_detected = "3p"
-        
-    if person_detected:
-        datos_clausula.persona_numero = person_detected
+    # --- DETECCIÓN DE PERSONA ---
+    # Personas posibles según la forma (cantaba: 1s o 3s); si hay más de una, deciden el sujeto y spaCy
+    personas = []
+    for posible in analisis:
+        if posible.infinitivo == lema_limpio and posible.persona_numero and posible.persona_numero not in personas:
+            personas.append(posible.persona_numero)
+
+    if len(personas) == 1:
+        datos_clausula.persona_numero = personas[0]
     else:
         # Fallback a spaCy
         morph = verbo_token.morph.to_dict()
@@ -343,6 +269,8 @@ def analizar_automaticamente(oracion, datos_clausula):
         elif "vosotros" in sujeto_txt.split(): datos_clausula.persona_numero = "2p"
         elif "ellos" in sujeto_txt.split() or "ellas" in sujeto_txt.split(): datos_clausula.persona_numero = "3p"
         else: datos_clausula.persona_numero = mapper_pn.get((persona, numero), "3s")
+        if personas and datos_clausula.persona_numero not in personas:
+            datos_clausula.persona_numero = personas[0]
 
     # División Posicional
     datos_clausula.sujeto = doc[:idx].text.strip()
@@ -367,7 +295,7 @@ def obtener_info_clausula(oracion: str, datos_clausula: DatosClause) -> DatosCla
         }
         desc_persona = nombres_personas.get(datos_clausula.persona_numero, "Desconocida")
         
-        time.sleep(0.5)
+        pausa(0.5)
         print("\nEste es un análisis de algunos de los rasgos morfológicos y estructurales de esta cláusula:")
         print("\n" + "="*50)
         print(f"• Verbo:            «{verbo_visual.lower()}»") 
@@ -381,28 +309,28 @@ def obtener_info_clausula(oracion: str, datos_clausula: DatosClause) -> DatosCla
         print(f"• Después del verbo:«{datos_clausula.complementos if datos_clausula.complementos else 'Ø'}»")
         print("="*50)
         
-        if respuesta_si_no("\n¿Es correcto este análisis? (s/n): "):
+        if respuesta_si_no("\n¿Es correcto este análisis? (s/n): ", "analisis_correcto"):
             datos_clausula.rasgos_obtenidos = True
             return datos_clausula
         else:
             print("\nEntendido. Ingresemos los datos manualmente.")
-            time.sleep(0.5)
+            pausa(0.5)
     
     # --- MODO MANUAL ---
-    datos_clausula.infinitivo = peticion(f"\nEscribe el INFINITIVO del verbo en «{oracion}», incluyendo los clíticos que haya (ejs: «derretirse», «decirle»): ")
-    datos_clausula.gerundio = peticion(f"Escribe el GERUNDIO del verbo en «{oracion}», sin clíticos (ej: «derritiendo»): ")
-    datos_clausula.participio = peticion(f"Escribe el PARTICIPIO (masculino singular) del verbo en «{oracion}» (ej: «derretido»): ")
+    datos_clausula.infinitivo = peticion(f"\nEscribe el INFINITIVO del verbo en «{oracion}», incluyendo los clíticos que haya (ejs: «derretirse», «decirle»): ", "infinitivo")
+    datos_clausula.gerundio = peticion(f"Escribe el GERUNDIO del verbo en «{oracion}», sin clíticos (ej: «derritiendo»): ", "gerundio")
+    datos_clausula.participio = peticion(f"Escribe el PARTICIPIO (masculino singular) del verbo en «{oracion}» (ej: «derretido»): ", "participio")
     
-    sujeto_input = peticion(f"Escribe todo lo que hay ANTES del verbo en «{oracion}», incluyendo los clíticos (0 si no hay nada): ")
+    sujeto_input = peticion(f"Escribe todo lo que hay ANTES del verbo en «{oracion}», incluyendo los clíticos (0 si no hay nada): ", "sujeto")
     datos_clausula.sujeto = "" if sujeto_input == "0" else sujeto_input
     
-    complementos_input = peticion(f"Escribe todo lo que hay DESPUÉS del verbo en «{oracion}» (0 si no hay nada): ")
+    complementos_input = peticion(f"Escribe todo lo que hay DESPUÉS del verbo en «{oracion}» (0 si no hay nada): ", "complementos")
     datos_clausula.complementos = "" if complementos_input == "0" else complementos_input
     
     persona_numero_pregunta = "Escribe la persona y número del verbo"
     persona_numero_prompt = "(1s/2s/3s/1p/2p/3p): "
     opciones_persona_numero: List[str] = ['1s', '2s', '3s', '1p', '2p', '3p']
-    datos_clausula.persona_numero = pedir_respuesta_multiple(persona_numero_pregunta, opciones_persona_numero, persona_numero_prompt)
+    datos_clausula.persona_numero = pedir_respuesta_multiple(persona_numero_pregunta, opciones_persona_numero, persona_numero_prompt, "persona_numero")
     
     datos_clausula.rasgos_obtenidos = True
     return datos_clausula
@@ -410,6 +338,95 @@ def obtener_info_clausula(oracion: str, datos_clausula: DatosClause) -> DatosCla
 # --- FIN FUNCIONES DE ANÁLISIS AUTOMÁTICO ---
 
 
+# --- MODO POR LOTES ---
+
+def analizar_lote(oraciones: Iterable[str], salida: TextIO, tamano_lote: int = 64,
+                  perfil: Optional[str] = None, almacen: Union[str, bool, None] = None) -> int:
+    """
+    Analiza un flujo de cláusulas (una por línea) con nlp.pipe y escribe
+    en «salida» un registro JSON por cláusula. Devuelve el número de cláusulas procesadas.
+    Los Doc ya procesados por el mismo modelo se toman del almacén en disco (ver almacen_docs),
+    ubicado en «almacen» o en su ruta por defecto; con almacen=False no se usa.
+    """
+    nlp = obtener_nlp(perfil or perfil_configurado())
+    if not nlp:
+        raise RuntimeError("No hay un modelo de spaCy para español disponible; el modo por lotes requiere spaCy.")
+
+    limpias = (linea.strip() for linea in oraciones)
+    textos = (texto for texto in limpias if texto)
+    procesadas = 0
+
+    docs = None
+    if almacen is not False:
+        from almacen_docs import AlmacenDocs
+        try:
+            docs = AlmacenDocs(nlp, almacen or None).procesar(textos, tamano_lote)
+        except OSError as e:
+            logging.warning(f"No se pudo abrir el almacén de análisis ({e}); se procesará todo con spaCy.")
+    if docs is None:
+        docs = nlp.pipe(textos, batch_size=tamano_lote)
+
+    for doc in docs:
+        datos_clausula = DatosClause()
+        exito, verbo, _ = analizar_doc(doc, datos_clausula)
+        registro = {
+            "oracion": doc.text,
+            "exito": exito,
+            "verbo": verbo,
+            "infinitivo": datos_clausula.infinitivo,
+            "gerundio": datos_clausula.gerundio,
+            "participio": datos_clausula.participio,
+            "persona_numero": datos_clausula.persona_numero,
+            "sujeto": datos_clausula.sujeto,
+            "complementos": datos_clausula.complementos,
+        }
+        salida.write(json.dumps(registro, ensure_ascii=False) + "\n")
+        procesadas += 1
+
+    return procesadas
+
+
+def main_lote(argumentos: Sequence[str]) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Análisis morfológico por lotes de cláusulas (una por línea)."
+    )
+    parser.add_argument("--lote", required=True, metavar="ARCHIVO",
+                        help="archivo con una cláusula por línea («-» para leer de la entrada estándar)")
+    parser.add_argument("--salida", default="-", metavar="ARCHIVO",
+                        help="archivo JSONL de salida («-» para la salida estándar)")
+    parser.add_argument("--tamano-lote", type=int, default=64, metavar="N",
+                        help="número de cláusulas que spaCy procesa en cada lote (por defecto: 64)")
+    parser.add_argument("--perfil", choices=sorted(PERFILES), default=None,
+                        help="componentes de spaCy que se ejecutan (por defecto: «interactivo», o VENDLER_PERFIL); "
+                             "«lemas» omite el análisis de dependencias, por lo que no recupera sujeto ni complementos")
+    parser.add_argument("--almacen-docs", default=None, metavar="DIRECTORIO",
+                        help="directorio donde se guardan los análisis de spaCy para reutilizarlos "
+                             "(por defecto: VENDLER_ALMACEN_DOCS o ~/.cache/vendler/docs)")
+    parser.add_argument("--sin-almacen", action="store_true",
+                        help="procesa todas las cláusulas con spaCy sin leer ni guardar análisis en disco")
+    args = parser.parse_args(argumentos)
+    establecer_ritmo("cero")
+
+    entrada = sys.stdin if args.lote == "-" else open(args.lote, encoding="utf-8")
+    salida = sys.stdout if args.salida == "-" else open(args.salida, "w", encoding="utf-8")
+    try:
+        almacen = False if args.sin_almacen else args.almacen_docs
+        procesadas = analizar_lote(entrada, salida, args.tamano_lote, args.perfil, almacen)
+    except RuntimeError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if entrada is not sys.stdin:
+            entrada.close()
+        if salida is not sys.stdout:
+            salida.close()
+
+    print(f"Cláusulas analizadas: {procesadas}", file=sys.stderr)
+    return 0
+
+
 def construir_perif_gerundio(tiempo: str, datos_clausula: DatosClause) -> str:
     forma_estar = ESTAR_PRETERITO[datos_clausula.persona_numero] if tiempo == 'preterito' else ESTAR[datos_clausula.persona_numero]
     return " ".join(parte for parte in [datos_clausula.sujeto, f"{forma_estar} {datos_clausula.gerundio}", datos_clausula.complementos] if parte)
@@ -446,7 +463,7 @@ def determinar_subtipo(pred_es: RasgosPred) -> Optional[str]:
         return None
 
 
-def determinar_aktionsart(pred_es: RasgosPred) -> Optional[Aktionsart]:
+def _aktionsart_por_reglas(pred_es: RasgosPred) -> Optional[Aktionsart]:
     subtipo = determinar_subtipo(pred_es)
     if subtipo is None:
         return None
@@ -457,27 +474,46 @@ def determinar_aktionsart(pred_es: RasgosPred) -> Optional[Aktionsart]:
             return Aktionsart[f"{subtipo}_CAUSATIVO"]
     else:
         return Aktionsart[subtipo]
+
+
+# Aktionsart de cada una de las 32 combinaciones de rasgos, calculado una vez con las reglas de arriba
+TABLA_AKTIONSART = clasificacion.construir_tabla(lambda mascara: _aktionsart_por_reglas(RasgosPred.desde_mascara(mascara)))
+AKTIONSARTS = tuple(Aktionsart)
+CODIGOS_AKTIONSART = clasificacion.codigos_tabla(TABLA_AKTIONSART, AKTIONSARTS)
+
+
+def determinar_aktionsart(pred_es: RasgosPred) -> Optional[Aktionsart]:
+    return TABLA_AKTIONSART[pred_es.mascara]
+
+
+def clasificar_lote(rasgos):
+    """
+    Clasifica de una vez un lote de rasgos (matriz de n x 5 en el orden de RasgosPred, o
+    arreglo de máscaras) y devuelve los índices en AKTIONSARTS (-1 si no hay aktionsart).
+    Requiere NumPy.
+    """
+    return clasificacion.clasificar_lote(rasgos, CODIGOS_AKTIONSART)
         
 
 #Pruebas de Aktionsart en funciones específicas
 def prueba_causatividad(oracion: str) -> bool:
-    time.sleep(0.5)
+    pausa(0.5)
     print("\nPRUEBA DE CAUSATIVIDAD")
     print(f"\nIntenta reformular «{oracion}» siguiendo estos modelos: ")
     print("• El gato rompió el jarrón → El gato HIZO/CAUSÓ QUE el jarrón se rompiera")
     print("• Ana le dio un libro a Pepe → Ana HIZO/CAUSÓ QUE Pepe tuviera un libro")
-    reformulacion = peticion("\nEscribe tu reformulación (o «0» si no es posible): ")
+    reformulacion = peticion("\nEscribe tu reformulación (o «0» si no es posible): ", "reformulacion_causativa")
     if reformulacion == '0' or not reformulacion.strip():
         return False
     print("\nConsidera lo siguiente:")
     print(f"• «{reformulacion[0].upper() + reformulacion[1:]}» debe mantener el significado de «{oracion}».")
     print(f"• «{reformulacion[0].upper() + reformulacion[1:]}» no debe añadir nuevos argumentos ni repetir otros ya existentes en «{oracion}».")
     print("• No debe tratarse de expresiones de consumo («comer una manzana») o creación («escribir un cuento»).")
-    return respuesta_si_no(f"\n¿«{reformulacion[0].upper() + reformulacion[1:]}» cumple con estos criterios? (s/n): ")
+    return respuesta_si_no(f"\n¿«{reformulacion[0].upper() + reformulacion[1:]}» cumple con estos criterios? (s/n): ", "causatividad")
 
 def obtener_evento_basico() -> str:
     while True:
-        evento = peticion("\nEscribe el evento o estado resultante sin la causa (ejs: «el jarrón se rompió», «Pepe tiene un libro»).\nSi no puedes pensar en ninguno, escribe «0»: ")
+        evento = peticion("\nEscribe el evento o estado resultante sin la causa (ejs: «el jarrón se rompió», «Pepe tiene un libro»).\nSi no puedes pensar en ninguno, escribe «0»: ", "evento_basico")
         if evento == "0" or evento.strip():
             return evento
         print("\nPor favor, ingresa una oración válida o «0» para cancelar.")
@@ -494,10 +530,10 @@ def verificar_limpieza_adjuntos(oracion: str) -> str:
     print("• Expresiones de modo (ej: «rápidamente», «bien», «mal», «con calma»)")
     print("• Negaciones (ej: «no», «tampoco»)")
     
-    if respuesta_si_no("\n¿Tu cláusula contiene alguno de estos elementos? (s/n): "):
-        oracion_limpia = peticion(f"\nPor favor, escribe «{oracion}» de nuevo SIN esos elementos (ej: 'Pedro corrió' en vez de 'Pedro nunca corrió ayer'): ")
+    if respuesta_si_no("\n¿Tu cláusula contiene alguno de estos elementos? (s/n): ", "adjuntos"):
+        oracion_limpia = peticion(f"\nPor favor, escribe «{oracion}» de nuevo SIN esos elementos (ej: 'Pedro corrió' en vez de 'Pedro nunca corrió ayer'): ", "oracion_limpia")
         while not oracion_limpia.strip():
-            oracion_limpia = peticion("No has escrito nada. Inténtalo de nuevo: ")
+            oracion_limpia = peticion("No has escrito nada. Inténtalo de nuevo: ", "oracion_limpia")
         return oracion_limpia
     return oracion
 
@@ -507,21 +543,21 @@ def prueba_estatividad(oracion: str) -> bool:
         f"\nObserva el siguiente diálogo:"
         f"\n— ¿Qué pasó hace un rato / ayer / el mes pasado?"
         f"\n— {oracion[0].upper() + oracion[1:]}."
-        f"\n\n¿Te parece que «{oracion}» es una buena respuesta a la pregunta? \n(con al menos una de las opciones) (s/n): ")
+        f"\n\n¿Te parece que «{oracion}» es una buena respuesta a la pregunta? \n(con al menos una de las opciones) (s/n): ", "estatividad")
 
 def prueba_dinamicidad(datos_clausula: DatosClause) -> bool:
     perifrasis_gerundio = construir_perif_gerundio('presente', datos_clausula)
     print("\nPRUEBA DE DINAMICIDAD")
     return respuesta_si_no(
         f"\nObserva esta expresión: «{perifrasis_gerundio[0].upper() + perifrasis_gerundio[1:]} enérgicamente / con fuerza / con ganas»."
-        f"\n¿Esta expresión es compatible con alguna de las opciones? (s/n): ")
+        f"\n¿Esta expresión es compatible con alguna de las opciones? (s/n): ", "dinamicidad")
 
 def prueba_duratividad(datos_clausula: DatosClause) -> bool:
     perifrasis_gerundio = construir_perif_gerundio('preterito', datos_clausula)
     print("\nPRUEBA DE PUNTUALIDAD")
     return respuesta_si_no(
         f"\nObserva esta expresión: «{perifrasis_gerundio[0].upper() + perifrasis_gerundio[1:]} durante una hora / un mes»."
-        f"\n¿Es esta una expresión posible (con al menos una de las opciones)? \n(sin que el evento tome una interpretación iterativa o de inminencia) (s/n): ")
+        f"\n¿Es esta una expresión posible (con al menos una de las opciones)? \n(sin que el evento tome una interpretación iterativa o de inminencia) (s/n): ", "duratividad")
 
 def prueba_telicidad(datos_clausula: DatosClause) -> bool:
     perifrasis_gerundio = construir_perif_gerundio_subj(datos_clausula)
@@ -530,7 +566,7 @@ def prueba_telicidad(datos_clausula: DatosClause) -> bool:
     print("\nPRUEBA DE TELICIDAD")
     pregunta = (f"\nImagina que {perifrasis_gerundio} y de pronto {perifrasis_infinitivo}."
                 f"\n¿Se podría decir que «{perifrasis_participio}»? (s/n): ")
-    return not respuesta_si_no(pregunta)
+    return not respuesta_si_no(pregunta, "telicidad")
     
 
 def obtener_rasgos_akt(oracion: str, datos_clausula: DatosClause) -> Union[RasgosPred, None]:
@@ -552,42 +588,55 @@ def obtener_rasgos_akt(oracion: str, datos_clausula: DatosClause) -> Union[Rasgo
         pred_es.causativo = False
         print(f"\n{NEGRITA}El predicado es [-causativo]{RESET}")
 
-    time.sleep(0.5)
+    pausa(0.5)
 
     # 2. Limpieza de la cláusula
     oracion = verificar_limpieza_adjuntos(oracion) 
 
-    time.sleep(0.5)
+    pausa(0.5)
 
     # 3. Análisis de información de la cláusula
     obtener_info_clausula(oracion, datos_clausula)
 
-    time.sleep(0.5)
+    pausa(0.5)
 
     # 4. Bloque de pruebas semánticas
     pred_es.estativo = prueba_estatividad(oracion)
     print(f"\n{NEGRITA}El predicado es [{'+estativo' if pred_es.estativo else '-estativo'}]{RESET}")
-    time.sleep(0.5)
+    pausa(0.5)
 
     if not pred_es.estativo:
         
         pred_es.puntual = not prueba_duratividad(datos_clausula)
         print(f"\n{NEGRITA}El predicado es [{'+puntual' if pred_es.puntual else '-puntual'}]{RESET}")
-        time.sleep(0.5)
+        pausa(0.5)
 
         pred_es.telico = prueba_telicidad(datos_clausula)
         print(f"\n{NEGRITA}El predicado es [{'+télico' if pred_es.telico else '-télico'}]{RESET}")
-        time.sleep(0.5)
+        pausa(0.5)
 
         pred_es.dinamico = prueba_dinamicidad(datos_clausula)
         print(f"\n{NEGRITA}El predicado es [{'+dinámico' if pred_es.dinamico else '-dinámico'}]{RESET}")
-        time.sleep(0.5)
+        pausa(0.5)
 
     return pred_es
 
 
-def mostrar_resultado(oracion_original: str, aktionsart: Aktionsart, pred_es: RasgosPred) -> None:
-    time.sleep(0.5)
+def clasificar_predicado(oracion: str, proveedor: ProveedorRespuestas) -> Tuple[Optional[Aktionsart], Optional[RasgosPred], DatosClause]:
+    """
+    Aplica todas las pruebas diagnósticas a «oracion» tomando las respuestas de «proveedor»,
+    sin intervención del usuario. Devuelve el aktionsart (o None), los rasgos y los datos de la cláusula.
+    """
+    datos_clausula = DatosClause()
+    with usar_proveedor(proveedor):
+        pred_es = obtener_rasgos_akt(oracion, datos_clausula)
+    aktionsart = determinar_aktionsart(pred_es) if pred_es is not None else None
+    return aktionsart, pred_es, datos_clausula
+
+
+def mostrar_resultado(oracion_original: str, aktionsart: Aktionsart, pred_es: RasgosPred,
+                      datos_clausula: Optional[DatosClause] = None) -> None:
+    pausa(0.5)
     print("\nRESULTADO")
     print(f"\n{NEGRITA}El aktionsart del predicado de «{oracion_original}» es {aktionsart.value.upper()}.{RESET}")
 
@@ -602,37 +651,34 @@ def mostrar_resultado(oracion_original: str, aktionsart: Aktionsart, pred_es: Ra
 
     if akt_estado:
         rasgos_str.append("[-dinámico]")
-        es_dinamico = False
     else:
         rasgos_str.append(f"[{'+dinámico' if pred_es.dinamico else '-dinámico'}]")
-        es_dinamico = pred_es.dinamico
 
     print("\nEste predicado se clasifica así porque tiene los siguientes rasgos:")
     print(' '.join(rasgos_str))
-    time.sleep(0.5)
+    pausa(0.5)
 
-    if respuesta_si_no("\n¿Quieres obtener la estructura lógica de esta cláusula? (s/n): "):
+    if respuesta_si_no("\n¿Quieres obtener la estructura lógica de esta cláusula? (s/n): ", "obtener_ls"):
         print("\nEjecutando la opción elegida...")
-        time.sleep(1)
-        cargar_ls(aktionsart, oracion_original, es_dinamico)
+        pausa(1)
+        cargar_ls(aktionsart, oracion_original, pred_es, datos_clausula)
 
 
-def cargar_ls(aktionsart: Aktionsart, oracion_original: str, es_dinamico: bool) -> None:
-    try:
-        dinamico_str = "dinamico" if es_dinamico else "no_dinamico"
-        cmd = [sys.executable, "-u", "ls.py", aktionsart.value, oracion_original, dinamico_str]
-        subprocess.run(cmd, check=True)
-    except subprocess.CalledProcessError as e:
-        print(f"Error al ejecutar ls.py: {e}")
-    except FileNotFoundError:
-        print("No se encontró el archivo ls.py en el directorio actual.")
+def cargar_ls(aktionsart: Aktionsart, oracion_original: str, pred_es: RasgosPred,
+             datos_clausula: Optional[DatosClause] = None) -> Optional[str]:
+    import ls
+    return ls.generar_ls(aktionsart, oracion_original, pred_es, datos_clausula)
 
 
 def main() -> None:
+    inicio = time.perf_counter()
+    # El modelo solo hace falta tras la prueba de causatividad y la limpieza de adjuntos
+    precargar_modelo_idioma(IDIOMA_SPACY)
     set_spanish_locale()
     limpiar_consola()
     print("\nEste programa te ayudará a identificar el aktionsart")
     print("del predicado principal en una cláusula.")
+    registrar_arranque("aktionsart", inicio)
 
     while True:
         try:           
@@ -640,7 +686,8 @@ def main() -> None:
                 "\nPor favor, escribe una cláusula con el verbo que quieres probar"
                 "\nconjugado en pretérito (ej: «Pedro corrió hasta su casa»)."
                 "\nSi suena muy extraña, escríbela en presente (ej: «María sabe inglés»)."
-                "\n\nCláusula: "
+                "\n\nCláusula: ",
+                "clausula"
             )
 
             if not oracion_original:
@@ -657,18 +704,30 @@ def main() -> None:
             if aktionsart is None:
                 mensaje_reinicio()
                 continue
-            mostrar_resultado(oracion_original, aktionsart, pred_es)
+            mostrar_resultado(oracion_original, aktionsart, pred_es, datos_clausula)
 
-            if not respuesta_si_no("\n¿Quieres identificar el aktionsart de otro predicado? (s/n): "):
-                time.sleep(1)
+            if not respuesta_si_no("\n¿Quieres identificar el aktionsart de otro predicado? (s/n): ", "otro_predicado"):
+                mostrar_tiempos()
+                pausa(1)
                 return
             else:
-                time.sleep(0.5)
+                pausa(0.5)
                 limpiar_consola()
 
+        except EOFError:
+            # Entrada redirigida que se terminó: no hay más cláusulas que analizar
+            return
         except Exception as e:
             logging.error(f"\nSe produjo un error inesperado: {e}")
             print("\nSe produjo un error. Por favor, intenta de nuevo.")
 
+def run() -> None:
+    """Punto de entrada para el menú principal (main.py)."""
+    main()
+
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    argumentos = procesar_argumento_ritmo(sys.argv[1:])
+    if argumentos:
+        sys.exit(main_lote(argumentos))
+    run()
\ No newline at end of file
@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+"""
+Almacén en disco de los Doc de spaCy ya procesados en el modo por lotes (DocBin).
+
+Al volver a analizar un corpus tras cambiar las heurísticas de analizar_doc, el análisis
+de spaCy (lo más costoso) da el mismo resultado: con el almacén, los Doc de las cláusulas
+ya vistas se deserializan y solo se procesan con el modelo las nuevas.
+
+Cada modelo y perfil tiene su propio directorio, donde cada lote de Doc nuevos se guarda
+en un archivo .spacy (DocBin) junto con un .json que lista el hash SHA-256 del texto de
+cada Doc. Un metadatos.json registra la versión del modelo y de spaCy con que se
+generaron; si cambian, el directorio se vacía al abrirlo, de modo que nunca se mezclan
+análisis de modelos distintos. La ubicación se configura con VENDLER_ALMACEN_DOCS.
+"""
+import hashlib
+import json
+import logging
+import os
+import shutil
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from cache_analisis import firma_modelo
+
+METADATOS = "metadatos.json"
+
+
+def ruta_por_defecto() -> str:
+    if os.environ.get("VENDLER_ALMACEN_DOCS"):
+        return os.environ["VENDLER_ALMACEN_DOCS"]
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "vendler", "docs")
+
+
+def hash_texto(texto: str) -> str:
+    return hashlib.sha256(texto.encode("utf-8")).hexdigest()
+
+
+def _escribir_atomico(ruta: str, contenido: bytes) -> None:
+    temporal = ruta + ".tmp"
+    with open(temporal, "wb") as archivo:
+        archivo.write(contenido)
+    os.replace(temporal, ruta)
+
+
+class AlmacenDocs:
+    def __init__(self, nlp: Any, ruta: Optional[str] = None):
+        import spacy
+
+        self.nlp = nlp
+        lang, nombre, version, componentes = firma_modelo(nlp)
+        # Un directorio por paquete y perfil (componentes cargados); la versión se comprueba en los metadatos
+        perfil = hashlib.sha256("+".join(componentes).encode("utf-8")).hexdigest()[:12]
+        self.ruta = os.path.join(ruta or ruta_por_defecto(), f"{lang}_{nombre}-{perfil}")
+        self.metadatos = {"modelo": f"{lang}_{nombre}", "version": version,
+                          "spacy": spacy.__version__, "componentes": list(componentes)}
+        self.aciertos = 0
+        self.fallos = 0
+        self._indice: Dict[str, Tuple[str, int]] = {}
+        self._cargado: Tuple[Optional[str], List[Any]] = (None, [])
+        self._abrir()
+
+    def _abrir(self) -> None:
+        os.makedirs(self.ruta, exist_ok=True)
+        ruta_metadatos = os.path.join(self.ruta, METADATOS)
+        try:
+            with open(ruta_metadatos, encoding="utf-8") as archivo:
+                guardados = json.load(archivo)
+        except (OSError, ValueError):
+            guardados = None
+        if guardados != self.metadatos:
+            if guardados is not None:
+                logging.info(f"El modelo cambió ({guardados.get('version')} → {self.metadatos['version']}); "
+                             f"se descartan los Doc guardados en «{self.ruta}».")
+            self.limpiar()
+            return
+        for nombre in sorted(os.listdir(self.ruta)):
+            if not nombre.endswith(".json") or nombre == METADATOS:
+                continue
+            lote = nombre[:-len(".json")]
+            if not os.path.exists(os.path.join(self.ruta, lote + ".spacy")):
+                continue
+            try:
+                with open(os.path.join(self.ruta, nombre), encoding="utf-8") as archivo:
+                    hashes = json.load(archivo)
+            except (OSError, ValueError) as e:
+                logging.warning(f"Índice ilegible en el almacén de Doc «{nombre}» ({e}); se ignora ese lote.")
+                continue
+            for posicion, clave in enumerate(hashes):
+                self._indice[clave] = (lote, posicion)
+
+    def limpiar(self) -> None:
+        """Descarta todos los Doc guardados para este modelo y perfil."""
+        shutil.rmtree(self.ruta, ignore_errors=True)
+        os.makedirs(self.ruta, exist_ok=True)
+        _escribir_atomico(os.path.join(self.ruta, METADATOS), json.dumps(self.metadatos).encode("utf-8"))
+        self._indice.clear()
+        self._cargado = (None, [])
+
+    def __contains__(self, texto: str) -> bool:
+        return hash_texto(texto) in self._indice
+
+    def __len__(self) -> int:
+        return len(self._indice)
+
+    def _docs_lote(self, lote: str) -> List[Any]:
+        if self._cargado[0] != lote:
+            from spacy.tokens import DocBin
+
+            with open(os.path.join(self.ruta, lote + ".spacy"), "rb") as archivo:
+                docs = list(DocBin().from_bytes(archivo.read()).get_docs(self.nlp.vocab))
+            self._cargado = (lote, docs)
+        return self._cargado[1]
+
+    def obtener(self, textos: Iterable[str]) -> Dict[str, Any]:
+        """Doc guardados de los «textos» que estén en el almacén (texto → Doc)."""
+        posiciones: Dict[str, List[Tuple[int, str]]] = {}
+        for texto in textos:
+            ubicacion = self._indice.get(hash_texto(texto))
+            if ubicacion is None:
+                self.fallos += 1
+            else:
+                posiciones.setdefault(ubicacion[0], []).append((ubicacion[1], texto))
+        docs = {}
+        # Se lee cada archivo una sola vez aunque tenga varios de los textos pedidos
+        for lote, pedidos in posiciones.items():
+            try:
+                guardados = self._docs_lote(lote)
+            except (OSError, ValueError) as e:
+                logging.warning(f"No se pudo leer el lote «{lote}» del almacén de Doc ({e}); se vuelve a procesar.")
+                self.fallos += len(pedidos)
+                self._indice = {clave: ubicacion for clave, ubicacion in self._indice.items() if ubicacion[0] != lote}
+                continue
+            for posicion, texto in pedidos:
+                docs[texto] = guardados[posicion]
+                self.aciertos += 1
+        return docs
+
+    def guardar(self, docs: List[Any]) -> None:
+        """Guarda los «docs» en un archivo nuevo del almacén."""
+        from spacy.tokens import DocBin
+
+        if not docs:
+            return
+        hashes = [hash_texto(doc.text) for doc in docs]
+        lote = hashes[0][:16]
+        try:
+            _escribir_atomico(os.path.join(self.ruta, lote + ".spacy"), DocBin(docs=docs).to_bytes())
+            # El índice se escribe al final: un .spacy sin su .json se ignora al abrir
+            _escribir_atomico(os.path.join(self.ruta, lote + ".json"), json.dumps(hashes).encode("utf-8"))
+        except OSError as e:
+            logging.warning(f"No se pudieron guardar los Doc en «{self.ruta}» ({e}).")
+            return
+        for posicion, clave in enumerate(hashes):
+            self._indice[clave] = (lote, posicion)
+
+    def procesar(self, textos: Iterable[str], tamano_lote: int = 64) -> Iterator[Any]:
+        """
+        Como nlp.pipe(textos), pero toma del almacén los Doc ya procesados y guarda los nuevos.
+        Los Doc salen en el orden de «textos».
+        """
+        for bloque in _bloques(textos, tamano_lote):
+            guardados = self.obtener(bloque)
+            faltan = [texto for texto in dict.fromkeys(bloque) if texto not in guardados]
+            nuevos = list(self.nlp.pipe(faltan, batch_size=tamano_lote))
+            self.guardar(nuevos)
+            guardados.update(zip(faltan, nuevos))
+            for texto in bloque:
+                yield guardados[texto]
+
+    def estadisticas(self) -> Dict[str, int]:
+        return {"aciertos": self.aciertos, "fallos": self.fallos, "entradas": len(self)}
+
+
+def _bloques(textos: Iterable[str], tamano: int) -> Iterator[List[str]]:
+    bloque = []
+    for texto in textos:
+        bloque.append(texto)
+        if len(bloque) >= tamano:
+            yield bloque
+            bloque = []
+    if bloque:
+        yield bloque
@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+"""
+Análisis morfológico de formas verbales del español: forma → (infinitivo, persona, número, tiempo).
+
+El analizador se compila una sola vez, la primera vez que se usa, a partir de las tablas de
+conjugación de conjugador_es:
+
+    • un diccionario con todas las formas de los verbos del léxico con raíces irregulares
+      (tuve → tener, quepo → caber, fueron → ser/ir...), que no se deducen de la terminación;
+    • un trie de terminaciones invertidas, extraídas de los paradigmas de verbos prototipo,
+      que al recorrer la forma de derecha a izquierda propone en una sola pasada cada corte
+      raíz + terminación posible con su tiempo y persona.
+
+Cada raíz propuesta se deshace de los cambios regulares (pienso → pens-, pidió → ped-,
+busqué → busc-, conozco → conoc-...) y el infinitivo candidato se confirma conjugándolo,
+de modo que solo quedan análisis exactos (los paradigmas quedan en la caché de conjugar).
+Si hay varios, se prefieren los verbos del léxico, el lema que sugiere spaCy y los tiempos
+más frecuentes (ver analisis_posibles).
+"""
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+
+from conjugador_es import MODELOS, PERSONAS, TIEMPOS, conjugar, obtener_lexico
+
+NO_PERSONALES = ("infinitivo", "gerundio", "participio")
+ORDEN_TIEMPOS = TIEMPOS + NO_PERSONALES
+NUMEROS = {"s": "singular", "p": "plural"}
+
+# Verbos regulares cuyos paradigmas dan todas las terminaciones, con sus variantes ortográficas
+# (leyó, construyó, gruñó...). La raíz de cada uno es el infinitivo sin -ar/-er/-ir.
+PROTOTIPOS = ("hablar", "comer", "vivir", "leer", "creer", "construir", "gruñir", "tañer")
+
+# Formas que no ocupan ninguna casilla de los paradigmas
+FORMAS_SUELTAS = {
+    "hay": ("haber", "presente", "3s"),     # impersonal
+}
+
+# Clave del trie bajo la que cada nodo guarda las terminaciones que acaban en él
+FIN = ""
+
+
+@dataclass(frozen=True)
+class Analisis:
+    infinitivo: str
+    persona: Optional[int]     # 1, 2 o 3; None en las formas no personales
+    numero: Optional[str]      # «singular» o «plural»; None en las formas no personales
+    tiempo: str                # uno de conjugador_es.TIEMPOS, o infinitivo/gerundio/participio
+
+    @property
+    def persona_numero(self) -> Optional[str]:
+        """La persona y el número en el formato de DatosClause (ej: «1s»)."""
+        if self.persona is None:
+            return None
+        return f"{self.persona}{self.numero[0]}"
+
+
+def _analisis(infinitivo: str, tiempo: str, persona_numero: Optional[str]) -> Analisis:
+    if persona_numero is None:
+        return Analisis(infinitivo, None, None, tiempo)
+    return Analisis(infinitivo, int(persona_numero[0]), NUMEROS[persona_numero[1]], tiempo)
+
+
+class Analizador:
+    """Diccionario de formas irregulares más trie de terminaciones (ver el docstring del módulo)."""
+
+    def __init__(self) -> None:
+        self.lexico = obtener_lexico()
+        self.irregulares: Dict[str, List[Analisis]] = {}
+        self.trie: dict = {}
+        for infinitivo, modelo in self.lexico.items():
+            if modelo and MODELOS[modelo].raices_irregulares:
+                for forma, tiempo, persona_numero in conjugar(infinitivo, modelo).formas():
+                    self.irregulares.setdefault(forma, []).append(_analisis(infinitivo, tiempo, persona_numero))
+        for forma, (infinitivo, tiempo, persona_numero) in FORMAS_SUELTAS.items():
+            self.irregulares.setdefault(forma, []).append(_analisis(infinitivo, tiempo, persona_numero))
+        for prototipo in PROTOTIPOS:
+            clase, raiz = prototipo[-2:], prototipo[:-2]
+            for forma, tiempo, persona_numero in conjugar(prototipo, "").formas():
+                self._agregar(forma[len(raiz):], (clase, tiempo, persona_numero))
+
+    def _agregar(self, terminacion: str, entrada: Tuple[str, str, Optional[str]]) -> None:
+        nodo = self.trie
+        for letra in reversed(terminacion):
+            nodo = nodo.setdefault(letra, {})
+        entradas = nodo.setdefault(FIN, [])
+        if entrada not in entradas:
+            entradas.append(entrada)
+
+    def candidatos(self, forma: str, lema: str = "") -> Set[Analisis]:
+        """
+        Análisis exactos de «forma», sin ordenar. Si alguno es de un verbo del léxico o de
+        «lema», los infinitivos desconocidos no se llegan a confirmar.
+        """
+        encontrados = set(self.irregulares.get(forma, ()))
+        desconocidos = []
+        nodo = self.trie
+        for i in range(len(forma), -1, -1):
+            for clase, tiempo, persona_numero in nodo.get(FIN, ()):
+                for raiz in _raices_posibles(forma[:i], clase):
+                    infinitivo = raiz + clase
+                    if infinitivo not in self.lexico and infinitivo != lema:
+                        desconocidos.append((infinitivo, tiempo, persona_numero))
+                    elif self._confirmar(infinitivo, forma, tiempo, persona_numero):
+                        encontrados.add(_analisis(infinitivo, tiempo, persona_numero))
+            if i == 0:
+                break
+            nodo = nodo.get(forma[i - 1])
+            if nodo is None:
+                break
+        if not encontrados:
+            encontrados.update(_analisis(infinitivo, tiempo, persona_numero)
+                               for infinitivo, tiempo, persona_numero in desconocidos
+                               if self._confirmar(infinitivo, forma, tiempo, persona_numero))
+        return encontrados
+
+    def _confirmar(self, infinitivo: str, forma: str, tiempo: str, persona_numero: Optional[str]) -> bool:
+        modelo = self.lexico.get(infinitivo, "")
+        # Las formas de los verbos con raíces irregulares ya están todas en el diccionario
+        if modelo and MODELOS[modelo].raices_irregulares:
+            return False
+        try:
+            return conjugar(infinitivo, modelo).forma(tiempo, persona_numero) == forma
+        except ValueError:
+            return False
+
+
+def _raices_posibles(raiz: str, clase: str) -> Set[str]:
+    """Raíces del infinitivo que pueden haber dado «raiz» tras los cambios regulares."""
+    if not raiz:
+        return set()
+    ortograficas = {raiz}
+    if clase == "ar":
+        for final, original in (("qu", "c"), ("gü", "gu"), ("gu", "g"), ("c", "z")):
+            if raiz.endswith(final):
+                ortograficas.add(raiz[:-len(final)] + original)
+    else:
+        for final, original in (("zc", "c"), ("z", "c"), ("j", "g"), ("g", "gu"), ("c", "qu"), ("y", "")):
+            if raiz.endswith(final):
+                ortograficas.add(raiz[:-len(final)] + original)
+    raices = set()
+    for base in ortograficas:
+        raices.add(base)
+        if base.startswith("hue"):
+            raices.add("o" + base[3:])          # huelo → oler
+        if base.startswith("ye"):
+            raices.add("e" + base[2:])          # yerro → errar
+        for cambiado, original in (("ie", "e"), ("ie", "i"), ("ue", "o"), ("ue", "u"), ("i", "e"), ("u", "o"), ("í", "i"), ("ú", "u")):
+            posicion = base.rfind(cambiado)
+            if posicion != -1:
+                raices.add(base[:posicion] + original + base[posicion + len(cambiado):])
+    return raices
+
+
+ANALIZADOR: Optional[Analizador] = None
+
+
+def obtener_analizador() -> Analizador:
+    global ANALIZADOR
+    if ANALIZADOR is None:
+        ANALIZADOR = Analizador()
+    return ANALIZADOR
+
+
+def analisis_posibles(forma: str, lema: str = "") -> List[Analisis]:
+    """
+    Análisis exactos de «forma», del más al menos probable: primero los de verbos del léxico,
+    luego los del infinitivo «lema» (el que propone spaCy, que desempata ej: fue → ser/ir) y,
+    por último, los de los tiempos más frecuentes (en el orden de conjugador_es.TIEMPOS).
+    Los verbos que no están en el léxico, salvo «lema», solo se consideran si la forma no
+    corresponde a ninguno que lo esté.
+    """
+    forma = forma.strip().lower()
+    lema = lema.strip().lower()
+    analizador = obtener_analizador()
+    clases = ("ar", "er", "ir")
+    return sorted(analizador.candidatos(forma, lema), key=lambda a: (
+        a.infinitivo not in analizador.lexico,
+        a.infinitivo != lema,
+        ORDEN_TIEMPOS.index(a.tiempo),
+        clases.index(a.infinitivo[-2:].replace("í", "i")),
+        PERSONAS.index(a.persona_numero) if a.persona_numero else 0,
+        a.infinitivo,
+    ))
+
+
+def analizar(forma: str, lema: str = "") -> Optional[Analisis]:
+    """El análisis más probable de «forma» (ver analisis_posibles), o None si no es una forma verbal conocida."""
+    posibles = analisis_posibles(forma, lema)
+    return posibles[0] if posibles else None
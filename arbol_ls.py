@@ -0,0 +1,353 @@
+# -*- coding: utf-8 -*-
+"""
+Árbol de la estructura lógica (EL) de la Gramática de Rol y Referencia.
+
+ls.py arma las estructuras lógicas con estos nodos en vez de concatenar texto, de modo
+que una misma estructura se puede mostrar en la terminal (ANSI), como texto plano,
+en LaTeX o en JSON, y traducir sus constantes sin volver a analizar la cadena.
+
+    >>> el = causa(predicado("do", "Ana", "Ø"), modificador("BECOME", predicado("roto", "el vaso")))
+    >>> str(el)
+    "[do' (Ana, Ø)] CAUSE [BECOME roto' (el vaso)]"
+"""
+import json
+import typing
+
+AUSENTE = "Ø"
+
+
+class Nodo:
+    __slots__ = ()
+
+    def hijos(self) -> typing.Tuple["Nodo", ...]:
+        return ()
+
+    def campos(self) -> tuple:
+        return tuple(getattr(self, nombre) for nombre in self.__slots__)
+
+    def __eq__(self, otro):
+        return type(self) is type(otro) and self.campos() == otro.campos()
+
+    def __hash__(self):
+        return hash((type(self).__name__,) + self.campos())
+
+    def __str__(self):
+        return TEXTO.renderizar(self)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({', '.join(repr(campo) for campo in self.campos())})"
+
+
+class Argumento(Nodo):
+    """Argumento de un predicado tal como lo escribió el usuario (ej: «Ana», «Ø»)."""
+    __slots__ = ("valor",)
+
+    def __init__(self, valor: str):
+        self.valor = valor
+
+
+class Predicado(Nodo):
+    """Constante con prima y sus argumentos: «correr' (Ana)». Un predicado usado como argumento va entre corchetes."""
+    __slots__ = ("constante", "argumentos")
+
+    def __init__(self, constante: str, argumentos: typing.Sequence[Nodo] = ()):
+        self.constante = constante
+        self.argumentos = tuple(argumentos)
+
+    def hijos(self):
+        return self.argumentos
+
+
+class Modificador(Nodo):
+    """Operador prefijo sobre una estructura: INGR, BECOME, PROC, SEML, FIN, NOT."""
+    __slots__ = ("operador", "cuerpo")
+
+    def __init__(self, operador: str, cuerpo: Nodo):
+        self.operador = operador
+        self.cuerpo = cuerpo
+
+    def hijos(self):
+        return (self.cuerpo,)
+
+
+class Intencional(Nodo):
+    """Capa de intencionalidad: «DO (...)»."""
+    __slots__ = ("cuerpo",)
+
+    def __init__(self, cuerpo: Nodo):
+        self.cuerpo = cuerpo
+
+    def hijos(self):
+        return (self.cuerpo,)
+
+
+class Conexion(Nodo):
+    """
+    Conexión n-aria. CAUSE y PURP encierran sus operandos entre corchetes; ∧ no.
+    Un operando izquierdo que ya es una conexión con corchetes no se vuelve a encerrar,
+    de modo que «[a] CAUSE [b] PURP [c]» se lee de izquierda a derecha.
+    """
+    __slots__ = ("conector", "operandos")
+
+    CON_CORCHETES = ("CAUSE", "PURP")
+
+    def __init__(self, conector: str, operandos: typing.Sequence[Nodo]):
+        self.conector = conector
+        self.operandos = tuple(operandos)
+
+    def hijos(self):
+        return self.operandos
+
+
+class Macrorol(Nodo):
+    """Etiqueta de macrorrol tras la estructura: «[MR0]», «[MR1]»."""
+    __slots__ = ("cuerpo", "etiqueta")
+
+    def __init__(self, cuerpo: Nodo, etiqueta: str):
+        self.cuerpo = cuerpo
+        self.etiqueta = etiqueta
+
+    def hijos(self):
+        return (self.cuerpo,)
+
+
+class CapaOperador(Nodo):
+    """Operador de la proyección de operadores: «<TNS PAST [...]>». El valor es opcional."""
+    __slots__ = ("codigo", "valor", "cuerpo")
+
+    def __init__(self, codigo: str, valor: typing.Optional[str], cuerpo: Nodo):
+        self.codigo = codigo
+        self.valor = valor
+        self.cuerpo = cuerpo
+
+    def hijos(self):
+        return (self.cuerpo,)
+
+
+# --- Constructores ---
+
+def _nodo(valor: typing.Union[Nodo, str]) -> Nodo:
+    return valor if isinstance(valor, Nodo) else Argumento(valor)
+
+
+def predicado(constante: str, *argumentos: typing.Union[Nodo, str]) -> Predicado:
+    return Predicado(constante, [_nodo(argumento) for argumento in argumentos])
+
+
+def modificador(operador: str, cuerpo: Nodo) -> Nodo:
+    """Antepone «operador» a «cuerpo»; sin operador (ej: aktionsart sin modificador) devuelve el cuerpo."""
+    return Modificador(operador, cuerpo) if operador else cuerpo
+
+
+def causa(*operandos: Nodo) -> Conexion:
+    return Conexion("CAUSE", operandos)
+
+
+def proposito(*operandos: Nodo) -> Conexion:
+    return Conexion("PURP", operandos)
+
+
+def conjuncion(*operandos: Nodo) -> Conexion:
+    return Conexion("∧", operandos)
+
+
+def intencional(cuerpo: Nodo) -> Intencional:
+    return Intencional(cuerpo)
+
+
+def macrorol(cuerpo: Nodo, etiqueta: str) -> Macrorol:
+    return Macrorol(cuerpo, etiqueta)
+
+
+def con_operadores(cuerpo: Nodo, operadores_con_valores: typing.Sequence[typing.Tuple[str, typing.Optional[str]]]) -> Nodo:
+    """Envuelve «cuerpo» en capas de operadores; el primero de la lista queda por fuera."""
+    for codigo, valor in reversed(operadores_con_valores):
+        cuerpo = CapaOperador(codigo, valor, cuerpo)
+    return cuerpo
+
+
+# --- Recorridos ---
+
+def constantes(nodo: Nodo) -> typing.List[str]:
+    """Constantes de la estructura, en orden de aparición."""
+    encontradas = []
+    pendientes = [nodo]
+    while pendientes:
+        actual = pendientes.pop()
+        if isinstance(actual, Predicado):
+            encontradas.append(actual.constante)
+        pendientes.extend(reversed(actual.hijos()))
+    return encontradas
+
+
+def reemplazar_constantes(nodo: Nodo, reemplazos: typing.Mapping[str, str]) -> Nodo:
+    """Devuelve una copia de la estructura con las constantes reemplazadas (ej: traducidas)."""
+    if isinstance(nodo, Predicado):
+        return Predicado(reemplazos.get(nodo.constante, nodo.constante),
+                         [reemplazar_constantes(argumento, reemplazos) for argumento in nodo.argumentos])
+    if isinstance(nodo, Modificador):
+        return Modificador(nodo.operador, reemplazar_constantes(nodo.cuerpo, reemplazos))
+    if isinstance(nodo, Intencional):
+        return Intencional(reemplazar_constantes(nodo.cuerpo, reemplazos))
+    if isinstance(nodo, Conexion):
+        return Conexion(nodo.conector, [reemplazar_constantes(operando, reemplazos) for operando in nodo.operandos])
+    if isinstance(nodo, Macrorol):
+        return Macrorol(reemplazar_constantes(nodo.cuerpo, reemplazos), nodo.etiqueta)
+    if isinstance(nodo, CapaOperador):
+        return CapaOperador(nodo.codigo, nodo.valor, reemplazar_constantes(nodo.cuerpo, reemplazos))
+    return nodo
+
+
+# --- Renderizadores ---
+
+class Renderizador:
+    """Texto plano. Las subclases cambian solo el formato de las piezas, no la estructura."""
+
+    def renderizar(self, nodo: Nodo) -> str:
+        if isinstance(nodo, Argumento):
+            return self.argumento(nodo.valor)
+        if isinstance(nodo, Predicado):
+            texto = self.constante(nodo.constante)
+            if nodo.argumentos:
+                texto += " (" + ", ".join(self._argumento_de_predicado(argumento) for argumento in nodo.argumentos) + ")"
+            return texto
+        if isinstance(nodo, Modificador):
+            return f"{self.operador(nodo.operador)} {self.renderizar(nodo.cuerpo)}"
+        if isinstance(nodo, Intencional):
+            return f"{self.operador('DO')} ({self.renderizar(nodo.cuerpo)})"
+        if isinstance(nodo, Conexion):
+            return self._conexion(nodo)
+        if isinstance(nodo, Macrorol):
+            return f"{self.renderizar(nodo.cuerpo)} [{nodo.etiqueta}]"
+        if isinstance(nodo, CapaOperador):
+            interior = self.renderizar(nodo.cuerpo)
+            if not isinstance(nodo.cuerpo, CapaOperador):
+                interior = f"[{interior}]"
+            valor = f" {self.valor_operador(nodo.valor)}" if nodo.valor is not None else ""
+            return f"{self.apertura()}{self.codigo_operador(nodo.codigo)}{valor} {interior}{self.cierre()}"
+        raise TypeError(f"Nodo desconocido: {nodo!r}")
+
+    def _argumento_de_predicado(self, argumento: Nodo) -> str:
+        texto = self.renderizar(argumento)
+        return texto if isinstance(argumento, Argumento) else f"[{texto}]"
+
+    def _conexion(self, nodo: Conexion) -> str:
+        conector = f" {self.conector(nodo.conector)} "
+        if nodo.conector not in Conexion.CON_CORCHETES:
+            return conector.join(self.renderizar(operando) for operando in nodo.operandos)
+        partes = []
+        for posicion, operando in enumerate(nodo.operandos):
+            texto = self.renderizar(operando)
+            encadenada = posicion == 0 and isinstance(operando, Conexion) and operando.conector in Conexion.CON_CORCHETES
+            partes.append(texto if encadenada else f"[{texto}]")
+        return conector.join(partes)
+
+    # Piezas
+    def argumento(self, valor: str) -> str:
+        return valor
+
+    def constante(self, nombre: str) -> str:
+        return f"{nombre}'"
+
+    def operador(self, nombre: str) -> str:
+        return nombre
+
+    def conector(self, nombre: str) -> str:
+        return nombre
+
+    def codigo_operador(self, codigo: str) -> str:
+        return codigo
+
+    def valor_operador(self, valor: str) -> str:
+        return valor
+
+    def apertura(self) -> str:
+        return "<"
+
+    def cierre(self) -> str:
+        return ">"
+
+
+class RenderizadorANSI(Renderizador):
+    """Terminal: constantes en negrita, categorías de operador atenuadas y valores en itálica."""
+    NEGRITA = "\033[1m"
+    ITALICA = "\033[3m"
+    ATENUADO = "\033[2m"
+    RESET = "\033[0m"
+
+    def constante(self, nombre: str) -> str:
+        return f"{self.NEGRITA}{nombre}'{self.RESET}"
+
+    def codigo_operador(self, codigo: str) -> str:
+        return f"{self.ATENUADO}{codigo}{self.RESET}"
+
+    def valor_operador(self, valor: str) -> str:
+        return f"{self.ITALICA}{valor}{self.RESET}"
+
+
+class RenderizadorLaTeX(Renderizador):
+    """LaTeX: constantes en negrita con prima y operadores en versalitas, como en la bibliografía de RRG."""
+    ESPECIALES = {"\\": r"\textbackslash{}", "&": r"\&", "%": r"\%", "$": r"\$", "#": r"\#",
+                  "_": r"\_", "{": r"\{", "}": r"\}", "~": r"\textasciitilde{}", "^": r"\textasciicircum{}"}
+
+    def _escapar(self, texto: str) -> str:
+        return "".join(self.ESPECIALES.get(caracter, caracter) for caracter in texto)
+
+    def argumento(self, valor: str) -> str:
+        return r"$\varnothing$" if valor == AUSENTE else self._escapar(valor)
+
+    def constante(self, nombre: str) -> str:
+        return rf"\textbf{{{self._escapar(nombre)}}}$'$"
+
+    def operador(self, nombre: str) -> str:
+        return rf"\textsc{{{nombre.lower()}}}"
+
+    def conector(self, nombre: str) -> str:
+        return r"$\wedge$" if nombre == "∧" else rf"\textsc{{{nombre.lower()}}}"
+
+    def codigo_operador(self, codigo: str) -> str:
+        return rf"\textsc{{{codigo.lower()}}}"
+
+    def valor_operador(self, valor: str) -> str:
+        return rf"\textit{{{self._escapar(valor.lower())}}}"
+
+    def apertura(self) -> str:
+        return r"$\langle$"
+
+    def cierre(self) -> str:
+        return r"$\rangle$"
+
+
+TEXTO = Renderizador()
+ANSI = RenderizadorANSI()
+LATEX = RenderizadorLaTeX()
+
+
+def a_dict(nodo: Nodo) -> dict:
+    datos = {"tipo": type(nodo).__name__.lower()}
+    for nombre in nodo.__slots__:
+        valor = getattr(nodo, nombre)
+        if isinstance(valor, Nodo):
+            valor = a_dict(valor)
+        elif isinstance(valor, tuple):
+            valor = [a_dict(elemento) for elemento in valor]
+        datos[nombre] = valor
+    return datos
+
+
+def a_json(nodo: Nodo, **opciones) -> str:
+    return json.dumps(a_dict(nodo), ensure_ascii=False, **opciones)
+
+
+FORMATOS = {
+    "texto": TEXTO.renderizar,
+    "ansi": ANSI.renderizar,
+    "latex": LATEX.renderizar,
+    "json": a_json,
+}
+
+
+def renderizar(nodo: Nodo, formato: str = "texto") -> str:
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato desconocido «{formato}». Opciones: {', '.join(FORMATOS)}.")
+    return FORMATOS[formato](nodo)
@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+"""
+Backends de traducción para traducir_constantes (ls.py).
+
+Cada consulta tiene un tiempo límite y pasa por un cortacircuitos: tras varios
+fallos seguidos el backend deja de consultarse durante un periodo de enfriamiento,
+de modo que sin conexión la estructura lógica cae al español de inmediato en vez
+de esperar la excepción de cada constante.
+
+Configuración por variables de entorno:
+    VENDLER_TRADUCTOR             «google» (por defecto), «ninguno» o la URL de un
+                                  servidor compatible (ej: http://127.0.0.1:8765,
+                                  ver servidor_traduccion.py)
+    VENDLER_TIMEOUT_TRADUCCION    segundos por consulta (por defecto: 3)
+    VENDLER_ENFRIAMIENTO          segundos con el circuito abierto (por defecto: 60)
+"""
+import json
+import logging
+import os
+import threading
+import time
+import urllib.parse
+import urllib.request
+from typing import Callable, Optional
+
+TIEMPO_LIMITE_POR_DEFECTO = 3.0
+UMBRAL_FALLOS_POR_DEFECTO = 2
+ENFRIAMIENTO_POR_DEFECTO = 60.0
+
+
+class ErrorTraduccion(Exception):
+    pass
+
+
+class TiempoAgotado(ErrorTraduccion):
+    pass
+
+
+class CircuitoAbierto(ErrorTraduccion):
+    pass
+
+
+class BackendTraduccion:
+    nombre = "base"
+
+    def traducir(self, texto: str) -> str:
+        raise NotImplementedError
+
+
+class BackendGoogle(BackendTraduccion):
+    nombre = "google"
+
+    def __init__(self, origen: str = "es", destino: str = "en"):
+        self.origen = origen
+        self.destino = destino
+        self._traductor = None
+
+    def traducir(self, texto: str) -> str:
+        if self._traductor is None:
+            from deep_translator import GoogleTranslator
+            self._traductor = GoogleTranslator(source=self.origen, target=self.destino)
+        return self._traductor.translate(texto)
+
+
+class BackendHTTP(BackendTraduccion):
+    """Cliente para un servidor que responde GET /traducir?q=... con {"traduccion": ...}."""
+    nombre = "http"
+
+    def __init__(self, url: str, origen: str = "es", destino: str = "en", tiempo_limite: float = TIEMPO_LIMITE_POR_DEFECTO):
+        self.url = url.rstrip("/")
+        self.origen = origen
+        self.destino = destino
+        self.tiempo_limite = tiempo_limite
+
+    def traducir(self, texto: str) -> str:
+        consulta = urllib.parse.urlencode({"q": texto, "origen": self.origen, "destino": self.destino})
+        with urllib.request.urlopen(f"{self.url}/traducir?{consulta}", timeout=self.tiempo_limite) as respuesta:
+            return json.load(respuesta)["traduccion"]
+
+
+class BackendNulo(BackendTraduccion):
+    """Desactiva la traducción en línea: las constantes sin glosario ni caché quedan en español."""
+    nombre = "ninguno"
+
+    def traducir(self, texto: str) -> str:
+        raise ErrorTraduccion("La traducción en línea está desactivada.")
+
+
+class CortaCircuitos:
+    def __init__(self, umbral_fallos: int = UMBRAL_FALLOS_POR_DEFECTO, enfriamiento: float = ENFRIAMIENTO_POR_DEFECTO,
+                 reloj: Callable[[], float] = time.monotonic):
+        self.umbral_fallos = umbral_fallos
+        self.enfriamiento = enfriamiento
+        self._reloj = reloj
+        self._fallos = 0
+        self._abierto_desde: Optional[float] = None
+        # Semiabierto: ya salió la única consulta de prueba y aún no se sabe su resultado
+        self._prueba_en_curso = False
+        self._candado = threading.Lock()
+
+    def _estado(self) -> str:
+        if self._abierto_desde is None:
+            return "cerrado"
+        if self._reloj() - self._abierto_desde >= self.enfriamiento:
+            return "semiabierto"
+        return "abierto"
+
+    @property
+    def estado(self) -> str:
+        with self._candado:
+            return self._estado()
+
+    def permite(self) -> bool:
+        # Cerrado: todo pasa. Semiabierto: pasa una sola consulta de prueba hasta que se sepa si funcionó.
+        with self._candado:
+            estado = self._estado()
+            if estado == "cerrado":
+                return True
+            if estado == "abierto" or self._prueba_en_curso:
+                return False
+            self._prueba_en_curso = True
+            return True
+
+    def registrar_exito(self) -> None:
+        with self._candado:
+            self._fallos = 0
+            self._abierto_desde = None
+            self._prueba_en_curso = False
+
+    def registrar_fallo(self) -> None:
+        with self._candado:
+            self._fallos += 1
+            if self._prueba_en_curso or self._fallos >= self.umbral_fallos:
+                # La prueba falló: vuelve a abrirse por otro periodo de enfriamiento
+                self._abierto_desde = self._reloj()
+                self._prueba_en_curso = False
+
+
+class TraductorProtegido:
+    """
+    Envuelve un backend con tiempo límite por consulta y cortacircuitos.
+    Expone translate() para ser intercambiable con GoogleTranslator.
+    """
+
+    def __init__(self, backend: BackendTraduccion, tiempo_limite: float = TIEMPO_LIMITE_POR_DEFECTO,
+                 corta_circuitos: Optional[CortaCircuitos] = None):
+        self.backend = backend
+        self.tiempo_limite = tiempo_limite
+        self.corta_circuitos = corta_circuitos or CortaCircuitos()
+
+    def translate(self, texto: str) -> str:
+        if not self.corta_circuitos.permite():
+            raise CircuitoAbierto(f"El backend «{self.backend.nombre}» está suspendido tras varios fallos.")
+        try:
+            traduccion = self._con_tiempo_limite(texto)
+        except Exception:
+            self.corta_circuitos.registrar_fallo()
+            raise
+        self.corta_circuitos.registrar_exito()
+        return traduccion
+
+    def _con_tiempo_limite(self, texto: str) -> str:
+        resultado = {}
+
+        def consultar():
+            try:
+                resultado["traduccion"] = self.backend.traducir(texto)
+            except Exception as e:
+                resultado["error"] = e
+
+        # Hilo daemon: si el backend se cuelga, no impide que el programa termine
+        hilo = threading.Thread(target=consultar, daemon=True)
+        hilo.start()
+        hilo.join(self.tiempo_limite)
+        if hilo.is_alive():
+            raise TiempoAgotado(f"El backend «{self.backend.nombre}» no respondió en {self.tiempo_limite} s.")
+        if "error" in resultado:
+            raise resultado["error"]
+        return resultado["traduccion"]
+
+
+def _flotante_entorno(variable: str, por_defecto: float) -> float:
+    try:
+        return float(os.environ.get(variable, por_defecto))
+    except ValueError:
+        return por_defecto
+
+
+def crear_backend(especificacion: Optional[str] = None) -> BackendTraduccion:
+    especificacion = especificacion or os.environ.get("VENDLER_TRADUCTOR", "google")
+    if especificacion.startswith(("http://", "https://")):
+        return BackendHTTP(especificacion, tiempo_limite=_flotante_entorno("VENDLER_TIMEOUT_TRADUCCION", TIEMPO_LIMITE_POR_DEFECTO))
+    if especificacion == "ninguno":
+        return BackendNulo()
+    if especificacion != "google":
+        logging.warning(f"Traductor desconocido «{especificacion}»; se usará Google.")
+    return BackendGoogle()
+
+
+def crear_traductor(especificacion: Optional[str] = None) -> TraductorProtegido:
+    return TraductorProtegido(
+        crear_backend(especificacion),
+        tiempo_limite=_flotante_entorno("VENDLER_TIMEOUT_TRADUCCION", TIEMPO_LIMITE_POR_DEFECTO),
+        corta_circuitos=CortaCircuitos(enfriamiento=_flotante_entorno("VENDLER_ENFRIAMIENTO", ENFRIAMIENTO_POR_DEFECTO)),
+    )
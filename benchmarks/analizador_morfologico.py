@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""
+Mide el analizador morfológico (analizador_morfologico.py) sin spaCy:
+
+    • cobertura: todas las formas de todos los verbos del léxico deben recibir su análisis
+      exacto (infinitivo, tiempo, persona), y se informa cuántas lo tienen como el más probable;
+    • exactitud frente a los verbos de benchmarks/datos/oro_es.tsv (infinitivo y persona);
+    • tiempo de compilación y rendimiento (formas por segundo).
+
+Uso: python benchmarks/analizador_morfologico.py
+Sale con código 1 si alguna forma del léxico queda sin su análisis exacto.
+"""
+import os
+import sys
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from analizador_morfologico import analisis_posibles, obtener_analizador
+from conjugador_es import conjugar, obtener_lexico
+
+ORO = os.path.join(RAIZ, "benchmarks", "datos", "oro_es.tsv")
+
+
+def main() -> None:
+    inicio = time.perf_counter()
+    obtener_analizador()
+    compilacion = time.perf_counter() - inicio
+
+    formas = [(forma, infinitivo, tiempo, persona_numero)
+              for infinitivo in obtener_lexico()
+              for forma, tiempo, persona_numero in conjugar(infinitivo).formas()]
+    sin_analisis = []
+    primeros = 0
+    inicio = time.perf_counter()
+    for forma, infinitivo, tiempo, persona_numero in formas:
+        posibles = analisis_posibles(forma)
+        if not any((a.infinitivo, a.tiempo, a.persona_numero) == (infinitivo, tiempo, persona_numero) for a in posibles):
+            sin_analisis.append((forma, infinitivo, tiempo, persona_numero))
+        primeros += bool(posibles) and posibles[0].infinitivo == infinitivo
+    duracion = time.perf_counter() - inicio
+
+    aciertos = total = 0
+    with open(ORO, encoding="utf-8") as archivo:
+        for linea in archivo:
+            if not linea.strip() or linea.startswith("#"):
+                continue
+            _, verbo, infinitivo, persona_numero = linea.rstrip("\n").split("\t")
+            posibles = analisis_posibles(verbo)
+            total += 1
+            aciertos += bool(posibles) and posibles[0].infinitivo == infinitivo and persona_numero in {
+                a.persona_numero for a in posibles if a.infinitivo == infinitivo}
+
+    print(f"Verbos del léxico:        {len(obtener_lexico())}")
+    print(f"Compilación:              {compilacion * 1000:.0f} ms ({len(obtener_analizador().irregulares)} formas irregulares)")
+    print(f"Formas analizadas:        {len(formas)} en {duracion:.2f} s ({len(formas) / duracion:,.0f} formas/s)")
+    print(f"Con su análisis exacto:   {len(formas) - len(sin_analisis)} ({100 * (1 - len(sin_analisis) / len(formas)):.2f} %)")
+    print(f"Infinitivo más probable:  {100 * primeros / len(formas):.2f} %")
+    print(f"Referencia (oro_es.tsv):  {aciertos}/{total}")
+    if sin_analisis:
+        print("\nSin análisis exacto:")
+        for forma, infinitivo, tiempo, persona_numero in sin_analisis[:20]:
+            print(f"  {forma}: {infinitivo}, {tiempo}, {persona_numero or '-'}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""
+Compara tres formas de clasificar vectores de rasgos guardados: las reglas originales
+(cadena de if/elif con creación de enumeraciones por nombre) y la consulta a la tabla de
+32 entradas, ambas sobre RasgosPred ya creados, y la clasificación vectorizada con NumPy
+directamente sobre la matriz de rasgos.
+
+Uso: python benchmarks/clasificacion_lote.py [--vectores 1000000] [--semilla 0]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from aktionsart import AKTIONSARTS, RasgosPred, _aktionsart_por_reglas, clasificar_lote, determinar_aktionsart
+
+
+def medir(nombre: str, funcion, n: int) -> float:
+    inicio = time.perf_counter()
+    funcion()
+    segundos = time.perf_counter() - inicio
+    print(f"{nombre:<22} {segundos:>9.3f} s {n / segundos / 1e6:>10.2f} M vectores/s")
+    return segundos
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--vectores", type=int, default=1_000_000)
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args()
+
+    rasgos = np.random.default_rng(args.semilla).integers(0, 2, size=(args.vectores, 5)).astype(bool)
+    objetos = [RasgosPred(*fila) for fila in rasgos.tolist()]
+    resultados = {}
+
+    print(f"{'método':<22} {'tiempo':>11} {'rendimiento':>21}")
+    base = medir("reglas", lambda: resultados.__setitem__(
+        "reglas", [_aktionsart_por_reglas(pred) for pred in objetos]), args.vectores)
+    tabla = medir("tabla", lambda: resultados.__setitem__(
+        "tabla", [determinar_aktionsart(pred) for pred in objetos]), args.vectores)
+    lote = medir("numpy (clasificar_lote)", lambda: resultados.__setitem__(
+        "numpy", clasificar_lote(rasgos)), args.vectores)
+
+    assert resultados["tabla"] == resultados["reglas"]
+    assert [AKTIONSARTS[codigo] for codigo in resultados["numpy"].tolist()] == resultados["reglas"]
+    print(f"\nAceleración frente a las reglas: tabla x{base / tabla:.1f}, numpy x{base / lote:.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""
+Mide el rendimiento de los conjugadores (conjugador_es.py y conjugator_en.py) sobre sus
+léxicos completos:
+
+    • en frío: con la caché de paradigmas vacía, cada verbo se conjuga desde sus tablas;
+    • en caliente: las pasadas siguientes, que solo consultan la caché.
+
+Informa paradigmas y formas por segundo y el estado de cada caché. Con --sin-cache se
+vacía la caché antes de cada pasada, para medir solo la generación.
+
+Uso: python benchmarks/conjugacion.py [--pasadas 5] [--sin-cache]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import conjugador_es
+import conjugator_en
+
+
+def medir(verbos, conjugar) -> tuple:
+    inicio = time.perf_counter()
+    paradigmas = [conjugar(verbo) for verbo in verbos]
+    return time.perf_counter() - inicio, paradigmas
+
+
+def contar_formas(paradigma) -> int:
+    formas = paradigma.formas() if hasattr(paradigma, "formas") else paradigma.forms()
+    return sum(1 for _ in formas)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pasadas", type=int, default=5, help="pasadas en caliente sobre el léxico")
+    parser.add_argument("--sin-cache", action="store_true", help="vacía la caché antes de cada pasada")
+    args = parser.parse_args()
+
+    idiomas = (
+        ("español", conjugador_es.obtener_lexico(), conjugador_es.conjugar,
+         conjugador_es.vaciar_cache, conjugador_es.info_cache, conjugador_es.TAMANO_CACHE),
+        ("inglés", conjugator_en.get_lexicon(), conjugator_en.conjugate,
+         conjugator_en.clear_cache, conjugator_en.cache_info, conjugator_en.CACHE_SIZE),
+    )
+    print(f"{'léxico':<9} {'verbos':>7} {'pasada':<9} {'tiempo':>10} {'paradigmas/s':>14} {'formas/s':>12}")
+    for nombre, lexico, conjugar, vaciar, info, tamano in idiomas:
+        verbos = list(lexico)
+        vaciar()
+        for pasada in range(args.pasadas + 1):
+            if args.sin_cache:
+                vaciar()
+            segundos, paradigmas = medir(verbos, conjugar)
+            formas = sum(map(contar_formas, paradigmas))
+            etiqueta = "fría" if pasada == 0 or args.sin_cache else "caliente"
+            print(f"{nombre:<9} {len(verbos):>7} {etiqueta:<9} {segundos * 1000:>8.1f}ms "
+                  f"{len(verbos) / segundos:>14,.0f} {formas / segundos:>12,.0f}")
+        estado = info()
+        print(f"{'':<9} caché: {estado.hits} aciertos, {estado.misses} fallos, {estado.currsize}/{tamano} paradigmas\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+Mide la latencia de traducir_estructura contra el servidor local de traducción
+en tres escenarios: servicio sano, servicio lento (más que el tiempo límite) y
+servicio caído. No requiere conexión a internet.
+
+Uso: python benchmarks/latencia_traduccion.py [--estructuras 20] [--tiempo-limite 0.5]
+"""
+import argparse
+import os
+import socket
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import backends_traduccion  # noqa: E402
+import ls  # noqa: E402
+from arbol_ls import causa, conjuncion, modificador, predicado  # noqa: E402
+from cache_traduccion import CacheTraduccion  # noqa: E402
+from servidor_traduccion import iniciar_servidor  # noqa: E402
+
+
+def puerto_libre() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def estructuras(cantidad: int):
+    # Constantes fuera del glosario para forzar la consulta al backend
+    return [conjuncion(causa(predicado("do", "x", "Ø"), modificador("BECOME", predicado(f"pintarrajeado{i}", "y"))),
+                       predicado(f"garabatear{i}", "x"))
+            for i in range(cantidad)]
+
+
+def medir(nombre: str, url: str, cantidad: int, tiempo_limite: float) -> None:
+    ls.CACHE_TRADUCCION = CacheTraduccion(":memory:")
+    ls._traductor = backends_traduccion.TraductorProtegido(
+        backends_traduccion.BackendHTTP(url, tiempo_limite=tiempo_limite),
+        tiempo_limite=tiempo_limite,
+        corta_circuitos=backends_traduccion.CortaCircuitos(enfriamiento=60.0),
+    )
+    tiempos = []
+    for estructura in estructuras(cantidad):
+        inicio = time.perf_counter()
+        ls.traducir_estructura(estructura)
+        tiempos.append(time.perf_counter() - inicio)
+    tiempos.sort()
+    print(f"{nombre:<10} total {sum(tiempos):7.3f} s | mediana {tiempos[len(tiempos) // 2] * 1000:8.1f} ms"
+          f" | máx {tiempos[-1] * 1000:8.1f} ms | circuito: {ls._traductor.corta_circuitos.estado}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--estructuras", type=int, default=20)
+    parser.add_argument("--tiempo-limite", type=float, default=0.5)
+    args = parser.parse_args()
+
+    servidor_sano, url_sana = iniciar_servidor(retardo=0.02)
+    servidor_lento, url_lenta = iniciar_servidor(retardo=args.tiempo_limite * 4)
+    url_caida = f"http://127.0.0.1:{puerto_libre()}"
+
+    print(f"{args.estructuras} estructuras lógicas, tiempo límite {args.tiempo_limite} s por consulta\n")
+    medir("sano", url_sana, args.estructuras, args.tiempo_limite)
+    medir("lento", url_lenta, args.estructuras, args.tiempo_limite)
+    medir("caído", url_caida, args.estructuras, args.tiempo_limite)
+
+    servidor_sano.shutdown()
+    servidor_lento.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""
+Compara los tamaños de modelo de spaCy (sm, md, lg) de cada idioma: exactitud del lema
+y de la persona y número que obtiene el análisis automático frente a los datos de
+referencia de benchmarks/datos/, y latencia por cláusula. Para el lema se informa
+tanto el de spaCy como el infinitivo final, tras las heurísticas de corrección.
+Cada modelo se mide en un proceso aparte; los que no están instalados se omiten.
+
+Uso: python benchmarks/niveles_modelos.py [--idioma es|en|ambos] [--repeticiones 5]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import List, Tuple
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+DATOS = os.path.join(RAIZ, "benchmarks", "datos")
+
+
+def leer_referencia(idioma: str) -> List[Tuple[str, str, str, str]]:
+    """Filas (oración, verbo, infinitivo, persona_numero) del archivo de referencia del idioma."""
+    filas = []
+    with open(os.path.join(DATOS, f"oro_{idioma}.tsv"), encoding="utf-8") as archivo:
+        for linea in archivo:
+            if linea.strip() and not linea.startswith("#"):
+                filas.append(tuple(linea.rstrip("\n").split("\t")))
+    return filas
+
+
+def medir_modelo(idioma: str, nombre: str, repeticiones: int) -> dict:
+    from modelos import obtener_modelo
+
+    nlp = obtener_modelo(nombre, "interactivo")
+    if nlp is None:
+        return {"error": "no instalado"}
+    if idioma == "es":
+        from aktionsart import DatosClause as Datos, analizar_doc as analizar
+    else:
+        from english import ClauseData as Datos, analyze_doc as analizar
+
+    referencia = leer_referencia(idioma)
+    nlp(referencia[0][0])  # calentamiento
+    aciertos_lema = aciertos_infinitivo = aciertos_persona = 0
+    latencias = []
+    for oracion, verbo, infinitivo, persona_numero in referencia:
+        for _ in range(repeticiones):
+            datos = Datos()
+            inicio = time.perf_counter()
+            doc = nlp(oracion)
+            analizar(doc, datos)
+            latencias.append(time.perf_counter() - inicio)
+        lema_spacy = next((token.lemma_.lower() for token in doc if token.text.lower() == verbo), "")
+        aciertos_lema += lema_spacy == infinitivo
+        aciertos_infinitivo += (datos.infinitivo if idioma == "es" else datos.infinitive) == infinitivo
+        aciertos_persona += (datos.persona_numero if idioma == "es" else datos.person_number) == persona_numero
+
+    total = len(referencia)
+    return {
+        "version": nlp.meta.get("version", "?"),
+        "lema_spacy": aciertos_lema / total,
+        "infinitivo": aciertos_infinitivo / total,
+        "persona_numero": aciertos_persona / total,
+        "mediana_ms": statistics.median(latencias) * 1000,
+        "clausulas_por_s": len(latencias) / sum(latencias),
+    }
+
+
+def main() -> None:
+    from modelos import NIVELES, PAQUETES
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--idioma", choices=["es", "en", "ambos"], default="ambos")
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--medir", metavar="MODELO", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.medir:
+        print(json.dumps(medir_modelo(args.idioma, args.medir, args.repeticiones)))
+        return
+
+    idiomas = ["es", "en"] if args.idioma == "ambos" else [args.idioma]
+    for idioma in idiomas:
+        print(f"\n{idioma}: {len(leer_referencia(idioma))} cláusulas de referencia")
+        print(f"{'modelo':<18} {'versión':>8} {'lema spaCy':>11} {'infinitivo':>11} {'pers./núm.':>11} {'mediana':>10} {'cláus./s':>9}")
+        for nivel in NIVELES:
+            nombre = PAQUETES[idioma].format(nivel)
+            proceso = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "--medir", nombre,
+                 "--idioma", idioma, "--repeticiones", str(args.repeticiones)],
+                capture_output=True, text=True,
+            )
+            try:
+                resultado = json.loads(proceso.stdout.strip().splitlines()[-1])
+            except (IndexError, ValueError):
+                resultado = {"error": proceso.stderr.strip().splitlines()[-1] if proceso.stderr.strip() else "sin salida"}
+            if "error" in resultado:
+                print(f"{nombre:<18} {resultado['error']}")
+                continue
+            print(f"{nombre:<18} {resultado['version']:>8} {resultado['lema_spacy']:>10.1%} {resultado['infinitivo']:>10.1%}"
+                  f" {resultado['persona_numero']:>10.1%} {resultado['mediana_ms']:>8.2f}ms {resultado['clausulas_por_s']:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""
+Compara los perfiles de tubería de spaCy (ver modelos.PERFILES): latencia por cláusula,
+analizada de a una (modo interactivo) y con nlp.pipe (modo por lotes), y memoria
+residente tras cargar el modelo. Cada perfil se mide en un proceso aparte para que
+la memoria de un modelo no contamine la del siguiente.
+
+Se usa el tamaño de modelo configurado para cada idioma (VENDLER_MODELO_ES/EN).
+
+Uso: python benchmarks/perfiles_pipeline.py [--idioma es|en|ambos] [--repeticiones 20]
+"""
+import argparse
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+CLAUSULAS = {
+    "es": [
+        "Pedro corrió hasta su casa",
+        "María sabe inglés",
+        "Los niños rompieron la ventana",
+        "El hielo se derritió",
+        "Ana le regaló un libro a su hermana",
+        "Juan tosió",
+        "Comimos una manzana",
+        "El sol brilló toda la tarde",
+        "Mis padres llegaron tarde",
+        "A Luis le duele la cabeza",
+        "La profesora explicó la lección a los alumnos",
+        "Nevó en la montaña",
+    ],
+    "en": [
+        "Peter ran home",
+        "Mary knows English",
+        "The children broke the window",
+        "The ice melted",
+        "Anna gave her sister a book",
+        "John coughed",
+        "We ate an apple",
+        "The sun shone all afternoon",
+        "My parents arrived late",
+        "The teacher explained the lesson to the students",
+        "She wrote a letter",
+        "It snowed in the mountains",
+    ],
+}
+
+
+def memoria_residente_mb() -> float:
+    try:
+        with open("/proc/self/status") as estado:
+            for linea in estado:
+                if linea.startswith("VmRSS:"):
+                    return int(linea.split()[1]) / 1024
+    except OSError:
+        pass
+    # Sin /proc: máximo residente del proceso (kB en Linux, bytes en macOS)
+    maximo = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maximo / (1024 * 1024) if sys.platform == "darwin" else maximo / 1024
+
+
+def medir_perfil(idioma: str, perfil: str, repeticiones: int) -> dict:
+    from modelos import PERFILES, obtener_modelo_idioma
+
+    memoria_inicial = memoria_residente_mb()
+    inicio = time.perf_counter()
+    nlp = obtener_modelo_idioma(idioma, perfil)
+    carga = time.perf_counter() - inicio
+    if nlp is None:
+        return {"error": "no hay un modelo de spaCy disponible para este idioma"}
+
+    clausulas = CLAUSULAS[idioma]
+    nlp(clausulas[0])  # calentamiento
+    individuales = []
+    for _ in range(repeticiones):
+        for clausula in clausulas:
+            inicio = time.perf_counter()
+            nlp(clausula)
+            individuales.append(time.perf_counter() - inicio)
+
+    textos = clausulas * repeticiones
+    inicio = time.perf_counter()
+    for _ in nlp.pipe(textos, batch_size=64):
+        pass
+    por_lote = (time.perf_counter() - inicio) / len(textos)
+
+    individuales.sort()
+    return {
+        "componentes": nlp.pipe_names,
+        "excluidos": list(PERFILES[perfil]),
+        "carga_s": carga,
+        "mediana_ms": statistics.median(individuales) * 1000,
+        "p95_ms": individuales[int(len(individuales) * 0.95) - 1] * 1000,
+        "lote_ms": por_lote * 1000,
+        "memoria_mb": memoria_residente_mb() - memoria_inicial,
+    }
+
+
+def main() -> None:
+    from modelos import PERFILES, candidatos_modelo
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--idioma", choices=["es", "en", "ambos"], default="ambos")
+    parser.add_argument("--repeticiones", type=int, default=20)
+    parser.add_argument("--perfiles", nargs="+", choices=sorted(PERFILES), default=list(PERFILES))
+    parser.add_argument("--medir", choices=sorted(PERFILES), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.medir:
+        print(json.dumps(medir_perfil(args.idioma, args.medir, args.repeticiones)))
+        return
+
+    idiomas = ["es", "en"] if args.idioma == "ambos" else [args.idioma]
+    for idioma in idiomas:
+        print(f"\n{candidatos_modelo(idioma)[0]} ({len(CLAUSULAS[idioma])} cláusulas x {args.repeticiones})")
+        print(f"{'perfil':<12} {'carga':>8} {'mediana':>10} {'p95':>10} {'nlp.pipe':>10} {'memoria':>10}  componentes")
+        for perfil in args.perfiles:
+            proceso = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "--medir", perfil,
+                 "--idioma", idioma, "--repeticiones", str(args.repeticiones)],
+                capture_output=True, text=True,
+            )
+            try:
+                resultado = json.loads(proceso.stdout.strip().splitlines()[-1])
+            except (IndexError, ValueError):
+                resultado = {"error": proceso.stderr.strip().splitlines()[-1] if proceso.stderr.strip() else "sin salida"}
+            if "error" in resultado:
+                print(f"{perfil:<12} {resultado['error']}")
+                continue
+            print(f"{perfil:<12} {resultado['carga_s']:7.2f}s {resultado['mediana_ms']:8.2f}ms {resultado['p95_ms']:8.2f}ms"
+                  f" {resultado['lote_ms']:8.2f}ms {resultado['memoria_mb']:8.1f}MB  {', '.join(resultado['componentes'])}")
+
+
+if __name__ == "__main__":
+    main()
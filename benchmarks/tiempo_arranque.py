@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""
+Mide el tiempo de importación de cada punto de entrada (main.py, aktionsart.py, ls.py,
+english.py) con «python -X importtime» y lo compara con la referencia guardada en
+benchmarks/datos/tiempo_arranque.json.
+
+Además del tiempo, la referencia guarda qué módulos pesados (spaCy, el traductor,
+urllib.request, sqlite3...) se importan al arrancar, de modo que una importación
+que deja de ser diferida se detecta aunque el equipo sea más rápido que el de referencia.
+
+Uso: python benchmarks/tiempo_arranque.py [--repeticiones 7] [--tolerancia 0.5] [--guardar]
+Sale con código 1 si algún punto de entrada supera la referencia.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REFERENCIA = os.path.join(RAIZ, "benchmarks", "datos", "tiempo_arranque.json")
+
+ENTRADAS = ("main", "aktionsart", "ls", "english")
+
+# Módulos que ningún punto de entrada debería importar antes de usarlos
+PESADOS = (
+    "spacy", "numpy", "deep_translator", "requests", "urllib.request", "http.client",
+    "ssl", "sqlite3", "argparse", "csv", "subprocess", "readline", "concurrent.futures",
+)
+
+# Margen fijo (ms) que se suma a la tolerancia relativa, para no alarmarse por el ruido en tiempos pequeños
+MARGEN_MS = 5.0
+
+
+def medir_importacion(modulo: str) -> Tuple[float, float, List[str]]:
+    """Devuelve (total en ms, tiempo propio del módulo en ms, módulos importados) de una importación en frío."""
+    proceso = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {modulo}"],
+        cwd=RAIZ, capture_output=True, text=True, check=True,
+    )
+    total = propio = 0.0
+    importados = []
+    for linea in proceso.stderr.splitlines():
+        if not linea.startswith("import time:") or "self [us]" in linea:
+            continue
+        propio_us, acumulado_us, nombre = linea[len("import time:"):].split("|")
+        nombre_limpio = nombre.strip()
+        importados.append(nombre_limpio)
+        if nombre_limpio == modulo and not nombre.startswith("  "):
+            total, propio = int(acumulado_us) / 1000, int(propio_us) / 1000
+    return total, propio, importados
+
+
+def medir_entrada(modulo: str, repeticiones: int) -> Dict[str, object]:
+    medir_importacion(modulo)  # calentamiento: compila los .pyc
+    totales, propios = [], []
+    importados: List[str] = []
+    for _ in range(repeticiones):
+        total, propio, importados = medir_importacion(modulo)
+        totales.append(total)
+        propios.append(propio)
+    return {
+        "total_ms": round(statistics.median(totales), 1),
+        "propio_ms": round(statistics.median(propios), 1),
+        "modulos": len(importados),
+        "pesados": sorted(nombre for nombre in PESADOS if nombre in importados),
+    }
+
+
+def comparar(resultados: Dict[str, dict], referencia: Dict[str, dict], tolerancia: float) -> List[str]:
+    problemas = []
+    for modulo, resultado in resultados.items():
+        base = referencia.get(modulo)
+        if base is None:
+            continue
+        limite = base["total_ms"] * (1 + tolerancia) + MARGEN_MS
+        if resultado["total_ms"] > limite:
+            problemas.append(f"{modulo}: {resultado['total_ms']:.1f} ms supera el límite de {limite:.1f} ms"
+                             f" (referencia: {base['total_ms']:.1f} ms)")
+        nuevos = sorted(set(resultado["pesados"]) - set(base["pesados"]))
+        if nuevos:
+            problemas.append(f"{modulo}: ahora importa al arrancar {', '.join(nuevos)}")
+    return problemas
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeticiones", type=int, default=7)
+    parser.add_argument("--tolerancia", type=float, default=0.5,
+                        help="aumento relativo admitido sobre la referencia (por defecto: 0.5, es decir, 50 %%)")
+    parser.add_argument("--guardar", action="store_true", help="guarda los resultados como nueva referencia")
+    args = parser.parse_args()
+
+    resultados = {modulo: medir_entrada(modulo, args.repeticiones) for modulo in ENTRADAS}
+    referencia = {}
+    if os.path.exists(REFERENCIA):
+        with open(REFERENCIA, encoding="utf-8") as archivo:
+            referencia = json.load(archivo).get("entradas", {})
+
+    print(f"{'entrada':<12} {'total':>10} {'propio':>10} {'referencia':>11} {'módulos':>8}  pesados")
+    for modulo, resultado in resultados.items():
+        base = f"{referencia[modulo]['total_ms']:.1f}ms" if modulo in referencia else "-"
+        print(f"{modulo:<12} {resultado['total_ms']:>8.1f}ms {resultado['propio_ms']:>8.1f}ms {base:>11}"
+              f" {resultado['modulos']:>8}  {', '.join(resultado['pesados']) or '-'}")
+
+    if args.guardar:
+        with open(REFERENCIA, "w", encoding="utf-8") as archivo:
+            json.dump({"python": platform.python_version(), "plataforma": platform.platform(),
+                       "repeticiones": args.repeticiones, "entradas": resultados},
+                      archivo, ensure_ascii=False, indent=2)
+            archivo.write("\n")
+        print(f"\nReferencia guardada en {os.path.relpath(REFERENCIA, RAIZ)}")
+        return
+
+    problemas = comparar(resultados, referencia, args.tolerancia)
+    if problemas:
+        print("\n" + "\n".join(problemas))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""
+Caché LRU en memoria de los análisis automáticos de cláusulas (analizar_automaticamente y
+analyze_automatically).
+
+En una sesión la misma cláusula se analiza varias veces: cuando la limpieza de adjuntos
+la deja igual, cuando se reintenta tras un mensaje de reinicio o cuando una clase analiza
+las mismas oraciones de ejemplo. La clave es el texto normalizado de la cláusula y el
+modelo que la analiza (nombre, versión y componentes cargados, que dependen del perfil);
+el valor, el resultado del análisis y los campos que extrajo, de modo que un acierto no
+vuelve a pasar por spaCy. El número de entradas se configura con VENDLER_CACHE_ANALISIS_MAX
+(0 la desactiva).
+"""
+import os
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Sequence, Tuple
+
+MAX_ENTRADAS_POR_DEFECTO = 256
+
+
+def max_entradas_por_defecto() -> int:
+    try:
+        return int(os.environ.get("VENDLER_CACHE_ANALISIS_MAX", MAX_ENTRADAS_POR_DEFECTO))
+    except ValueError:
+        return MAX_ENTRADAS_POR_DEFECTO
+
+
+def normalizar(oracion: str) -> str:
+    """Texto de la cláusula en forma NFC y con los espacios colapsados."""
+    return " ".join(unicodedata.normalize("NFC", oracion).split())
+
+
+def firma_modelo(nlp: Any) -> Tuple[Hashable, ...]:
+    """Identifica el modelo: paquete, versión y componentes de la tubería (según el perfil)."""
+    meta = getattr(nlp, "meta", None) or {}
+    return (meta.get("lang"), meta.get("name"), meta.get("version"), tuple(getattr(nlp, "pipe_names", ())))
+
+
+class CacheAnalisis:
+    def __init__(self, max_entradas: Optional[int] = None):
+        self.max_entradas = max_entradas if max_entradas is not None else max_entradas_por_defecto()
+        self.aciertos = 0
+        self.fallos = 0
+        self._entradas: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._candado = threading.Lock()
+
+    def obtener(self, clave: Hashable) -> Optional[Any]:
+        with self._candado:
+            valor = self._entradas.get(clave)
+            if valor is None:
+                self.fallos += 1
+                return None
+            self.aciertos += 1
+            self._entradas.move_to_end(clave)
+            return valor
+
+    def guardar(self, clave: Hashable, valor: Any) -> None:
+        if self.max_entradas <= 0:
+            return
+        with self._candado:
+            self._entradas[clave] = valor
+            self._entradas.move_to_end(clave)
+            while len(self._entradas) > self.max_entradas:
+                # Se elimina la entrada usada hace más tiempo (LRU)
+                self._entradas.popitem(last=False)
+
+    def __contains__(self, clave: Hashable) -> bool:
+        with self._candado:
+            return clave in self._entradas
+
+    def __len__(self) -> int:
+        with self._candado:
+            return len(self._entradas)
+
+    def limpiar(self) -> None:
+        with self._candado:
+            self._entradas.clear()
+
+    def estadisticas(self) -> Dict[str, int]:
+        return {
+            "aciertos": self.aciertos,
+            "fallos": self.fallos,
+            "entradas": len(self),
+            "capacidad": self.max_entradas,
+        }
+
+
+CACHE: Optional[CacheAnalisis] = None
+
+
+def obtener_cache() -> CacheAnalisis:
+    global CACHE
+    if CACHE is None:
+        CACHE = CacheAnalisis()
+    return CACHE
+
+
+def analizar_con_cache(nlp: Any, oracion: str, datos: Any, analizar_doc: Callable[[Any, Any], Tuple[bool, str, str]],
+                       campos: Sequence[str]) -> Tuple[bool, str, str]:
+    """
+    Analiza «oracion» con analizar_doc(nlp(...), ...) o, si ya se analizó con el mismo modelo,
+    recupera el resultado de la caché. Si el análisis tuvo éxito, copia en «datos» los «campos»
+    extraídos. Devuelve lo mismo que analizar_doc: (éxito, verbo, infinitivo).
+    """
+    cache = obtener_cache()
+    # El texto normalizado solo forma la clave: se analiza la cláusula tal como se escribió
+    clave = (normalizar(oracion), firma_modelo(nlp))
+    guardado = cache.obtener(clave)
+    if guardado is None:
+        # Se analiza sobre datos nuevos para que lo guardado no dependa de lo que ya traía «datos»
+        extraidos = type(datos)()
+        resultado = analizar_doc(nlp(oracion), extraidos)
+        guardado = (resultado, {campo: getattr(extraidos, campo) for campo in campos})
+        cache.guardar(clave, guardado)
+    resultado, valores = guardado
+    if resultado[0]:
+        for campo, valor in valores.items():
+            setattr(datos, campo, valor)
+    return resultado
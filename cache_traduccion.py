@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+"""
+Caché persistente de traducciones (SQLite) con desalojo LRU y tope de tamaño.
+
+El archivo se comparte entre ejecuciones y sesiones, de modo que una constante
+traducida una vez no vuelve a consultarse en la red. Ubicación y tamaño se pueden
+configurar con las variables de entorno VENDLER_CACHE y VENDLER_CACHE_MAX.
+La fecha de uso de cada acierto se guarda en memoria y se escribe en disco por tandas
+(al guardar una traducción, cada ACCESOS_POR_ESCRITURA aciertos y al cerrar).
+"""
+import atexit
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+MAX_ENTRADAS_POR_DEFECTO = 5000
+# Accesos (aciertos) que se acumulan en memoria antes de escribir su fecha en disco
+ACCESOS_POR_ESCRITURA = 100
+
+
+def ruta_por_defecto() -> str:
+    if os.environ.get("VENDLER_CACHE"):
+        return os.environ["VENDLER_CACHE"]
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "vendler", "traducciones.sqlite3")
+
+
+def max_entradas_por_defecto() -> int:
+    try:
+        return int(os.environ.get("VENDLER_CACHE_MAX", MAX_ENTRADAS_POR_DEFECTO))
+    except ValueError:
+        return MAX_ENTRADAS_POR_DEFECTO
+
+
+class CacheTraduccion:
+    def __init__(self, ruta: Optional[str] = None, max_entradas: Optional[int] = None, par: str = "es-en"):
+        self.ruta = ruta or ruta_por_defecto()
+        self.max_entradas = max_entradas if max_entradas is not None else max_entradas_por_defecto()
+        self.par = par
+        self.aciertos = 0
+        self.fallos = 0
+        # La traducción puede ejecutarse en un hilo secundario
+        self._candado = threading.Lock()
+        # origen -> fecha del último acierto aún no escrita en disco
+        self._accesos: Dict[str, float] = {}
+        self._conexion = self._conectar()
+        atexit.register(self.cerrar)
+
+    def _conectar(self) -> sqlite3.Connection:
+        try:
+            if self.ruta != ":memory:":
+                os.makedirs(os.path.dirname(os.path.abspath(self.ruta)), exist_ok=True)
+            conexion = sqlite3.connect(self.ruta, check_same_thread=False)
+        except (OSError, sqlite3.Error) as e:
+            logging.warning(f"No se pudo abrir la caché de traducciones en «{self.ruta}» ({e}); se usará una caché en memoria.")
+            self.ruta = ":memory:"
+            conexion = sqlite3.connect(":memory:", check_same_thread=False)
+        conexion.execute(
+            "CREATE TABLE IF NOT EXISTS traducciones ("
+            " par TEXT NOT NULL,"
+            " origen TEXT NOT NULL,"
+            " traduccion TEXT NOT NULL,"
+            " ultimo_uso REAL NOT NULL,"
+            " PRIMARY KEY (par, origen))"
+        )
+        conexion.execute("CREATE INDEX IF NOT EXISTS idx_ultimo_uso ON traducciones (ultimo_uso)")
+        conexion.commit()
+        return conexion
+
+    def obtener(self, origen: str) -> Optional[str]:
+        with self._candado:
+            fila = self._conexion.execute(
+                "SELECT traduccion FROM traducciones WHERE par = ? AND origen = ?", (self.par, origen)
+            ).fetchone()
+            if fila is None:
+                self.fallos += 1
+                return None
+            self.aciertos += 1
+            # La fecha de uso se escribe por tandas (ver _volcar_accesos), no con un commit por consulta
+            self._accesos[origen] = time.time()
+            if len(self._accesos) >= ACCESOS_POR_ESCRITURA:
+                self._volcar_accesos()
+                self._conexion.commit()
+            return fila[0]
+
+    def guardar(self, origen: str, traduccion: str) -> None:
+        with self._candado:
+            self._conexion.execute(
+                "INSERT OR REPLACE INTO traducciones (par, origen, traduccion, ultimo_uso) VALUES (?, ?, ?, ?)",
+                (self.par, origen, traduccion, time.time())
+            )
+            self._accesos.pop(origen, None)
+            # El desalojo LRU necesita las fechas de uso al día
+            self._volcar_accesos()
+            self._desalojar()
+            self._conexion.commit()
+
+    def _volcar_accesos(self) -> None:
+        if self._accesos:
+            self._conexion.executemany(
+                "UPDATE traducciones SET ultimo_uso = ? WHERE par = ? AND origen = ?",
+                [(ultimo_uso, self.par, origen) for origen, ultimo_uso in self._accesos.items()]
+            )
+            self._accesos.clear()
+
+    def cerrar(self) -> None:
+        """Escribe las fechas de uso pendientes y cierra la base de datos (se llama también al salir)."""
+        with self._candado:
+            if self._conexion is None:
+                return
+            try:
+                self._volcar_accesos()
+                self._conexion.commit()
+                self._conexion.close()
+            except sqlite3.Error as e:
+                logging.debug(f"No se pudo cerrar la caché de traducciones: {e}")
+            self._conexion = None
+
+    def _desalojar(self) -> None:
+        total = self._conexion.execute("SELECT COUNT(*) FROM traducciones").fetchone()[0]
+        exceso = total - self.max_entradas
+        if exceso > 0:
+            # Se eliminan las entradas usadas hace más tiempo (LRU)
+            self._conexion.execute(
+                "DELETE FROM traducciones WHERE rowid IN"
+                " (SELECT rowid FROM traducciones ORDER BY ultimo_uso ASC LIMIT ?)", (exceso,)
+            )
+
+    def __contains__(self, origen: str) -> bool:
+        with self._candado:
+            return self._conexion.execute(
+                "SELECT 1 FROM traducciones WHERE par = ? AND origen = ?", (self.par, origen)
+            ).fetchone() is not None
+
+    def __len__(self) -> int:
+        with self._candado:
+            return self._conexion.execute("SELECT COUNT(*) FROM traducciones").fetchone()[0]
+
+    def limpiar(self) -> None:
+        with self._candado:
+            self._conexion.execute("DELETE FROM traducciones")
+            self._accesos.clear()
+            self._conexion.commit()
+
+    def estadisticas(self) -> Dict[str, int]:
+        return {
+            "aciertos": self.aciertos,
+            "fallos": self.fallos,
+            "entradas": len(self),
+            "capacidad": self.max_entradas,
+        }
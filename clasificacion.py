@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+Clasificación del aktionsart a partir de sus rasgos codificados como máscara de 5 bits.
+
+Los cinco rasgos binarios (ver RASGOS) dan solo 32 combinaciones, así que cada programa
+precalcula una tabla con el aktionsart de cada una y clasificar se reduce a indexarla.
+La misma tabla, como arreglo de NumPy, clasifica de una sola vez millones de vectores
+de rasgos guardados (ej: para reclasificarlos tras corregir respuestas).
+
+NumPy solo se importa al usar las funciones por lotes y no es necesario para el resto
+de los programas.
+"""
+from typing import Callable, Optional, Sequence, Tuple, TypeVar
+
+CAUSATIVO = 1
+ESTATIVO = 2
+PUNTUAL = 4
+TELICO = 8
+DINAMICO = 16
+
+# Orden de los bits y de las columnas de los vectores de rasgos
+RASGOS = ("causativo", "estativo", "puntual", "telico", "dinamico")
+COMBINACIONES = 1 << len(RASGOS)
+
+T = TypeVar("T")
+
+
+def a_mascara(causativo: bool, estativo: bool, puntual: bool, telico: bool, dinamico: bool) -> int:
+    return bool(causativo) | bool(estativo) << 1 | bool(puntual) << 2 | bool(telico) << 3 | bool(dinamico) << 4
+
+
+def desde_mascara(mascara: int) -> Tuple[bool, bool, bool, bool, bool]:
+    """Rasgos (causativo, estativo, puntual, telico, dinamico) de «mascara»."""
+    return tuple(bool(mascara >> bit & 1) for bit in range(len(RASGOS)))
+
+
+def construir_tabla(clasificar: Callable[[int], Optional[T]]) -> Tuple[Optional[T], ...]:
+    """Aplica «clasificar» a las 32 máscaras posibles; la posición de cada resultado es su máscara."""
+    return tuple(clasificar(mascara) for mascara in range(COMBINACIONES))
+
+
+def codigos_tabla(tabla: Sequence[Optional[T]], valores: Sequence[T]) -> Tuple[int, ...]:
+    """Convierte la tabla en posiciones dentro de «valores» (ej: tuple(Aktionsart)), con -1 para None."""
+    return tuple(valores.index(valor) if valor is not None else -1 for valor in tabla)
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise RuntimeError("La clasificación por lotes requiere NumPy (pip install numpy).") from None
+    return numpy
+
+
+def mascaras_lote(rasgos):
+    """
+    Máscaras (arreglo uint8) de un lote de rasgos: una matriz de n x 5 (booleanos o 0/1,
+    en el orden de RASGOS) o un arreglo de máscaras ya calculadas.
+    """
+    np = _numpy()
+    arreglo = np.asarray(rasgos)
+    if arreglo.ndim == 2 and arreglo.shape[1] == len(RASGOS):
+        return np.packbits(arreglo.astype(bool), axis=1, bitorder="little")[:, 0]
+    if arreglo.ndim == 1 and arreglo.dtype.kind in "iu":
+        if arreglo.size and (arreglo.min() < 0 or arreglo.max() >= COMBINACIONES):
+            raise ValueError(f"Las máscaras deben estar entre 0 y {COMBINACIONES - 1}.")
+        return arreglo.astype(np.uint8, copy=False)
+    raise ValueError(f"Se esperaba una matriz de n x {len(RASGOS)} rasgos o un arreglo de máscaras; forma recibida: {arreglo.shape}.")
+
+
+def clasificar_lote(rasgos, codigos: Sequence[int]):
+    """Aplica la tabla «codigos» (ver codigos_tabla) a un lote de rasgos; devuelve un arreglo int8."""
+    np = _numpy()
+    return np.asarray(codigos, dtype=np.int8)[mascaras_lote(rasgos)]
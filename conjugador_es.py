@@ -0,0 +1,450 @@
+# -*- coding: utf-8 -*-
+"""
+Conjugación de verbos en español a partir de modelos.
+
+El léxico (datos/verbos_es.tsv) asigna a cada verbo su modelo de conjugación (ver MODELOS);
+los que no tienen modelo, o no están en el léxico, se conjugan como regulares. Los cambios
+ortográficos que dependen solo de la terminación del infinitivo (buscar → busqué, coger →
+cojo, conocer → conozco, construir → construyo, leer → leyó, gruñir → gruñó...) se deducen
+automáticamente y no necesitan modelo.
+
+Los modelos con raíces irregulares (tener, poner, hacer...) valen también para sus derivados
+con prefijo (detener, suponer, deshacer...): las raíces del modelo se escriben para el verbo
+modelo y se les antepone el prefijo.
+
+No se generan el imperativo ni los tiempos compuestos (que se forman con «haber» y el participio).
+
+Los paradigmas se memorizan en una caché LRU acotada (TAMANO_CACHE entradas, ver info_cache):
+el analizador morfológico y el análisis automático conjugan los mismos verbos una y otra vez.
+"""
+import os
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Iterator, Mapping, Optional, Tuple
+
+TIEMPOS = (
+    "presente", "preterito", "imperfecto", "futuro", "condicional",
+    "presente_subjuntivo", "imperfecto_subjuntivo", "imperfecto_subjuntivo_se",
+)
+PERSONAS = ("1s", "2s", "3s", "1p", "2p", "3p")
+
+# Terminaciones regulares de los tiempos que se forman sobre la raíz (el infinitivo sin -ar/-er/-ir)
+TERMINACIONES = {
+    "ar": {
+        "presente": ("o", "as", "a", "amos", "áis", "an"),
+        "preterito": ("é", "aste", "ó", "amos", "asteis", "aron"),
+        "imperfecto": ("aba", "abas", "aba", "ábamos", "abais", "aban"),
+        "presente_subjuntivo": ("e", "es", "e", "emos", "éis", "en"),
+    },
+    "er": {
+        "presente": ("o", "es", "e", "emos", "éis", "en"),
+        "preterito": ("í", "iste", "ió", "imos", "isteis", "ieron"),
+        "imperfecto": ("ía", "ías", "ía", "íamos", "íais", "ían"),
+        "presente_subjuntivo": ("a", "as", "a", "amos", "áis", "an"),
+    },
+    "ir": {
+        "presente": ("o", "es", "e", "imos", "ís", "en"),
+        "preterito": ("í", "iste", "ió", "imos", "isteis", "ieron"),
+        "imperfecto": ("ía", "ías", "ía", "íamos", "íais", "ían"),
+        "presente_subjuntivo": ("a", "as", "a", "amos", "áis", "an"),
+    },
+}
+# Sobre el infinitivo (o la raíz irregular de futuro: tendr-, har-...)
+FUTURO = ("é", "ás", "á", "emos", "éis", "án")
+CONDICIONAL = ("ía", "ías", "ía", "íamos", "íais", "ían")
+# Pretérito de raíz fuerte (tuv-, quis-, dij-...)
+PRETERITO_FUERTE = ("e", "iste", "o", "imos", "isteis", "ieron")
+
+# Personas con la raíz tónica en el presente (donde diptongan pensar, contar...)
+TONICAS = (0, 1, 2, 5)
+
+VOCALES = "aeiouáéíóú"
+ACENTOS = str.maketrans("aeiou", "áéíóú")
+SIN_ACENTOS = str.maketrans("áéíóú", "aeiou")
+SIN_TILDE_AEO = str.maketrans("áéó", "aeo")
+
+# Paradigmas memorizados por conjugar (el léxico completo cabe con holgura)
+TAMANO_CACHE = 4096
+
+RUTA_LEXICO = os.path.join(os.path.dirname(os.path.abspath(__file__)), "datos", "verbos_es.tsv")
+
+
+@dataclass(frozen=True)
+class Modelo:
+    """
+    Irregularidades de un modelo de conjugación. Las raíces (yo, subjuntivo, preterito,
+    futuro, imperfecto) y las formas se escriben para el verbo modelo, sin prefijo.
+    """
+    diptongo: str = ""        # «ie» o «ue» en las formas con raíz tónica (pensar → pienso, jugar → juego)
+    cierre: bool = False      # e → i, o → u en las formas átonas de los verbos en -ir (pedir → pidió, dormir → durmió)
+    acento: bool = False      # i/u tónica con tilde (enviar → envío, actuar → actúo, reunir → reúno)
+    yo: str = ""              # raíz de la 1.ª persona del presente y del subjuntivo (tener → teng-)
+    subjuntivo: str = ""      # raíz del subjuntivo, si no es la de «yo» (saber → sep-)
+    preterito: str = ""       # raíz del pretérito fuerte (tener → tuv-)
+    futuro: str = ""          # raíz del futuro y el condicional (tener → tendr-)
+    imperfecto: str = ""      # raíz del imperfecto (ver → ve-)
+    gerundio: str = ""
+    participio: str = ""
+    # Formas sueltas por tiempo, en el orden de PERSONAS (None conserva la forma generada)
+    formas: Mapping[str, Tuple[Optional[str], ...]] = field(default_factory=dict)
+
+    @property
+    def raices_irregulares(self) -> bool:
+        """Indica si alguna forma no puede deducirse de la raíz del infinitivo (ej: tuve, quepo, fui)."""
+        return bool(self.yo or self.subjuntivo or self.preterito or self.futuro or self.imperfecto
+                    or self.gerundio or self.participio or self.formas)
+
+
+MODELOS: Dict[str, Modelo] = {
+    # Cambios vocálicos
+    "pensar": Modelo(diptongo="ie"),
+    "entender": Modelo(diptongo="ie"),
+    "contar": Modelo(diptongo="ue"),
+    "mover": Modelo(diptongo="ue"),
+    "jugar": Modelo(diptongo="ue"),
+    "adquirir": Modelo(diptongo="ie"),
+    "sentir": Modelo(diptongo="ie", cierre=True),
+    "dormir": Modelo(diptongo="ue", cierre=True),
+    "pedir": Modelo(cierre=True),
+    "enviar": Modelo(acento=True),
+    "actuar": Modelo(acento=True),
+    "reunir": Modelo(acento=True),
+    # Participios irregulares
+    "abrir": Modelo(participio="abierto"),
+    "cubrir": Modelo(participio="cubierto"),
+    "scribir": Modelo(participio="scrito"),
+    "romper": Modelo(participio="roto"),
+    "imprimir": Modelo(participio="impreso"),
+    "morir": Modelo(diptongo="ue", cierre=True, participio="muerto"),
+    "volver": Modelo(diptongo="ue", participio="vuelto"),
+    "solver": Modelo(diptongo="ue", participio="suelto"),
+    # Raíces irregulares
+    "ser": Modelo(subjuntivo="se", formas={
+        "presente": ("soy", "eres", "es", "somos", "sois", "son"),
+        "preterito": ("fui", "fuiste", "fue", "fuimos", "fuisteis", "fueron"),
+        "imperfecto": ("era", "eras", "era", "éramos", "erais", "eran"),
+    }),
+    "ir": Modelo(subjuntivo="vay", gerundio="yendo", formas={
+        "presente": ("voy", "vas", "va", "vamos", "vais", "van"),
+        "preterito": ("fui", "fuiste", "fue", "fuimos", "fuisteis", "fueron"),
+        "imperfecto": ("iba", "ibas", "iba", "íbamos", "ibais", "iban"),
+    }),
+    "estar": Modelo(preterito="estuv", formas={
+        "presente": ("estoy", "estás", "está", None, None, "están"),
+        "presente_subjuntivo": ("esté", "estés", "esté", None, None, "estén"),
+    }),
+    "haber": Modelo(subjuntivo="hay", preterito="hub", futuro="habr", formas={
+        "presente": ("he", "has", "ha", "hemos", None, "han"),
+    }),
+    "dar": Modelo(formas={
+        "presente": ("doy", None, None, None, "dais", None),
+        "preterito": ("di", "diste", "dio", "dimos", "disteis", "dieron"),
+        "presente_subjuntivo": ("dé", None, "dé", None, "deis", None),
+    }),
+    "ver": Modelo(yo="ve", imperfecto="ve", participio="visto", formas={
+        "presente": (None, "ves", "ve", None, "veis", "ven"),
+        "preterito": ("vi", None, "vio", None, None, None),
+    }),
+    "saber": Modelo(subjuntivo="sep", preterito="sup", futuro="sabr", formas={"presente": ("sé",) + (None,) * 5}),
+    "caber": Modelo(yo="quep", preterito="cup", futuro="cabr"),
+    "tener": Modelo(diptongo="ie", yo="teng", preterito="tuv", futuro="tendr"),
+    "venir": Modelo(diptongo="ie", cierre=True, yo="veng", preterito="vin", futuro="vendr"),
+    "poner": Modelo(yo="pong", preterito="pus", futuro="pondr", participio="puesto"),
+    "hacer": Modelo(yo="hag", preterito="hic", futuro="har", participio="hecho"),
+    "facer": Modelo(yo="fag", preterito="fic", futuro="far", participio="fecho"),
+    "decir": Modelo(cierre=True, yo="dig", preterito="dij", futuro="dir", participio="dicho"),
+    # Futuro y participio regulares (bendeciré, bendecido)
+    "bendecir": Modelo(cierre=True, yo="bendig", preterito="bendij"),
+    "maldecir": Modelo(cierre=True, yo="maldig", preterito="maldij"),
+    "querer": Modelo(diptongo="ie", preterito="quis", futuro="querr"),
+    "poder": Modelo(diptongo="ue", preterito="pud", futuro="podr", gerundio="pudiendo"),
+    "salir": Modelo(yo="salg", futuro="saldr"),
+    "valer": Modelo(yo="valg", futuro="valdr"),
+    "traer": Modelo(yo="traig", preterito="traj"),
+    "caer": Modelo(yo="caig"),
+    "oír": Modelo(yo="oig", formas={"presente": (None, "oyes", "oye", "oímos", "oís", "oyen")}),
+    "pudrir": Modelo(participio="podrido"),
+    "proveer": Modelo(participio="provisto"),
+    "andar": Modelo(preterito="anduv"),
+    "ducir": Modelo(preterito="duj"),
+    "reír": Modelo(gerundio="riendo", formas={
+        "presente": ("río", "ríes", "ríe", None, "reís", "ríen"),
+        "presente_subjuntivo": ("ría", "rías", "ría", "riamos", "riáis", "rían"),
+        "preterito": ("reí", "reíste", "rió", "reímos", "reísteis", "rieron"),
+    }),
+    "freír": Modelo(gerundio="friendo", participio="frito", formas={
+        "presente": ("frío", "fríes", "fríe", None, "freís", "fríen"),
+        "presente_subjuntivo": ("fría", "frías", "fría", "friamos", "friáis", "frían"),
+        "preterito": ("freí", "freíste", "frió", "freímos", "freísteis", "frieron"),
+    }),
+}
+
+
+@dataclass(frozen=True)
+class Paradigma:
+    """Formas de un verbo: las no personales y, por tiempo, una forma por persona (en el orden de PERSONAS)."""
+    infinitivo: str
+    gerundio: str
+    participio: str
+    tiempos: Mapping[str, Tuple[str, ...]]
+
+    def forma(self, tiempo: str, persona_numero: Optional[str] = None) -> str:
+        if tiempo in ("infinitivo", "gerundio", "participio"):
+            return getattr(self, tiempo)
+        return self.tiempos[tiempo][PERSONAS.index(persona_numero)]
+
+    def formas(self) -> Iterator[Tuple[str, str, Optional[str]]]:
+        """Todas las formas como (forma, tiempo, persona_numero); persona_numero es None en las no personales."""
+        for tiempo in ("infinitivo", "gerundio", "participio"):
+            yield getattr(self, tiempo), tiempo, None
+        for tiempo in TIEMPOS:
+            for persona_numero, forma in zip(PERSONAS, self.tiempos[tiempo]):
+                yield forma, tiempo, persona_numero
+
+
+# --- LÉXICO ---
+
+def cargar_lexico(ruta: str = RUTA_LEXICO) -> Dict[str, str]:
+    """Lee el léxico «infinitivo[TAB]modelo»; los verbos sin modelo son regulares."""
+    lexico = {}
+    with open(ruta, encoding="utf-8") as archivo:
+        for numero, linea in enumerate(archivo, 1):
+            linea = linea.split("#", 1)[0].strip()
+            if not linea:
+                continue
+            infinitivo, _, modelo = linea.partition("\t")
+            infinitivo, modelo = infinitivo.strip(), modelo.strip()
+            if modelo and modelo not in MODELOS:
+                raise ValueError(f"{ruta}:{numero}: modelo desconocido «{modelo}» para «{infinitivo}».")
+            if modelo and MODELOS[modelo].raices_irregulares and not infinitivo.endswith(modelo):
+                raise ValueError(f"{ruta}:{numero}: «{infinitivo}» no puede seguir el modelo «{modelo}», que tiene raíces irregulares.")
+            lexico[infinitivo] = modelo
+    return lexico
+
+
+LEXICO: Optional[Dict[str, str]] = None
+
+
+def obtener_lexico() -> Dict[str, str]:
+    global LEXICO
+    if LEXICO is None:
+        LEXICO = cargar_lexico()
+    return LEXICO
+
+
+def modelo_de(infinitivo: str) -> str:
+    """Nombre del modelo de «infinitivo» ("" si es regular)."""
+    return obtener_lexico().get(infinitivo, "")
+
+
+# --- CONJUGACIÓN ---
+
+def _clase(infinitivo: str) -> str:
+    terminacion = infinitivo[-2:].translate(SIN_ACENTOS)
+    if len(infinitivo) < 2 or terminacion not in TERMINACIONES:
+        raise ValueError(f"«{infinitivo}» no es un infinitivo.")
+    return terminacion
+
+
+def _cambiar_ultima(raiz: str, vocales: str, nueva: str) -> str:
+    """Reemplaza la última de «vocales» que aparezca en «raiz» por «nueva» (sin cambios si no hay ninguna)."""
+    for i in range(len(raiz) - 1, -1, -1):
+        if raiz[i] in vocales:
+            return raiz[:i] + nueva + raiz[i + 1:]
+    return raiz
+
+
+def _diptongar(raiz: str, diptongo: str) -> str:
+    # pensar → piens-, contar → cuent-, jugar → jueg-, adquirir → adquier-; al inicio: oler → huel-, errar → yerr-
+    if diptongo == "ie":
+        nueva = _cambiar_ultima(raiz, "e", "ie") if "e" in raiz else _cambiar_ultima(raiz, "i", "ie")
+    else:
+        nueva = _cambiar_ultima(raiz, "o", "ue") if "o" in raiz else _cambiar_ultima(raiz, "u", "ue")
+    if nueva.startswith("ue"):
+        return "h" + nueva
+    if nueva.startswith("ie"):
+        return "y" + nueva[1:]
+    return nueva
+
+
+def _cerrar(raiz: str) -> str:
+    # pedir → pid-, dormir → durm-: la última e u o de la raíz
+    for i in range(len(raiz) - 1, -1, -1):
+        if raiz[i] in "eo":
+            return raiz[:i] + ("i" if raiz[i] == "e" else "u") + raiz[i + 1:]
+    return raiz
+
+
+def _unir(raiz: str, terminacion: str, clase: str) -> str:
+    """Une raíz y terminación aplicando los cambios ortográficos regulares."""
+    # La í tónica no se iguala a la i: construía y leía no cambian
+    inicial = terminacion[:1].translate(SIN_TILDE_AEO)
+    if clase == "ar":
+        if inicial == "e":
+            if raiz.endswith("gu"):
+                raiz = raiz[:-2] + "gü"        # averiguar → averigüé
+            elif raiz.endswith("c"):
+                raiz = raiz[:-1] + "qu"        # buscar → busqué
+            elif raiz.endswith("g"):
+                raiz = raiz[:-1] + "gu"        # pagar → pagué
+            elif raiz.endswith("z"):
+                raiz = raiz[:-1] + "c"         # empezar → empecé
+        return raiz + terminacion
+
+    if inicial in ("o", "a"):
+        if raiz.endswith("gu"):
+            raiz = raiz[:-1]                   # seguir → sigo
+        elif raiz.endswith("qu"):
+            raiz = raiz[:-2] + "c"             # delinquir → delinco
+        elif raiz.endswith("c"):
+            # conocer → conozco, conducir → conduzco; vencer → venzo
+            raiz = raiz[:-1] + ("zc" if raiz[-2:-1] in VOCALES else "z")
+        elif raiz.endswith("g"):
+            raiz = raiz[:-1] + "j"             # coger → cojo
+    final = raiz[-1:]
+    if final == "u" and not raiz.endswith(("gu", "qu")):
+        # construir → construyo, construyó, construyendo
+        if inicial in ("a", "e", "o"):
+            return raiz + "y" + terminacion
+        if inicial == "i" and terminacion[1:2] in VOCALES:
+            return raiz + "y" + terminacion[1:]
+        return raiz + terminacion
+    if final in ("a", "e", "o"):
+        # leer → leyó, leíste, leyendo, leído
+        if inicial == "i":
+            if terminacion[1:2] in VOCALES:
+                return raiz + "y" + terminacion[1:]
+            return raiz + "í" + terminacion[1:]
+        return raiz + terminacion
+    if (final == "ñ" or raiz.endswith("ll")) and inicial == "i" and terminacion[1:2] in VOCALES:
+        return raiz + terminacion[1:]          # gruñir → gruñó, gruñendo
+    return raiz + terminacion
+
+
+def _con_prefijo(prefijo: str, forma: str) -> str:
+    """
+    Antepone el prefijo a una forma del modelo. Un monosílabo terminado en vocal, n o s pasa
+    a ser palabra aguda y lleva tilde (vio → previó, ves → prevés, veis → prevéis).
+    """
+    if not prefijo or any(letra in "áéíóú" for letra in forma) or forma[-1] not in "aeiouns":
+        return prefijo + forma
+    vocales = [i for i, letra in enumerate(forma) if letra in "aeiou"]
+    if not vocales or vocales[-1] - vocales[0] != len(vocales) - 1:
+        return prefijo + forma                  # más de una sílaba
+    # La tilde va en la vocal abierta del diptongo (veis → véis) o, si no la hay, en la última (fui → fuí)
+    tonica = next((i for i in vocales if forma[i] in "aeo"), vocales[-1])
+    return prefijo + forma[:tonica] + forma[tonica].translate(ACENTOS) + forma[tonica + 1:]
+
+
+def _acentuar_ultima(texto: str) -> str:
+    for i in range(len(texto) - 1, -1, -1):
+        if texto[i] in "aeiou":
+            return texto[:i] + texto[i].translate(ACENTOS) + texto[i + 1:]
+    return texto
+
+
+def _acentuar_ultima_iu(raiz: str) -> str:
+    # enviar → enví-, actuar → actú-, reunir → reún-, prohibir → prohíb-
+    for i in range(len(raiz) - 1, -1, -1):
+        if raiz[i] in "iu":
+            return raiz[:i] + raiz[i].translate(ACENTOS) + raiz[i + 1:]
+    return raiz
+
+
+def _prefijo(infinitivo: str, nombre_modelo: str, modelo: Modelo) -> str:
+    if modelo.raices_irregulares and infinitivo.endswith(nombre_modelo):
+        return infinitivo[:-len(nombre_modelo)]
+    return ""
+
+
+def conjugar(infinitivo: str, nombre_modelo: Optional[str] = None) -> Paradigma:
+    """
+    Paradigma completo de «infinitivo» según su modelo del léxico (o «nombre_modelo», si se
+    indica). Lanza ValueError si «infinitivo» no termina en -ar, -er o -ir.
+    """
+    infinitivo = infinitivo.strip().lower()
+    if nombre_modelo is None:
+        nombre_modelo = modelo_de(infinitivo)
+    return _conjugar(infinitivo, nombre_modelo)
+
+
+def info_cache():
+    """Aciertos, fallos y tamaño de la caché de paradigmas (functools._CacheInfo)."""
+    return _conjugar.cache_info()
+
+
+def vaciar_cache() -> None:
+    _conjugar.cache_clear()
+
+
+@lru_cache(maxsize=TAMANO_CACHE)
+def _conjugar(infinitivo: str, nombre_modelo: str) -> Paradigma:
+    clase = _clase(infinitivo)
+    modelo = MODELOS[nombre_modelo] if nombre_modelo else Modelo()
+    prefijo = _prefijo(infinitivo, nombre_modelo, modelo)
+    raiz = infinitivo[:-2]
+    terminaciones = TERMINACIONES[clase]
+    cierre = modelo.cierre and clase == "ir"
+
+    tonica = _diptongar(raiz, modelo.diptongo) if modelo.diptongo else raiz
+    if modelo.acento:
+        tonica = _acentuar_ultima_iu(raiz)
+    atona = _cerrar(raiz) if cierre else raiz
+    if cierre and not modelo.diptongo:
+        tonica = atona
+
+    presente = [_unir(tonica if i in TONICAS else raiz, t, clase) for i, t in enumerate(terminaciones["presente"])]
+    if modelo.yo:
+        presente[0] = prefijo + modelo.yo + "o"
+
+    raiz_subjuntivo = modelo.subjuntivo or modelo.yo
+    if raiz_subjuntivo:
+        subjuntivo = [prefijo + raiz_subjuntivo + t for t in terminaciones["presente_subjuntivo"]]
+    else:
+        subjuntivo = [_unir(tonica if i in TONICAS else atona, t, clase)
+                      for i, t in enumerate(terminaciones["presente_subjuntivo"])]
+
+    if modelo.preterito:
+        fuerte = prefijo + modelo.preterito
+        preterito = [fuerte + t for t in PRETERITO_FUERTE]
+        if fuerte.endswith("j"):
+            preterito[5] = fuerte + "eron"      # decir → dijeron
+        if fuerte.endswith("c"):
+            preterito[2] = fuerte[:-1] + "zo"   # hacer → hizo
+    else:
+        preterito = [_unir(atona if i in (2, 5) else raiz, t, clase) for i, t in enumerate(terminaciones["preterito"])]
+
+    raiz_imperfecto = prefijo + modelo.imperfecto if modelo.imperfecto else raiz
+    imperfecto = [_unir(raiz_imperfecto, t, clase) for t in terminaciones["imperfecto"]]
+
+    raiz_futuro = prefijo + modelo.futuro if modelo.futuro else infinitivo.translate(SIN_ACENTOS)
+    futuro = [raiz_futuro + t for t in FUTURO]
+    condicional = [raiz_futuro + t for t in CONDICIONAL]
+
+    tiempos = {
+        "presente": presente, "preterito": preterito, "imperfecto": imperfecto,
+        "futuro": futuro, "condicional": condicional, "presente_subjuntivo": subjuntivo,
+    }
+    for tiempo, formas in modelo.formas.items():
+        tiempos[tiempo] = [_con_prefijo(prefijo, forma) if forma is not None else generada
+                           for forma, generada in zip(formas, tiempos[tiempo])]
+
+    # El imperfecto de subjuntivo se forma siempre sobre la 3.ª persona plural del pretérito (tuvieron → tuviera)
+    base = tiempos["preterito"][5][:-3]
+    tiempos["imperfecto_subjuntivo"] = [base + "ra", base + "ras", base + "ra", _acentuar_ultima(base) + "ramos", base + "rais", base + "ran"]
+    tiempos["imperfecto_subjuntivo_se"] = [base + "se", base + "ses", base + "se", _acentuar_ultima(base) + "semos", base + "seis", base + "sen"]
+
+    if modelo.gerundio:
+        gerundio = prefijo + modelo.gerundio
+    else:
+        gerundio = _unir(atona, "ando" if clase == "ar" else "iendo", clase)
+    if modelo.participio:
+        participio = prefijo + modelo.participio
+    else:
+        participio = _unir(raiz, "ado" if clase == "ar" else "ido", clase)
+
+    # De solo lectura: el mismo paradigma se comparte entre todos los que lo piden a la caché
+    return Paradigma(infinitivo, gerundio, participio,
+                     MappingProxyType({tiempo: tuple(tiempos[tiempo]) for tiempo in TIEMPOS}))
+
@@ -0,0 +1,277 @@
+# -*- coding: utf-8 -*-
+"""
+English verb conjugation from packaged tables (EN counterpart of conjugador_es).
+
+datos/irregulares_en.tsv gives the past and past participle of irregular verbs, and
+datos/verbos_en.tsv assigns each verb the spelling model it follows (see MODELS). Verbs in
+neither file are conjugated with the regular rules: -s/-es/-ies, -ed/-d/-ied, -ing with
+e-dropping (make → making) and ie → y (die → dying). One-syllable verbs double their final
+consonant (stop → stopped); longer ones only if the lexicon says so (admit → admitted, but
+visit → visited).
+
+Paradigms are memoized in a bounded LRU cache (CACHE_SIZE entries, see cache_info).
+
+The irregular table is also indexed the other way round, from every form to its infinitive
+(ran → run, left → leave, being → be), to repair the lemmas of small spaCy models (see
+repair_lemma).
+"""
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Iterator, Mapping, Optional, Tuple
+
+TENSES = ("present", "past")
+PERSONS = ("1s", "2s", "3s", "1p", "2p", "3p")
+
+MODELS = {
+    "double": "doubles the final consonant before -ed/-ing (admit → admitted)",
+    "k": "adds k before -ed/-ing (panic → panicked)",
+}
+
+# Person forms that no rule produces, in the order of PERSONS (None keeps the generated form)
+PERSON_FORMS: Dict[str, Dict[str, Tuple[Optional[str], ...]]] = {
+    "be": {
+        "present": ("am", "are", "is", "are", "are", "are"),
+        "past": ("was", "were", "was", "were", "were", "were"),
+    },
+    "have": {"present": (None, None, "has", None, None, None)},
+}
+
+VOWELS = "aeiou"
+# Paradigms memoized by conjugate (the whole lexicon fits comfortably)
+CACHE_SIZE = 4096
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "datos")
+LEXICON_PATH = os.path.join(DATA_DIR, "verbos_en.tsv")
+IRREGULARS_PATH = os.path.join(DATA_DIR, "irregulares_en.tsv")
+
+
+@dataclass(frozen=True)
+class Paradigm:
+    """Forms of a verb: the non-finite ones and, per tense, one form per person (in the order of PERSONS)."""
+    infinitive: str
+    gerund: str
+    past_participle: str
+    tenses: Mapping[str, Tuple[str, ...]]
+
+    def form(self, tense: str, person_number: Optional[str] = None) -> str:
+        if person_number is None:
+            return getattr(self, tense)
+        return self.tenses[tense][PERSONS.index(person_number)]
+
+    def forms(self) -> Iterator[Tuple[str, str, Optional[str]]]:
+        """Every form as (form, tense, person_number); person_number is None for the non-finite ones."""
+        for tense in ("infinitive", "gerund", "past_participle"):
+            yield getattr(self, tense), tense, None
+        for tense in TENSES:
+            for person_number, form in zip(PERSONS, self.tenses[tense]):
+                yield form, tense, person_number
+
+
+# --- DATA FILES ---
+
+def _rows(path: str) -> Iterator[Tuple[int, list]]:
+    with open(path, encoding="utf-8") as data:
+        for number, line in enumerate(data, 1):
+            line = line.split("#", 1)[0].strip()
+            if line:
+                yield number, [column.strip() for column in line.split("\t")]
+
+
+def load_lexicon(path: str = LEXICON_PATH) -> Dict[str, str]:
+    """Reads the «verb[TAB]model» lexicon; verbs without a model are regular."""
+    lexicon = {}
+    for number, columns in _rows(path):
+        verb, model = columns[0], columns[1] if len(columns) > 1 else ""
+        if model and model not in MODELS:
+            raise ValueError(f"{path}:{number}: unknown model '{model}' for '{verb}'.")
+        lexicon[verb] = model
+    return lexicon
+
+
+def load_irregulars(path: str = IRREGULARS_PATH) -> Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]]:
+    """Reads «infinitive[TAB]past[TAB]past participle» rows; alternatives are separated by «/»."""
+    irregulars = {}
+    for number, columns in _rows(path):
+        if len(columns) != 3:
+            raise ValueError(f"{path}:{number}: expected infinitive, past and past participle.")
+        infinitive, past, participle = columns
+        irregulars[infinitive] = (tuple(past.split("/")), tuple(participle.split("/")))
+    return irregulars
+
+
+LEXICON: Optional[Dict[str, str]] = None
+IRREGULARS: Optional[Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]]] = None
+
+
+def get_lexicon() -> Dict[str, str]:
+    global LEXICON
+    if LEXICON is None:
+        LEXICON = load_lexicon()
+    return LEXICON
+
+
+def get_irregulars() -> Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]]:
+    global IRREGULARS
+    if IRREGULARS is None:
+        IRREGULARS = load_irregulars()
+    return IRREGULARS
+
+
+def model_of(verb: str) -> str:
+    """Name of the spelling model of «verb» ("" if it follows the default rules)."""
+    return get_lexicon().get(verb, "")
+
+
+# --- CONJUGATION ---
+
+def _is_vowel_at(verb: str, i: int) -> bool:
+    letter = verb[i]
+    if letter == "u" and i > 0 and verb[i - 1] == "q":
+        return False                            # quit, squat: the u is not a vowel
+    return letter in VOWELS or (letter == "y" and i > 0 and verb[i - 1] not in VOWELS)
+
+
+def _syllables(verb: str) -> int:
+    """Number of vowel groups (enough to tell one-syllable verbs apart)."""
+    return sum(1 for i in range(len(verb)) if _is_vowel_at(verb, i) and not (i > 0 and _is_vowel_at(verb, i - 1)))
+
+
+def _doubles(verb: str, model: str) -> bool:
+    """Whether the final consonant doubles before a vowel suffix (stop → stopping)."""
+    if model == "double":
+        return True
+    if model or len(verb) < 3 or verb[-1] in "aeiouwxy":
+        return False
+    # consonant-vowel-consonant ending in a one-syllable verb
+    return _is_vowel_at(verb, len(verb) - 2) and not _is_vowel_at(verb, len(verb) - 3) and _syllables(verb) == 1
+
+
+def _stem(verb: str, model: str) -> str:
+    """The verb ready for -ed/-ing: stop → stopp-, panic → panick-."""
+    if model == "k":
+        return verb + "k"
+    if _doubles(verb, model):
+        return verb + verb[-1]
+    return verb
+
+
+def _gerund(verb: str, model: str) -> str:
+    if verb.endswith("ie"):
+        return verb[:-2] + "ying"               # die → dying
+    if verb.endswith("e") and len(verb) > 2 and not verb.endswith(("ee", "ye", "oe")):
+        return verb[:-1] + "ing"                # make → making; see, dye, hoe keep the e
+    return _stem(verb, model) + "ing"
+
+
+def _regular_past(verb: str, model: str) -> str:
+    if verb.endswith("e"):
+        return verb + "d"                       # love → loved
+    if verb.endswith("y") and not _is_vowel_at(verb, len(verb) - 2):
+        return verb[:-1] + "ied"                # try → tried
+    return _stem(verb, model) + "ed"
+
+
+def _third_person(verb: str, model: str) -> str:
+    if verb.endswith("y") and len(verb) > 1 and not _is_vowel_at(verb, len(verb) - 2):
+        return verb[:-1] + "ies"                # try → tries
+    if verb.endswith("z") and _doubles(verb, model):
+        return verb + "zes"                     # quiz → quizzes
+    if verb.endswith(("s", "x", "z", "ch", "sh")) or (verb.endswith("o") and verb[-2:-1] not in VOWELS):
+        return verb + "es"                      # watch → watches, go → goes
+    return verb + "s"
+
+
+def conjugate(verb: str, model: Optional[str] = None) -> Paradigm:
+    """
+    Full paradigm of «verb» following its lexicon model (or «model», if given). Raises
+    ValueError if «verb» is not a single word.
+    """
+    verb = verb.strip().lower()
+    if model is None:
+        model = model_of(verb)
+    return _conjugate(verb, model)
+
+
+def cache_info():
+    """Hits, misses and size of the paradigm cache (functools._CacheInfo)."""
+    return _conjugate.cache_info()
+
+
+def clear_cache() -> None:
+    _conjugate.cache_clear()
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _conjugate(verb: str, model: str) -> Paradigm:
+    if not verb.replace("-", "").isalpha():
+        raise ValueError(f"'{verb}' is not a verb.")
+    irregular = get_irregulars().get(verb)
+    if irregular:
+        past, participle = irregular[0][0], irregular[1][0]
+    else:
+        past = participle = _regular_past(verb, model)
+
+    third = _third_person(verb, model)
+    tenses = {
+        "present": [third if person == "3s" else verb for person in PERSONS],
+        "past": [past] * len(PERSONS),
+    }
+    for tense, forms in PERSON_FORMS.get(verb, {}).items():
+        tenses[tense] = [form if form is not None else generated for form, generated in zip(forms, tenses[tense])]
+
+    # Read-only: the same paradigm is shared by everyone who gets it from the cache
+    return Paradigm(verb, _gerund(verb, model), participle,
+                    MappingProxyType({tense: tuple(tenses[tense]) for tense in TENSES}))
+
+
+# --- REVERSE INDEX OF IRREGULAR FORMS ---
+
+def build_form_index(irregulars: Mapping[str, Tuple[Tuple[str, ...], Tuple[str, ...]]]) -> Dict[str, Tuple[str, ...]]:
+    """
+    Every form of the irregular verbs (past, participle and gerund, with their alternatives,
+    and the present forms) → the infinitives it belongs to. A form that is an infinitive
+    itself lists it first (read → read).
+    """
+    index: Dict[str, list] = {}
+    for infinitive, (pasts, participles) in irregulars.items():
+        paradigm = conjugate(infinitive)
+        forms = {infinitive, paradigm.gerund, *pasts, *participles,
+                 *paradigm.tenses["present"], *paradigm.tenses["past"]}
+        for form in forms:
+            index.setdefault(form, []).append(infinitive)
+    return {form: tuple(sorted(infinitives, key=lambda infinitive: infinitive != form))
+            for form, infinitives in index.items()}
+
+
+FORM_INDEX: Optional[Dict[str, Tuple[str, ...]]] = None
+
+
+def get_form_index() -> Dict[str, Tuple[str, ...]]:
+    global FORM_INDEX
+    if FORM_INDEX is None:
+        FORM_INDEX = build_form_index(get_irregulars())
+    return FORM_INDEX
+
+
+def infinitives_of(form: str) -> Tuple[str, ...]:
+    """Infinitives of the irregular verbs that «form» belongs to (empty if none)."""
+    return get_form_index().get(form.strip().lower(), ())
+
+
+def repair_lemma(form: str, lemma: str = "") -> str:
+    """
+    Infinitive of the verb «form», given the «lemma» proposed by spaCy. Small models often
+    leave irregular forms unlemmatized (ran → ran) or pick the wrong verb; the reverse index
+    settles it, unless spaCy's lemma is one of its candidates or the form is itself a verb
+    of the lexicon that spaCy kept (lay, bore).
+    """
+    form = form.strip().lower()
+    lemma = lemma.strip().lower() or form
+    candidates = infinitives_of(form)
+    if not candidates or lemma in candidates:
+        return lemma
+    if lemma == form and form in get_lexicon():
+        return lemma
+    return candidates[0]
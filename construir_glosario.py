@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""
+Genera glosario_en.json, el glosario español-inglés precompilado que usa
+traducir_constantes antes de recurrir al traductor en línea.
+
+Incluye todos los verbos de los léxicos de ls.py y sus formas de participio.
+Los participios se toman de conjugador_es.py. Las entradas existentes se conservan (así
+se respetan las revisiones manuales) y las que ya no salen del léxico se eliminan; usa
+--forzar para volver a traducirlas todas.
+
+Uso: python construir_glosario.py [--forzar] [--salida glosario_en.json]
+"""
+import argparse
+import json
+import os
+import sys
+from typing import Dict, List, Set
+
+import ls
+from analizador_morfologico import analisis_posibles
+from conjugador_es import conjugar
+
+TABLAS_LEXICO = [
+    ls.VERBOS_MOVIMIENTO, ls.VERBOS_TRANSFERENCIA, ls.VERBOS_DICCION,
+    ls.VERBOS_TRI_NEG, ls.VERBOS_POSESION, ls.VERBOS_PERCEPCION
+]
+
+# Verbos de VERBOS_EXISTENCIA que no admiten complemento directo: su participio no concuerda
+# («ha existido», nunca «existidas»), de modo que solo se incluye el masculino singular
+PARTICIPIOS_INVARIABLES = {
+    "ser", "estar", "haber", "existir", "perdurar", "permanecer", "persistir", "quedar", "subsistir"
+}
+
+
+def infinitivos_lexico() -> List[str]:
+    infinitivos: Set[str] = set()
+    for tabla in TABLAS_LEXICO:
+        for categoria, verbos in tabla.items():
+            # VERBOS_PERCEPCION asocia directamente cada verbo con su sentido
+            if isinstance(verbos, (list, dict)):
+                infinitivos.update(verbos)
+            else:
+                infinitivos.add(categoria)
+    # Los verbos no pronominales primero, para que sus participios tengan prioridad
+    return sorted(infinitivos, key=lambda verbo: (verbo.endswith("se"), verbo))
+
+
+def participio(infinitivo: str) -> str:
+    return conjugar(infinitivo[:-2] if infinitivo.endswith("se") else infinitivo).participio
+
+
+def formas_participio(masculino_singular: str) -> List[str]:
+    raiz = masculino_singular[:-1]
+    return [raiz + "o", raiz + "a", raiz + "os", raiz + "as"]
+
+
+def participios_existencia() -> Dict[str, List[str]]:
+    """Participios de VERBOS_EXISTENCIA (masculino singular -> formas que se incluyen)."""
+    participios: Dict[str, List[str]] = {}
+    for forma in ls.VERBOS_EXISTENCIA:
+        # El analizador reconoce el masculino singular; las demás formas de la lista son sus variantes
+        for analisis in analisis_posibles(forma):
+            if analisis.tiempo != "participio":
+                continue
+            masculino = participio(analisis.infinitivo)
+            if analisis.infinitivo in PARTICIPIOS_INVARIABLES:
+                participios[masculino] = [masculino]
+            else:
+                participios[masculino] = formas_participio(masculino)
+    return participios
+
+
+def construir(glosario: Dict[str, str], forzar: bool) -> Dict[str, str]:
+    # Cada participio se traduce una sola vez (masculino singular) y se copia a sus variantes
+    participios: Dict[str, List[str]] = {}
+    for infinitivo in infinitivos_lexico():
+        masculino = participio(infinitivo)
+        participios.setdefault(masculino, formas_participio(masculino))
+    participios.update(participios_existencia())
+
+    # Se descartan las entradas que ya no salen del léxico (ej: participios que dejaron de generarse)
+    vigentes = set(infinitivos_lexico()).union(*participios.values(), ls.CORRECCIONES)
+    glosario = {entrada: traduccion for entrada, traduccion in glosario.items() if entrada in vigentes}
+
+    pendientes = [inf for inf in infinitivos_lexico() if forzar or inf not in glosario]
+    pendientes += [pp for pp, formas in participios.items()
+                   if forzar or any(forma not in glosario for forma in formas)]
+
+    if pendientes:
+        print(f"Traduciendo {len(pendientes)} entradas...", file=sys.stderr)
+        textos = [entrada.replace(".", " ") for entrada in pendientes]
+        for entrada, traduccion in zip(pendientes, ls.traducir_en_lote(textos)):
+            if not traduccion:
+                print(f"Sin traducción para «{entrada}»", file=sys.stderr)
+                continue
+            traduccion = traduccion.lower().strip().replace(" ", ".")
+            for forma in participios.get(entrada, [entrada]):
+                glosario[forma] = traduccion
+
+    # Las correcciones manuales siempre prevalecen
+    glosario.update(ls.CORRECCIONES)
+    return dict(sorted(glosario.items()))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Regenera el glosario español-inglés de ls.py.")
+    parser.add_argument("--forzar", action="store_true", help="vuelve a traducir también las entradas existentes")
+    parser.add_argument("--salida", default=ls.RUTA_GLOSARIO, metavar="ARCHIVO",
+                        help="archivo JSON de salida (por defecto: glosario_en.json)")
+    args = parser.parse_args()
+
+    glosario: Dict[str, str] = {}
+    if os.path.exists(args.salida) and not args.forzar:
+        with open(args.salida, encoding="utf-8") as archivo:
+            glosario = json.load(archivo)
+
+    glosario = construir(glosario, args.forzar)
+    with open(args.salida, "w", encoding="utf-8") as archivo:
+        json.dump(glosario, archivo, ensure_ascii=False, indent=1)
+        archivo.write("\n")
+    print(f"Glosario con {len(glosario)} entradas escrito en {args.salida}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
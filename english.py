@@ -5,14 +5,17 @@ Aktionsart detector (EN version)
 import locale
 import logging
 import os
-import readline
-import subprocess
 import time
 import sys
 from dataclasses import dataclass
 from enum import Enum
-from typing import List, Optional, Sequence, Union
-import spacy
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+import clasificacion
+from cache_analisis import analizar_con_cache
+from conjugator_en import PERSONS, conjugate, repair_lemma
+from modelos import mostrar_tiempos, obtener_modelo_idioma, precargar_modelo_idioma, registrar_arranque
+from respuestas import ProveedorRespuestas, RespuestaNoDisponible, proveedor_actual, usar_proveedor
+from ritmo import pausa, procesar_argumento_ritmo
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -21,10 +24,14 @@ BOLD = '\033[1m'
 RESET = '\033[0m'
 
 # --- SPA_CY SETUP ---
-try:
-    nlp = spacy.load("en_core_web_sm")
-except OSError:
-    nlp = None
+# Shared model registry (size set with VENDLER_MODELO_EN, see modelos.py);
+# if the model cannot be loaded the program falls back to manual entry.
+SPACY_LANGUAGE = "en"
+
+
+def get_nlp(profile: Optional[str] = None):
+    return obtener_modelo_idioma(SPACY_LANGUAGE, profile)
+
 
 # ------------------------- Config -------------------------
 LS_SCRIPT = "ls_en.py" 
@@ -59,6 +66,15 @@ class Features:
     telic: bool = False
     dynamic: bool = False
 
+    @property
+    def mask(self) -> int:
+        """Features packed into 5 bits (see clasificacion.RASGOS); index into AKTIONSART_TABLE."""
+        return clasificacion.a_mascara(self.causative, self.stative, self.punctual, self.telic, self.dynamic)
+
+    @classmethod
+    def from_mask(cls, mask: int) -> "Features":
+        return cls(*clasificacion.desde_mascara(mask))
+
 
 @dataclass
 class ClauseData:
@@ -71,142 +87,20 @@ class ClauseData:
     got_forms: bool = False
 
 
+# ClauseData fields filled in by the automatic analysis
+ANALYSIS_FIELDS = ("infinitive", "gerund", "participle", "person_number", "subject", "postverbal")
+
+
 # Auxiliaries for English agreement
-BE_PRESENT = {
-    '1s': "am", '2s': "are", '3s': "is",
-    '1p': "are", '2p': "are", '3p': "are"
-}
-
-BE_PAST = {
-    '1s': "was", '2s': "were", '3s': "was",
-    '1p': "were", '2p': "were", '3p': "were"
-}
-
-HAVE_PRESENT = {
-    '1s': "have", '2s': "have", '3s': "has",
-    '1p': "have", '2p': "have", '3p': "have"
-}
-
-# --- IRREGULAR VERBS DICTIONARY ---
-# Maps Infinitive -> {ger: Gerund, pp: Past Participle}
-# Note: We map the most common irregulars to ensure correct test formation.
-IRREGULARS = {
-    "be": {"ger": "being", "pp": "been"},
-    "have": {"ger": "having", "pp": "had"},
-    "do": {"ger": "doing", "pp": "done"},
-    "go": {"ger": "going", "pp": "gone"},
-    "say": {"ger": "saying", "pp": "said"},
-    "make": {"ger": "making", "pp": "made"},
-    "get": {"ger": "getting", "pp": "gotten"},
-    "know": {"ger": "knowing", "pp": "known"},
-    "think": {"ger": "thinking", "pp": "thought"},
-    "take": {"ger": "taking", "pp": "taken"},
-    "see": {"ger": "seeing", "pp": "seen"},
-    "come": {"ger": "coming", "pp": "come"},
-    "want": {"ger": "wanting", "pp": "wanted"},
-    "look": {"ger": "looking", "pp": "looked"},
-    "use": {"ger": "using", "pp": "used"},
-    "find": {"ger": "finding", "pp": "found"},
-    "give": {"ger": "giving", "pp": "given"},
-    "tell": {"ger": "telling", "pp": "told"},
-    "work": {"ger": "working", "pp": "worked"},
-    "call": {"ger": "calling", "pp": "called"},
-    "try": {"ger": "trying", "pp": "tried"},
-    "ask": {"ger": "asking", "pp": "asked"},
-    "need": {"ger": "needing", "pp": "needed"},
-    "feel": {"ger": "feeling", "pp": "felt"},
-    "become": {"ger": "becoming", "pp": "become"},
-    "leave": {"ger": "leaving", "pp": "left"},
-    "put": {"ger": "putting", "pp": "put"},
-    "mean": {"ger": "meaning", "pp": "meant"},
-    "keep": {"ger": "keeping", "pp": "kept"},
-    "let": {"ger": "letting", "pp": "let"},
-    "begin": {"ger": "beginning", "pp": "begun"},
-    "seem": {"ger": "seeming", "pp": "seemed"},
-    "help": {"ger": "helping", "pp": "helped"},
-    "talk": {"ger": "talking", "pp": "talked"},
-    "turn": {"ger": "turning", "pp": "turned"},
-    "start": {"ger": "starting", "pp": "started"},
-    "show": {"ger": "showing", "pp": "shown"},
-    "hear": {"ger": "hearing", "pp": "heard"},
-    "play": {"ger": "playing", "pp": "played"},
-    "run": {"ger": "running", "pp": "run"},
-    "move": {"ger": "moving", "pp": "moved"},
-    "live": {"ger": "living", "pp": "lived"},
-    "believe": {"ger": "believing", "pp": "believed"},
-    "bring": {"ger": "bringing", "pp": "brought"},
-    "happen": {"ger": "happening", "pp": "happened"},
-    "write": {"ger": "writing", "pp": "written"},
-    "sit": {"ger": "sitting", "pp": "sat"},
-    "stand": {"ger": "standing", "pp": "stood"},
-    "lose": {"ger": "losing", "pp": "lost"},
-    "pay": {"ger": "paying", "pp": "paid"},
-    "meet": {"ger": "meeting", "pp": "met"},
-    "include": {"ger": "including", "pp": "included"},
-    "continue": {"ger": "continuing", "pp": "continued"},
-    "set": {"ger": "setting", "pp": "set"},
-    "learn": {"ger": "learning", "pp": "learned"},
-    "change": {"ger": "changing", "pp": "changed"},
-    "lead": {"ger": "leading", "pp": "led"},
-    "understand": {"ger": "understanding", "pp": "understood"},
-    "watch": {"ger": "watching", "pp": "watched"},
-    "follow": {"ger": "following", "pp": "followed"},
-    "stop": {"ger": "stopping", "pp": "stopped"},
-    "create": {"ger": "creating", "pp": "created"},
-    "speak": {"ger": "speaking", "pp": "spoken"},
-    "read": {"ger": "reading", "pp": "read"},
-    "allow": {"ger": "allowing", "pp": "allowed"},
-    "add": {"ger": "adding", "pp": "added"},
-    "spend": {"ger": "spending", "pp": "spent"},
-    "grow": {"ger": "growing", "pp": "grown"},
-    "open": {"ger": "opening", "pp": "opened"},
-    "walk": {"ger": "walking", "pp": "walked"},
-    "win": {"ger": "winning", "pp": "won"},
-    "offer": {"ger": "offering", "pp": "offered"},
-    "remember": {"ger": "remembering", "pp": "remembered"},
-    "love": {"ger": "loving", "pp": "loved"},
-    "consider": {"ger": "considering", "pp": "considered"},
-    "appear": {"ger": "appearing", "pp": "appeared"},
-    "buy": {"ger": "buying", "pp": "bought"},
-    "wait": {"ger": "waiting", "pp": "waited"},
-    "serve": {"ger": "serving", "pp": "served"},
-    "die": {"ger": "dying", "pp": "died"},
-    "send": {"ger": "sending", "pp": "sent"},
-    "expect": {"ger": "expecting", "pp": "expected"},
-    "build": {"ger": "building", "pp": "built"},
-    "stay": {"ger": "staying", "pp": "stayed"},
-    "fall": {"ger": "falling", "pp": "fallen"},
-    "cut": {"ger": "cutting", "pp": "cut"},
-    "reach": {"ger": "reaching", "pp": "reached"},
-    "kill": {"ger": "killing", "pp": "killed"},
-    "remain": {"ger": "remaining", "pp": "remained"},
-    "suggest": {"ger": "suggesting", "pp": "suggested"},
-    "raise": {"ger": "raising", "pp": "raised"},
-    "pass": {"ger": "passing", "pp": "passed"},
-    "sell": {"ger": "selling", "pp": "sold"},
-    "require": {"ger": "requiring", "pp": "required"},
-    "report": {"ger": "reporting", "pp": "reported"},
-    "decide": {"ger": "deciding", "pp": "decided"},
-    "pull": {"ger": "pulling", "pp": "pulled"},
-    "break": {"ger": "breaking", "pp": "broken"},
-    "teach": {"ger": "teaching", "pp": "taught"},
-    "eat": {"ger": "eating", "pp": "eaten"},
-    "drive": {"ger": "driving", "pp": "driven"},
-    "drink": {"ger": "drinking", "pp": "drunk"},
-    "sing": {"ger": "singing", "pp": "sung"},
-    "swim": {"ger": "swimming", "pp": "swum"},
-    "fly": {"ger": "flying", "pp": "flown"},
-    "draw": {"ger": "drawing", "pp": "drawn"},
-    "forget": {"ger": "forgetting", "pp": "forgotten"},
-    "hit": {"ger": "hitting", "pp": "hit"},
-    "catch": {"ger": "catching", "pp": "caught"},
-    "sleep": {"ger": "sleeping", "pp": "slept"},
-    "throw": {"ger": "throwing", "pp": "thrown"},
-    "wake": {"ger": "waking", "pp": "woken"},
-    "wear": {"ger": "wearing", "pp": "worn"},
-    "choose": {"ger": "choosing", "pp": "chosen"},
-    "hide": {"ger": "hiding", "pp": "hidden"},
-}
+def _auxiliary_table(verb: str, tense: str) -> Dict[str, str]:
+    """Person forms of an auxiliary in «tense»."""
+    return dict(zip(PERSONS, conjugate(verb, "").tenses[tense]))
+
+
+# The model is given so that the lexicon is not loaded at import time
+BE_PRESENT = _auxiliary_table("be", "present")
+BE_PAST = _auxiliary_table("be", "past")
+HAVE_PRESENT = _auxiliary_table("have", "present")
 
 
 def set_english_locale():
@@ -228,43 +122,45 @@ def restart_message() -> None:
     print("Please review your answers carefully.")
 
 
-def prompt_user(prompt: str) -> str:
-    readline.set_startup_hook(lambda: readline.insert_text(""))
-    try:
-        if "\n" in prompt or len(prompt) > 60:
-            print(prompt, end="", flush=True)
-            user = input().strip()
-        else:
-            user = input(prompt).strip()
-        return user.encode('utf-8').decode('utf-8')
-    finally:
-        readline.set_startup_hook()
+def prompt_user(prompt: str, key: str = "") -> str:
+    return proveedor_actual().responder(key, prompt)
+
+
+def invalid_answer(ans: str, key: str, message: str) -> None:
+    # A non-interactive provider cannot correct itself: asking again would loop forever
+    if not proveedor_actual().interactivo:
+        raise RespuestaNoDisponible(f"Invalid answer '{ans}' for question '{key}'.")
+    print(message)
 
 
-def yes_no(question: str) -> bool:
+def yes_no(question: str, key: str = "") -> bool:
     while True:
         try:
-            ans = prompt_user(question).lower()
+            ans = prompt_user(question, key).lower()
             if ans in Answer.YES.value:
                 return True
             elif ans in Answer.NO.value:
                 return False
-            print("\nPlease answer 'yes (y)' or 'no (n)'.")
+            invalid_answer(ans, key, "\nPlease answer 'yes (y)' or 'no (n)'.")
+        except (RespuestaNoDisponible, EOFError):
+            raise
         except Exception as e:
             logging.error(f"Error getting answer: {e}")
 
 
-def multiple_choice(question: str, options: Sequence[Union[str, Sequence[str]]], suffix: str) -> str:
+def multiple_choice(question: str, options: Sequence[Union[str, Sequence[str]]], suffix: str, key: str = "") -> str:
     while True:
         try:
-            ans = prompt_user(f"{question} {suffix}").lower()
+            ans = prompt_user(f"{question} {suffix}", key).lower()
             for opt in options:
                 if isinstance(opt, Sequence) and not isinstance(opt, str):
                     if ans in opt:
                         return opt[0]
                 elif ans == opt:
                     return opt
-            print("\nPlease type a valid option.")
+            invalid_answer(ans, key, "\nPlease type a valid option.")
+        except (RespuestaNoDisponible, EOFError):
+            raise
         except Exception as e:
             logging.error(f"Error getting answer: {e}")
 
@@ -273,53 +169,13 @@ def multiple_choice(question: str, options: Sequence[Union[str, Sequence[str]]],
 
 def generate_english_forms(lemma: str):
     """
-    Generates Gerund and Past Participle using dictionary + heuristic rules.
+    Generates Gerund and Past Participle from the conjugation tables (see conjugator_en).
     """
-    lemma = lemma.lower().strip()
-    
-    # 1. Check dictionary
-    if lemma in IRREGULARS:
-        return IRREGULARS[lemma]["ger"], IRREGULARS[lemma]["pp"]
-    
-    # 2. Regular Rules
-    # Gerund
-    if lemma.endswith("ie"):
-        ger = lemma[:-2] + "ying" # die -> dying
-    elif lemma.endswith("e") and not lemma.endswith("ee"):
-        ger = lemma[:-1] + "ing" # make -> making
-    else:
-        # CONSONANT DOUBLING RULE
-        
-        is_cvc = (len(lemma) > 2 
-                  and lemma[-1] not in "aeiouwyx" 
-                  and lemma[-2] in "aeiou" 
-                  and lemma[-3] not in "aeiou")
-        
-        is_unstressed_ending = lemma.endswith(("er", "en", "el", "it")) 
-        
-        if is_cvc and not is_unstressed_ending:
-             ger = lemma + lemma[-1] + "ing"
-        else:
-             ger = lemma + "ing"
-             
-    # Past Participle (Regular)
-    if lemma.endswith("e"):
-        pp = lemma + "d"
-    else:
-        # Same doubling logic
-        is_cvc = (len(lemma) > 2 
-                  and lemma[-1] not in "aeiouwyx" 
-                  and lemma[-2] in "aeiou" 
-                  and lemma[-3] not in "aeiou")
-        
-        is_unstressed_ending = lemma.endswith(("er", "en", "el", "it"))
-
-        if is_cvc and not is_unstressed_ending:
-             pp = lemma + lemma[-1] + "ed"
-        else:
-             pp = lemma + "ed"
-             
-    return ger, pp
+    try:
+        paradigm = conjugate(lemma)
+    except ValueError:
+        return "", ""
+    return paradigm.gerund, paradigm.past_participle
 
 def detect_person_number(doc, verb_token, idx):
     """
@@ -359,9 +215,17 @@ def analyze_automatically(clause, data):
     Uses spaCy to analyze the clause structure and morphology.
     Returns: (Success, Conjugated_Verb, Clean_Lemma)
     """
+    nlp = get_nlp()
     if not nlp: return False, "", ""
-    
-    doc = nlp(clause)
+
+    # Clauses repeated in the session skip spaCy (see cache_analisis)
+    return analizar_con_cache(nlp, clause, data, analyze_doc, ANALYSIS_FIELDS)
+
+def analyze_doc(doc, data):
+    """
+    Heuristics of analyze_automatically over an already parsed Doc.
+    Returns: (Success, Conjugated_Verb, Clean_Lemma)
+    """
     verb_token = None
     
     # 1. Search for ROOT Verb/Aux
@@ -387,12 +251,9 @@ def analyze_automatically(clause, data):
     if not verb_token: return False, "", ""
     
     # Get Lemma and Forms
-    lemma = verb_token.lemma_.lower()
-    
-    # Emergency patch for 'ran' -> 'ran' lemma issue in small models
-    if lemma == verb_token.text.lower():
-        # Common mistake with strong verbs if model is uncertain
-        pass
+    # Small models often leave strong verbs unlemmatized ('ran' -> 'ran'): the reverse
+    # index of irregular forms gives the infinitive back before the rules are applied
+    lemma = repair_lemma(verb_token.text, verb_token.lemma_)
 
     ger, pp = generate_english_forms(lemma)
     
@@ -442,26 +303,26 @@ def collect_clause_info(clause: str, data: ClauseData) -> ClauseData:
         print(f"• After verb:       «{data.postverbal if data.postverbal else 'Ø'}»")
         print("="*50)
         
-        if yes_no("\nIs this analysis correct? (y/n): "):
+        if yes_no("\nIs this analysis correct? (y/n): ", "analysis_correct"):
             data.got_forms = True
             return data
         else:
             print("\nUnderstood. Switching to manual entry.")
 
     # --- MANUAL FALLBACK ---
-    data.gerund = prompt_user(f"\nType the GERUND of the verb in '{clause}' (e.g., 'melting', 'telling'): ")
-    data.participle = prompt_user(f"Type the PAST PARTICIPLE (e.g., 'melted', 'told'): ")
+    data.gerund = prompt_user(f"\nType the GERUND of the verb in '{clause}' (e.g., 'melting', 'telling'): ", "gerund")
+    data.participle = prompt_user(f"Type the PAST PARTICIPLE (e.g., 'melted', 'told'): ", "participle")
     
-    subj_in = prompt_user(f"Type everything that comes BEFORE the verb in '{clause}' (0 if nothing): ")
+    subj_in = prompt_user(f"Type everything that comes BEFORE the verb in '{clause}' (0 if nothing): ", "subject")
     data.subject = "" if subj_in == "0" else subj_in
     
-    post_in = prompt_user(f"Type everything that comes AFTER the verb in '{clause}' (0 if nothing): ")
+    post_in = prompt_user(f"Type everything that comes AFTER the verb in '{clause}' (0 if nothing): ", "postverbal")
     data.postverbal = "" if post_in == "0" else post_in
     
     pn_question = "Type the person and number of the verb"
     pn_suffix = "(1s/2s/3s/1p/2p/3p): "
     pn_options: List[str] = ['1s', '2s', '3s', '1p', '2p', '3p']
-    data.person_number = multiple_choice(pn_question, pn_options, pn_suffix)
+    data.person_number = multiple_choice(pn_question, pn_options, pn_suffix, "person_number")
     
     data.got_forms = True
     return data
@@ -493,7 +354,7 @@ def causativity_test(clause: str) -> bool:
     print(f"\nTry to paraphrase '{clause}' following these models: ")
     print("• The cat broke the vase → The cat CAUSED the vase to break")
     print("• Ana gave Pepe a book → Ana CAUSED Pepe to have a book")
-    paraphrase = prompt_user("\nType your paraphrase (or '0' if not possible): ")
+    paraphrase = prompt_user("\nType your paraphrase (or '0' if not possible): ", "causative_paraphrase")
     if paraphrase == '0' or not paraphrase.strip():
         return False
     print("\nConsider the following:")
@@ -501,12 +362,12 @@ def causativity_test(clause: str) -> bool:
     print(f"• '{cap}' should preserve the meaning of '{clause}'.")
     print(f"• '{cap}' must not add new arguments nor duplicate existing ones in '{clause}'.")
     print("• Exclude consumption ('eat an apple') and creation ('write a story') readings.")
-    return yes_no(f"\nDoes '{cap}' meet these criteria? (y/n): ")
+    return yes_no(f"\nDoes '{cap}' meet these criteria? (y/n): ", "causativity")
 
 
 def get_basic_event() -> str:
     while True:
-        ev = prompt_user("\nType the resulting event/state without the cause (e.g., 'the vase broke', 'Pepe has a book').\nIf none comes to mind, type '0': ")
+        ev = prompt_user("\nType the resulting event/state without the cause (e.g., 'the vase broke', 'Pepe has a book').\nIf none comes to mind, type '0': ", "basic_event")
         if ev == "0" or ev.strip():
             return ev
         print("\nPlease enter a valid clause or '0'.")
@@ -518,7 +379,7 @@ def stativity_test(clause: str) -> bool:
         f"\nConsider the following dialogue:"
         f"\n— What happened a moment ago / yesterday / last month?"
         f"\n— {clause[0].upper() + clause[1:]}."
-        f"\n\nDo you think '{clause}' is a good answer to that question (for at least one time option)? (y/n): ")
+        f"\n\nDo you think '{clause}' is a good answer to that question (for at least one time option)? (y/n): ", "stativity")
 
 
 def dynamicity_test(data: ClauseData) -> bool:
@@ -526,7 +387,7 @@ def dynamicity_test(data: ClauseData) -> bool:
     print("\nDYNAMICITY TEST")
     return yes_no(
         f"\nConsider: '{prog[0].upper() + prog[1:]} vigorously / forcefully / with effort'."
-        f"\nIs this acceptable with at least one of the options? (y/n): ")
+        f"\nIs this acceptable with at least one of the options? (y/n): ", "dynamicity")
 
 
 def punctuality_test(data: ClauseData) -> bool:
@@ -534,7 +395,7 @@ def punctuality_test(data: ClauseData) -> bool:
     print("\nPUNCTUALITY TEST")
     return yes_no(
         f"\nConsider: '{prog_past[0].upper() + prog_past[1:]} for an hour / for a month'."
-        f"\nIs this expression acceptable (with at least one option) WITHOUT forcing an iterative or imminent reading? (y/n): ")
+        f"\nIs this expression acceptable (with at least one option) WITHOUT forcing an iterative or imminent reading? (y/n): ", "punctuality")
 
 
 def telicity_test(data: ClauseData) -> bool:
@@ -544,7 +405,7 @@ def telicity_test(data: ClauseData) -> bool:
     print("\nTELICITY TEST")
     q = (f"\nImagine that {prog} and suddenly {stop_expr}."
          f"\nWould it then be true to say: '{perfect}'? (y/n): ")
-    return not yes_no(q)
+    return not yes_no(q, "telicity")
 
 
 # ------------------------- Classification -------------------------
@@ -568,7 +429,7 @@ def determine_subtype(feats: Features) -> Optional[str]:
         return None
 
 
-def determine_aktionsart(feats: Features) -> Optional[Aktionsart]:
+def _aktionsart_from_rules(feats: Features) -> Optional[Aktionsart]:
     sub = determine_subtype(feats)
     if sub is None:
         return None
@@ -578,6 +439,25 @@ def determine_aktionsart(feats: Features) -> Optional[Aktionsart]:
         return Aktionsart[sub]
 
 
+# Aktionsart of each of the 32 feature combinations, computed once from the rules above
+AKTIONSART_TABLE = clasificacion.construir_tabla(lambda mask: _aktionsart_from_rules(Features.from_mask(mask)))
+AKTIONSARTS = tuple(Aktionsart)
+AKTIONSART_CODES = clasificacion.codigos_tabla(AKTIONSART_TABLE, AKTIONSARTS)
+
+
+def determine_aktionsart(feats: Features) -> Optional[Aktionsart]:
+    return AKTIONSART_TABLE[feats.mask]
+
+
+def classify_batch(features):
+    """
+    Classifies a whole batch of features at once (an n x 5 matrix in Features order, or an
+    array of masks) and returns indices into AKTIONSARTS (-1 where there is no aktionsart).
+    Requires NumPy.
+    """
+    return clasificacion.clasificar_lote(features, AKTIONSART_CODES)
+
+
 def verify_adjuncts_cleanup(clause: str) -> str:
     """
     Asks the user to verify if the clause is free of adjuncts
@@ -590,10 +470,10 @@ def verify_adjuncts_cleanup(clause: str) -> str:
     print("• Manner expressions (e.g., 'quickly', 'well', 'with calm')")
     print("• Negation (e.g., 'not', 'never')")
     
-    if yes_no("\nDoes your clause contain any of these elements? (y/n): "):
-        clean_clause = prompt_user(f"\nPlease type '{clause}' again WITHOUT those elements (e.g., 'Peter ran' instead of 'Peter never ran yesterday'): ")
+    if yes_no("\nDoes your clause contain any of these elements? (y/n): ", "adjuncts"):
+        clean_clause = prompt_user(f"\nPlease type '{clause}' again WITHOUT those elements (e.g., 'Peter ran' instead of 'Peter never ran yesterday'): ", "clean_clause")
         while not clean_clause.strip():
-            clean_clause = prompt_user("You didn't type anything. Try again: ")
+            clean_clause = prompt_user("You didn't type anything. Try again: ", "clean_clause")
         return clean_clause
     return clause
 
@@ -617,34 +497,46 @@ def obtain_features(clause: str, data: ClauseData) -> Union[Features, None]:
         feats.causative = False
         print(f"\n{BOLD}Predicate is [-causative]{RESET}")
 
-    time.sleep(0.5)
+    pausa(0.5)
     clause = verify_adjuncts_cleanup(clause)
 
-    time.sleep(0.5)
+    pausa(0.5)
     collect_clause_info(clause, data)
 
-    time.sleep(0.5)
+    pausa(0.5)
     feats.stative = stativity_test(clause)
     print(f"\n{BOLD}Predicate is [{'+' if feats.stative else '-'}stative]{RESET}")
-    time.sleep(0.5)
+    pausa(0.5)
 
     if not feats.stative:
         # Punctuality: if it is NOT compatible with durational for-phrases in past progressive → punctual = True
         feats.punctual = not punctuality_test(data)
         print(f"\n{BOLD}Predicate is [{'+' if feats.punctual else '-'}punctual]{RESET}")
-        time.sleep(0.5)
+        pausa(0.5)
 
         feats.telic = telicity_test(data)
         print(f"\n{BOLD}Predicate is [{'+' if feats.telic else '-'}telic]{RESET}")
-        time.sleep(0.5)
+        pausa(0.5)
 
         feats.dynamic = dynamicity_test(data)
         print(f"\n{BOLD}Predicate is [{'+' if feats.dynamic else '-'}dynamic]{RESET}")
-        time.sleep(0.5)
+        pausa(0.5)
 
     return feats
 
 
+def classify_predicate(clause: str, provider: ProveedorRespuestas) -> Tuple[Optional[Aktionsart], Optional[Features], ClauseData]:
+    """
+    Run every diagnostic on 'clause' taking the answers from 'provider', without user input.
+    Returns the aktionsart (or None), the features and the clause data.
+    """
+    data = ClauseData()
+    with usar_proveedor(provider):
+        feats = obtain_features(clause, data)
+    akt = determine_aktionsart(feats) if feats is not None else None
+    return akt, feats, data
+
+
 def show_result(original_clause: str, akt: Aktionsart, feats: Features) -> None:
     print("\nRESULT")
     print(f"\n{BOLD}The aktionsart of the predicate in '{original_clause}' is {akt.value.upper()}.{RESET}")
@@ -679,6 +571,8 @@ def run_ls(akt: Aktionsart, original_clause: str, is_dynamic: bool) -> None:
     """
     Call the logical structure module (ls_en.py).
     """
+    import subprocess
+
     try:
         dyn_str = "dynamic" if is_dynamic else "non_dynamic"
         cmd = [sys.executable, "-u", LS_SCRIPT, akt.value, original_clause, dyn_str]
@@ -690,9 +584,13 @@ def run_ls(akt: Aktionsart, original_clause: str, is_dynamic: bool) -> None:
 
 
 def main() -> None:
+    start = time.perf_counter()
+    # The model is only needed after the causativity test and the adjunct cleanup
+    precargar_modelo_idioma(SPACY_LANGUAGE)
     set_english_locale()
     clear_console()
     print("\nThis program will help you identify the aktionsart of the main predicate in a clause.")
+    registrar_arranque("english", start)
 
     while True:
         try:
@@ -700,7 +598,8 @@ def main() -> None:
                 "\nPlease type a clause with the verb you want to test"
                 "\nconjugated in the SIMPLE PAST (e.g., 'Peter ran home')."
                 "\nIf it sounds very odd, type it in PRESENT (e.g., 'Mary knows English')."
-                "\n\nClause: "
+                "\n\nClause: ",
+                "clause"
             )
 
             if not original:
@@ -719,24 +618,32 @@ def main() -> None:
                 continue
             show_result(original, akt, feats)
 
-            if not yes_no("\nDo you want to identify the aktionsart of another predicate? (y/n): "):
+            if not yes_no("\nDo you want to identify the aktionsart of another predicate? (y/n): ", "another_predicate"):
+                # Return to the caller (the main menu loop) instead of launching a new menu process
                 print("\nReturning to main menu...")
-                time.sleep(1)
-                try:
-                    subprocess.run([sys.executable, "main.py"], check=True)
-                except FileNotFoundError:
-                    print("Error: main.py not found in the current directory.")
-                except subprocess.CalledProcessError as e:
-                    print(f"Error running main.py: {e}")
+                mostrar_tiempos()
+                pausa(1)
                 return
             else:
-                time.sleep(0.5)
+                pausa(0.5)
                 clear_console()
 
+        except EOFError:
+            # Redirected input ran out: there are no more clauses to analyze
+            return
         except Exception as e:
             logging.error(f"\nUnexpected error: {e}")
             print("\nAn error occurred. Please, try again.")
 
 
+def run() -> None:
+    """Entry point for the main menu (main.py)."""
+    main()
+
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    procesar_argumento_ritmo(sys.argv[1:])
+    run()
+    # Started on its own: hand over to the main menu in this same process
+    import main as menu
+    menu.main()
\ No newline at end of file
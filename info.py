@@ -34,5 +34,11 @@ https://creativecommons.org/licenses/by-nc-sa/4.0/deed.es
 
     input("\nAprieta Enter para volver al menú principal... ")
 
-if __name__ == "__main__":
+
+def run():
+    """Punto de entrada para el menú principal (main.py)."""
     main()
+
+
+if __name__ == "__main__":
+    run()
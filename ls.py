@@ -2,13 +2,24 @@
 import locale
 import logging
 import os
-import readline
-import subprocess
 import sys
-import time
 import typing
-import re
-from deep_translator import GoogleTranslator
+import json
+from contextlib import redirect_stdout
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from arbol_ls import (ANSI, Nodo, a_dict, causa, con_operadores, conjuncion, constantes, intencional, macrorol,
+                      modificador, predicado, proposito, reemplazar_constantes)
+from respuestas import (ProveedorReglas, ProveedorReproduccion, RespuestaNoDisponible, proveedor_actual, sugerencias,
+                        usar_proveedor)
+from ritmo import establecer_ritmo, pausa, procesar_argumento_ritmo
+
+# El traductor, la caché (sqlite3) y el hilo de traducción se importan al usarse por primera
+# vez: así ls.py arranca rápido cuando solo se pide la estructura en español o desde el menú
+if typing.TYPE_CHECKING:
+    from concurrent.futures import Future, ThreadPoolExecutor
+    from aktionsart import Aktionsart, DatosClause, RasgosPred
+    from cache_traduccion import CacheTraduccion
 
 # --- LISTA DE PROTECCIÓN: Palabras clave de RRG que NO deben traducirse ---
 RRG_KEYWORDS = {
@@ -21,8 +32,9 @@ RRG_KEYWORDS = {
     "move.down.from.reference.point", "not"
 }
 
-# Caché para no consultar a Google repetidamente por la misma palabra
-CACHE_TRADUCCION = {}
+# Caché persistente para no consultar a Google repetidamente por la misma palabra,
+# ni siquiera entre ejecuciones distintas del programa (se abre en obtener_cache)
+CACHE_TRADUCCION: typing.Optional["CacheTraduccion"] = None
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -226,6 +238,59 @@ VERBOS_PERCEPCION_IMPERSONAL = {
 }
 
 
+# --- ÍNDICE INVERTIDO DE CLASES VERBALES ---
+# Clase = (tabla, categoría); las tablas planas (listas o diccionarios verbo -> valor) no tienen categoría.
+ClaseVerbal = typing.Tuple[str, typing.Optional[str]]
+
+TABLAS_VERBOS = {
+    "VERBOS_MOVIMIENTO": VERBOS_MOVIMIENTO,
+    "VERBOS_METEOROLOGICOS": VERBOS_METEOROLOGICOS,
+    "VERBOS_TRANSFERENCIA": VERBOS_TRANSFERENCIA,
+    "VERBOS_DICCION": VERBOS_DICCION,
+    "VERBOS_TRI_NEG": VERBOS_TRI_NEG,
+    "VERBOS_POSESION": VERBOS_POSESION,
+    "VERBOS_EXISTENCIA": VERBOS_EXISTENCIA,
+    "VERBOS_PERCEPCION": VERBOS_PERCEPCION,
+    "VERBOS_PERCEPCION_IMPERSONAL": VERBOS_PERCEPCION_IMPERSONAL,
+}
+# Tablas cuyas claves son categorías (con su lista o diccionario de verbos), no verbos
+TABLAS_CON_CATEGORIAS = {"VERBOS_MOVIMIENTO", "VERBOS_TRANSFERENCIA", "VERBOS_DICCION", "VERBOS_TRI_NEG", "VERBOS_POSESION"}
+
+
+def construir_indice_verbos(tablas) -> typing.Mapping[str, typing.FrozenSet[ClaseVerbal]]:
+    """Devuelve un índice inmutable verbo -> conjunto de clases en las que aparece."""
+    indice: typing.Dict[str, typing.Set[ClaseVerbal]] = {}
+    for tabla, contenido in tablas.items():
+        if tabla in TABLAS_CON_CATEGORIAS:
+            grupos = [((tabla, categoria), verbos) for categoria, verbos in contenido.items()]
+        else:
+            grupos = [((tabla, None), contenido)]
+        for clase, verbos in grupos:
+            for verbo in verbos:
+                indice.setdefault(verbo, set()).add(clase)
+    return MappingProxyType({verbo: frozenset(clases) for verbo, clases in indice.items()})
+
+
+INDICE_VERBOS = construir_indice_verbos(TABLAS_VERBOS)
+# Verbos que pertenecen a más de una clase (ej: «pedir», «arrancar», «ofrecer»)
+SOLAPAMIENTOS = MappingProxyType({verbo: clases for verbo, clases in INDICE_VERBOS.items() if len(clases) > 1})
+
+
+def clases_verbo(verbo) -> typing.FrozenSet[ClaseVerbal]:
+    return INDICE_VERBOS.get(verbo, frozenset())
+
+
+def en_clase(verbo, tabla, categoria=None) -> bool:
+    return (tabla, categoria) in clases_verbo(verbo)
+
+
+def informe_solapamientos() -> typing.List[str]:
+    def nombre(clase):
+        return clase[0] if clase[1] is None else f"{clase[0]}[{clase[1]}]"
+    return [f"{verbo}: {', '.join(sorted(nombre(clase) for clase in clases))}"
+            for verbo, clases in sorted(SOLAPAMIENTOS.items())]
+
+
 def set_spanish_locale():
     spanish_locales = ['es_ES.UTF-8', 'es_CL.UTF-8', 'es_MX.UTF-8', 'es.UTF-8', '']
     for loc in spanish_locales:
@@ -240,104 +305,85 @@ def limpiar_consola():
     os.system('cls' if os.name == 'nt' else 'clear')
 
 
-def peticion(prompt: str) -> str:
-    readline.set_startup_hook(lambda: readline.insert_text(""))
-    try:
-        # Si el prompt es largo o multilínea, imprímelo y usa input() vacío
-        if "\n" in prompt or len(prompt) > 60:
-            print(prompt, end="", flush=True)
-            user = input().strip()   # cursor limpio, sin "> "
-        else:
-            user = input(prompt).strip()
-        return user.encode('utf-8').decode('utf-8')
-    finally:
-        readline.set_startup_hook()
+def peticion(prompt: str, clave: str = "") -> str:
+    return proveedor_actual().responder(clave, prompt)
+
 
+def respuesta_no_valida(respuesta: str, clave: str, mensaje: str) -> None:
+    # Un proveedor no interactivo no puede corregir su respuesta: repetir la pregunta sería un bucle infinito
+    if not proveedor_actual().interactivo:
+        raise RespuestaNoDisponible(f"Respuesta no válida «{respuesta}» para la pregunta «{clave}».")
+    print(mensaje)
 
-def input_si_no(prompt: str) -> bool:
+
+def input_si_no(prompt: str, clave: str = "") -> bool:
     validas = {'sí': True, 'si': True, 's': True, 'no': False, 'n': False}
     while True:
-        respuesta = peticion(prompt).lower().strip()
+        respuesta = peticion(prompt, clave).lower().strip()
         if respuesta in validas:
             return validas[respuesta]
-        print("Por favor, responde «sí (s)» o «no (n)».")
+        respuesta_no_valida(respuesta, clave or prompt.strip(), "Por favor, responde «sí (s)» o «no (n)».")
 
 
-def buscar_verbo(verbo, diccionario):
-    for categoria, verbos in diccionario.items():
-        if verbo in verbos:
+def buscar_verbo(verbo, tabla):
+    """Devuelve la primera categoría de «tabla» (en su orden de declaración) que contiene «verbo»."""
+    clases = clases_verbo(verbo)
+    for categoria in TABLAS_VERBOS[tabla]:
+        if (tabla, categoria) in clases:
             return categoria
     return None
 
 
-def añadir_operadores(estructura_logica):
-    # Definición de Estilos ANSI 
-    ITALICA = "\033[3m"
-    ATENUADO = "\033[2m"
-    RESET = "\033[0m"
-
-    if input_si_no("\n¿Quieres añadir operadores a la estructura lógica? (s/n): "):
-        print("\nOperadores clausulares:")
-        for i, op in enumerate(OPERADORES[:4], 1):
-            print(f"{i}. {op.descripcion}")
-        print("\nOperadores centrales:")
-        for i, op in enumerate(OPERADORES[4:8], 5):
-            print(f"{i}. {op.descripcion}")
-        print("\nOperadores nucleares:")
-        for i, op in enumerate(OPERADORES[8:], 9):
-            print(f"{i}. {op.descripcion}")
-        print("\nEscribe el número del operador que quieras incluir y aprieta «Enter» para seleccionarlo.")
-        print("Escribe «0» cuando quieras terminar la selección.\n")
-        
-        operadores_seleccionados = []
-        operadores_ya_seleccionados = set()
-        
-        while True:
-            seleccion = peticion("Número del operador (o «0» para terminar): ")
-            if seleccion == '0':
-                print()
-                break
-            try:
-                num = int(seleccion)
-                if num < 1 or num > len(OPERADORES):
-                    raise ValueError(f"El número debe estar entre 1 y {len(OPERADORES)}")
-                if num in operadores_ya_seleccionados:
-                    print(f"El operador «{OPERADORES[num-1].descripcion}» ya ha sido seleccionado. Por favor, elige otro.")
-                    continue
-                operadores_seleccionados.append(OPERADORES[num-1])
-                operadores_ya_seleccionados.add(num)
-                print(f"Se añadirá el operador {OPERADORES[num-1].descripcion}.")
-            except ValueError:
-                print("Entrada inválida. Por favor, escribe un número entre 1 y 11. Si quieres terminar la selección, escribe «0».")
-        
-        operadores_seleccionados.sort(key=lambda op: OPERADORES.index(op))
-        
-        estructura_logica = f"[{estructura_logica}]"
-        
-        operadores_con_valores = []
-        for op in operadores_seleccionados:
-            if op.requiere_valor:
-                valor = peticion(f"Escribe el valor para {op.descripcion} (ej: {op.ejemplos}): ").upper()
-                if op.codigo == 'STA' and valor == 'NEG':
-                    valor = 'NEG +'
-                operadores_con_valores.append((op.codigo, valor))
-            else:
-                operadores_con_valores.append((op.codigo, None))
-        
-        for codigo, valor in reversed(operadores_con_valores):
-            # Formato para la CATEGORÍA (TNS, ASP...) -> Atenuado
-            cat_fmt = f"{ATENUADO}{codigo}{RESET}"
-            
-            if valor is not None:
-                # Formato para el VALOR (PAST, PROG...) -> Itálica
-                val_fmt = f"{ITALICA}{valor}{RESET}"
-                estructura_logica = f"<{cat_fmt} {val_fmt} {estructura_logica}>"
-            else:
-                estructura_logica = f"<{cat_fmt} {estructura_logica}>"
-        
-        print(f"\nLa estructura lógica con operadores es: {estructura_logica}")
+def seleccionar_operadores() -> typing.List[typing.Tuple[str, typing.Optional[str]]]:
+    """Pregunta qué operadores añadir y con qué valores. Devuelve pares (código, valor)."""
+    if not input_si_no("\n¿Quieres añadir operadores a la estructura lógica? (s/n): ", "operadores"):
+        return []
+
+    print("\nOperadores clausulares:")
+    for i, op in enumerate(OPERADORES[:4], 1):
+        print(f"{i}. {op.descripcion}")
+    print("\nOperadores centrales:")
+    for i, op in enumerate(OPERADORES[4:8], 5):
+        print(f"{i}. {op.descripcion}")
+    print("\nOperadores nucleares:")
+    for i, op in enumerate(OPERADORES[8:], 9):
+        print(f"{i}. {op.descripcion}")
+    print("\nEscribe el número del operador que quieras incluir y aprieta «Enter» para seleccionarlo.")
+    print("Escribe «0» cuando quieras terminar la selección.\n")
     
-    return estructura_logica
+    operadores_seleccionados = []
+    operadores_ya_seleccionados = set()
+    
+    while True:
+        seleccion = peticion("Número del operador (o «0» para terminar): ", "operador")
+        if seleccion == '0':
+            print()
+            break
+        try:
+            num = int(seleccion)
+            if num < 1 or num > len(OPERADORES):
+                raise ValueError(f"El número debe estar entre 1 y {len(OPERADORES)}")
+            if num in operadores_ya_seleccionados:
+                respuesta_no_valida(seleccion, "operador", f"El operador «{OPERADORES[num-1].descripcion}» ya ha sido seleccionado. Por favor, elige otro.")
+                continue
+            operadores_seleccionados.append(OPERADORES[num-1])
+            operadores_ya_seleccionados.add(num)
+            print(f"Se añadirá el operador {OPERADORES[num-1].descripcion}.")
+        except ValueError:
+            respuesta_no_valida(seleccion, "operador", "Entrada inválida. Por favor, escribe un número entre 1 y 11. Si quieres terminar la selección, escribe «0».")
+    
+    operadores_seleccionados.sort(key=lambda op: OPERADORES.index(op))
+    
+    operadores_con_valores = []
+    for op in operadores_seleccionados:
+        if op.requiere_valor:
+            valor = peticion(f"Escribe el valor para {op.descripcion} (ej: {op.ejemplos}): ", f"valor_{op.codigo.lower()}").upper()
+            if op.codigo == 'STA' and valor == 'NEG':
+                valor = 'NEG +'
+            operadores_con_valores.append((op.codigo, valor))
+        else:
+            operadores_con_valores.append((op.codigo, None))
+    return operadores_con_valores
 
 
 def verificar_dinamicidad(AKT, oracion_original):
@@ -346,35 +392,35 @@ def verificar_dinamicidad(AKT, oracion_original):
     elif AKT in ["estado", "estado causativo", "realización causativa", "proceso causativo"]:
         return False
     elif AKT in ["logro", "semelfactivo"]:
-        return input_si_no(f"\n¿«{oracion_original[0].upper() + oracion_original[1:]}» es compatible con expresiones como «enérgicamente», «con fuerza» o «con ganas»? (s/n): ")
+        return input_si_no(f"\n¿«{oracion_original[0].upper() + oracion_original[1:]}» es compatible con expresiones como «enérgicamente», «con fuerza» o «con ganas»? (s/n): ", "dinamicidad")
     elif AKT in ["logro causativo", "semelfactivo causativo"]:
-        clausula = peticion("\nEscribe el evento resultante de la cláusula, sin el segmento causativo.\nEjs: «el jarrón se rompió», «Ana recibió un regalo»: ")
-        return input_si_no(f"\n¿Es «{clausula}» compatible con expresiones como «enérgicamente», «con fuerza» o «con ganas»? (s/n): ")
+        clausula = peticion("\nEscribe el evento resultante de la cláusula, sin el segmento causativo.\nEjs: «el jarrón se rompió», «Ana recibió un regalo»: ", "evento_resultante")
+        return input_si_no(f"\n¿Es «{clausula}» compatible con expresiones como «enérgicamente», «con fuerza» o «con ganas»? (s/n): ", "dinamicidad")
     return None
     
 
 def aplicar_DO(oracion_original, x, estructura_logica, es_dinamico, AKT):
     if estructura_logica is None:
         return None
-    if (es_dinamico or "causativ" in AKT) and input_si_no(f"¿La acción de «{oracion_original}» fue efectuada intencionalmente por «{x}»? (s/n): "):
-        return f"DO ({estructura_logica})"
+    if (es_dinamico or "causativ" in AKT) and input_si_no(f"¿La acción de «{oracion_original}» fue efectuada intencionalmente por «{x}»? (s/n): ", "intencional"):
+        return intencional(estructura_logica)
     return estructura_logica
 
 
 def verificar_percepcion(pred):
-    if input_si_no(f"¿«{pred[0].upper() + pred[1:]}» indica un tipo de percepción sensorial? (s/n): "):
+    if input_si_no(f"¿«{pred[0].upper() + pred[1:]}» indica un tipo de percepción sensorial? (s/n): ", "percepcion"):
         pred_lower = pred.lower()
-        if pred_lower in VERBOS_PERCEPCION:
+        if en_clase(pred_lower, "VERBOS_PERCEPCION"):
             nuevo_pred = VERBOS_PERCEPCION[pred_lower]
         else:
             sentidos = {"1": "see", "2": "hear", "3": "smell", "4": "taste", "5": "feel"}
             while True:
-                sentido = peticion("Indica el sentido involucrado:\n(1) vista, (2) oído, (3) olfato, (4) gusto, (5) tacto: ")
+                sentido = peticion("Indica el sentido involucrado:\n(1) vista, (2) oído, (3) olfato, (4) gusto, (5) tacto: ", "sentido")
                 if sentido in sentidos:
                     nuevo_pred = sentidos[sentido]
                     break
                 else:
-                    print("Entrada no válida. Por favor, ingresa un número del 1 al 5.")
+                    respuesta_no_valida(sentido, "sentido", "Entrada no válida. Por favor, ingresa un número del 1 al 5.")
         return nuevo_pred
     return pred.lower().replace(" ", ".")
 
@@ -384,18 +430,18 @@ def obtener_aktionsart() -> str:
     for num, akt in AKTIONSART_OPCIONES.items():
         print(f"{num}. {akt}")
     while True:
-        entrada = peticion("\nEscribe el número correspondiente: ")
+        entrada = peticion("\nEscribe el número correspondiente: ", "aktionsart")
         if entrada.isdigit():
             AKT = int(entrada)
             if AKT in AKTIONSART_OPCIONES:
                 return AKTIONSART_OPCIONES[AKT]
-        print("Por favor, escribe un número válido de la lista.")
+        respuesta_no_valida(entrada, "aktionsart", "Por favor, escribe un número válido de la lista.")
 
 
 def obtener_argumentos(oracion_original) -> typing.Tuple[str, str, str]:
-    x = peticion(f"\nEscribe el sujeto de «{oracion_original}» (0 si no hay): ")
-    y = peticion(f"Escribe el complemento directo de «{oracion_original}», sin «a» (0 si no hay): ")
-    z = peticion(f"Escribe el complemento indirecto de «{oracion_original}», sin «a» (0 si no hay): ")
+    x = peticion(f"\nEscribe el sujeto de «{oracion_original}» (0 si no hay): ", "sujeto")
+    y = peticion(f"Escribe el complemento directo de «{oracion_original}», sin «a» (0 si no hay): ", "complemento_directo")
+    z = peticion(f"Escribe el complemento indirecto de «{oracion_original}», sin «a» (0 si no hay): ", "complemento_indirecto")
     def normalizar(arg: str) -> str:
         return 'Ø' if arg in ('0', '') else arg
     return normalizar(x), normalizar(y), normalizar(z)
@@ -405,9 +451,9 @@ def obtener_predicado(AKT, y, es_dinamico):
     if AKT in ["actividad causativa", "realización activa causativa"] or (AKT in ["logro causativo", "semelfactivo causativo"] and es_dinamico):
         return "" #Se tratan de manera específica en generar_estructura_logica
     elif (AKT in ["actividad", "realización activa"]) or (AKT in ["logro", "semelfactivo"] and es_dinamico) or (y != "Ø" and "causativ" not in AKT):
-        pred = peticion("Escribe el infinitivo del verbo: ")
+        pred = peticion("Escribe el infinitivo del verbo: ", "infinitivo")
     else:
-        pred = peticion("Escribe el verbo en su forma de participio (o el adjetivo relacionado) \no, si se trata de un verbo (seudo)copulativo, escribe el atributo: ")
+        pred = peticion("Escribe el verbo en su forma de participio (o el adjetivo relacionado) \no, si se trata de un verbo (seudo)copulativo, escribe el atributo: ", "participio")
     return pred.lower().replace(" ", ".")
 
 
@@ -434,37 +480,37 @@ def generar_estructura_no_causativa(x, y, locus, pred, operador, AKT):
     if AKT != "estado" and y != "Ø":
         pred = verificar_percepcion(pred)
     if y != "Ø" and locus == "Ø":
-        return f"{operador + ' ' if operador else ''}{pred}' ({x}, {y})"
+        return modificador(operador, predicado(pred, x, y))
     elif y == "Ø" and locus != "Ø":
-        return f"{operador + ' ' if operador else ''}{pred}' ({x}, {locus})"
+        return modificador(operador, predicado(pred, x, locus))
     elif y == "Ø" and locus == "Ø":
-        return f"{operador + ' ' if operador else ''}{pred}' ({x})"
+        return modificador(operador, predicado(pred, x))
     return None
 
 def generar_estructura_causativa(x, y, pred, operador):
     if y == "Ø":
         return None
-    return f"[do' ({x}, Ø)] CAUSE [{operador + ' ' if operador else ''}{pred}' ({y})]"
+    return causa(predicado("do", x, "Ø"), modificador(operador, predicado(pred, y)))
 
 def generar_estructura_actividad(x, y, locus, pred, operador):
     if y != "Ø" and locus == "Ø":
         pred = verificar_percepcion(pred)
-        return f"{operador + ' ' if operador else ''}do' ({x}, [{pred}' ({x}, {y})])"
+        return modificador(operador, predicado("do", x, predicado(pred, x, y)))
     elif y == "Ø" and locus != "Ø":
-        return f"{operador + ' ' if operador else ''}do' ({x}, [{pred}' ({x}, {locus})])"
+        return modificador(operador, predicado("do", x, predicado(pred, x, locus)))
     elif y == "Ø" and locus == "Ø":
-        return f"{operador + ' ' if operador else ''}do' ({x}, [{pred}' ({x})])"
+        return modificador(operador, predicado("do", x, predicado(pred, x)))
     return None
 
 def generar_estructura_actividad_causativa(x, y, pred, operador):
     if y == "Ø":
         return None
-    pred = peticion(f"Escribe en infinitivo la actividad realizada por «{y}» (ej: «comer»): ").lower().replace(" ", ".")
-    return f"[do' ({x}, Ø)] CAUSE [{operador + ' ' if operador else ''}do' ({y}, [{pred}' ({y})])]"
+    pred = peticion(f"Escribe en infinitivo la actividad realizada por «{y}» (ej: «comer»): ", "actividad").lower().replace(" ", ".")
+    return causa(predicado("do", x, "Ø"), modificador(operador, predicado("do", y, predicado(pred, y))))
 
 def manejar_realizacion_activa(x, y, z, pred, locus, AKT, oracion_original):
     es_causativa = AKT == "realización activa causativa"
-    tipo_verbo = peticion("Escribe el número correspondiente al tipo de verbo: (1) creación, (2) consumo, (3) desplazamiento o (4) ninguno de estos: ")
+    tipo_verbo = peticion("Escribe el número correspondiente al tipo de verbo: (1) creación, (2) consumo, (3) desplazamiento o (4) ninguno de estos: ", "tipo_realizacion_activa")
     if tipo_verbo == "1":
         return manejar_creacion(x, y, z, pred, es_causativa)
     elif tipo_verbo == "2":
@@ -474,170 +520,182 @@ def manejar_realizacion_activa(x, y, z, pred, locus, AKT, oracion_original):
     else:
         return manejar_otros(x, y, z, pred, es_causativa, oracion_original)
 
+def realizacion_activa(agente, actividad, proceso, resultado):
+    """«do' (agente, [actividad]) ∧ PROC proceso ∧ FIN resultado», la forma común de las realizaciones activas."""
+    return conjuncion(predicado("do", agente, actividad), modificador("PROC", proceso), modificador("FIN", resultado))
+
 def manejar_creacion(x, y, z, pred, es_causativa):
     if es_causativa:
-        pred = peticion(f"Escribe en infinitivo la actividad realizada por «{z}» (ej: «escribir»): ").lower().replace(" ", ".")
-        return f"[do' ({x}, Ø)] CAUSE [do' ({z}, [{pred}' ({z}, {y})]) ∧ PROC being.created' ({y}) ∧ FIN exist' ({y})]"
+        pred = peticion(f"Escribe en infinitivo la actividad realizada por «{z}» (ej: «escribir»): ", "actividad").lower().replace(" ", ".")
+        return causa(predicado("do", x, "Ø"), realizacion_activa(z, predicado(pred, z, y), predicado("being.created", y), predicado("exist", y)))
     else:
-        return f"do' ({x}, [{pred}' ({x}, {y})]) ∧ PROC being.created' ({y}) ∧ FIN exist' ({y})"
+        return realizacion_activa(x, predicado(pred, x, y), predicado("being.created", y), predicado("exist", y))
 
 def manejar_consumo(x, y, z, pred, es_causativa):
     if es_causativa:
         # Pedir el verbo original de la oración para decidir el flujo
-        verbo_original = peticion("Escribe el infinitivo del verbo de la oración original (ej: «alimentar»): ").lower().replace(" ", ".")       
+        verbo_original = peticion("Escribe el infinitivo del verbo de la oración original (ej: «alimentar»): ", "infinitivo").lower().replace(" ", ".")
         # Caso especial para verbos tipo "alimentar"
         if verbo_original in ["alimentar", "nutrir", "cebar", "hidratar", "saciar", "empachar"]:
-            pred = peticion(f"Escribe en infinitivo la actividad realizada por «{y}» (ej: «comer»): ").lower().replace(" ", ".")
-            alimento = peticion("Escribe el alimento que fue consumido (ej: «una manzana»): ").lower().replace(" ", ".")
-            return f"[do' ({x}, Ø)] CAUSE [do' ({y}, [{pred}' ({y}, {alimento})]) ∧ PROC being.consumed' ({alimento}) ∧ FIN consumed' ({alimento})]"
+            pred = peticion(f"Escribe en infinitivo la actividad realizada por «{y}» (ej: «comer»): ", "actividad").lower().replace(" ", ".")
+            alimento = peticion("Escribe el alimento que fue consumido (ej: «una manzana»): ", "alimento").lower().replace(" ", ".")
+            return causa(predicado("do", x, "Ø"), realizacion_activa(y, predicado(pred, y, alimento), predicado("being.consumed", alimento), predicado("consumed", alimento)))
         else:
-            pred = peticion(f"Escribe en infinitivo la actividad realizada por «{z}» (ej: «comer»): ").lower().replace(" ", ".")
-            return f"[do' ({x}, Ø)] CAUSE [do' ({z}, [{pred}' ({z}, {y})]) ∧ PROC being.consumed' ({y}) ∧ FIN consumed' ({y})]"
+            pred = peticion(f"Escribe en infinitivo la actividad realizada por «{z}» (ej: «comer»): ", "actividad").lower().replace(" ", ".")
+            return causa(predicado("do", x, "Ø"), realizacion_activa(z, predicado(pred, z, y), predicado("being.consumed", y), predicado("consumed", y)))
     else:
-        return f"do' ({x}, [{pred}' ({x}, {y})]) ∧ PROC being.consumed' ({y}) ∧ FIN consumed' ({y})"
+        return realizacion_activa(x, predicado(pred, x, y), predicado("being.consumed", y), predicado("consumed", y))
 
 def manejar_otros(x, y, z, pred, es_causativa, oracion_original):
     if es_causativa:
         if z != "Ø":
-            pred = peticion(f"Escribe en infinitivo la actividad realizada por «{z}» (ej: «comer»): ").lower().replace(" ", ".")
-            participio = peticion(f"Escribe el participio de «{pred}» (ej: «comido»): ").lower().replace(" ", ".")
-            return f"[do' ({x}, Ø)] CAUSE [do' ({z}, [{pred}' ({z}, {y})]) ∧ PROC {participio}' ({y}) ∧ FIN {participio}' ({y})]"
-        elif input_si_no(f"¿Alguno de los constituyentes de «{oracion_original}» es un complemento de régimen\n(ej: «en mi amigo» en «Ana transformó a Pepe en mi amigo»)? (s/n): "):
-            pred = peticion(f"Escribe en infinitivo la actividad realizada por «{y}» sin la preposición que rige (ej: «transformarse»): ").lower().replace(" ", ".")
-            participio = peticion(f"Escribe el participio de «{pred}» (ej: «transformado»): ").lower().replace(" ", ".")
-            prep = peticion("Escribe la preposición regida por el verbo (ej: «en»): ").lower().replace(" ", ".")
-            suplemento = peticion("Escribe la información del complemento de régimen (sin preposición) (ej: «mi amigo»): ")
-            return f"[do' ({x}, Ø)] CAUSE [do' ({y}, [{pred}.{prep}' ({y}, {suplemento})]) ∧ PROC {participio}.{prep}' ({y}, {suplemento}) ∧ FIN {participio}.{prep}' ({y}, {suplemento})]"
+            pred = peticion(f"Escribe en infinitivo la actividad realizada por «{z}» (ej: «comer»): ", "actividad").lower().replace(" ", ".")
+            participio = peticion(f"Escribe el participio de «{pred}» (ej: «comido»): ", "participio").lower().replace(" ", ".")
+            return causa(predicado("do", x, "Ø"), realizacion_activa(z, predicado(pred, z, y), predicado(participio, y), predicado(participio, y)))
+        elif input_si_no(f"¿Alguno de los constituyentes de «{oracion_original}» es un complemento de régimen\n(ej: «en mi amigo» en «Ana transformó a Pepe en mi amigo»)? (s/n): ", "complemento_regimen"):
+            pred = peticion(f"Escribe en infinitivo la actividad realizada por «{y}» sin la preposición que rige (ej: «transformarse»): ", "actividad").lower().replace(" ", ".")
+            participio = peticion(f"Escribe el participio de «{pred}» (ej: «transformado»): ", "participio").lower().replace(" ", ".")
+            prep = peticion("Escribe la preposición regida por el verbo (ej: «en»): ", "preposicion").lower().replace(" ", ".")
+            suplemento = peticion("Escribe la información del complemento de régimen (sin preposición) (ej: «mi amigo»): ", "suplemento")
+            resultado = predicado(f"{participio}.{prep}", y, suplemento)
+            return causa(predicado("do", x, "Ø"), realizacion_activa(y, predicado(f"{pred}.{prep}", y, suplemento), resultado, resultado))
         else:
-            pred = peticion(f"Escribe en infinitivo la actividad realizada por «{y}» (ej: «comer»): ").lower().replace(" ", ".")
-            participio = peticion(f"Escribe el participio de «{pred}» (ej: «comido»): ").lower().replace(" ", ".")
-            return f"[do' ({x}, Ø)] CAUSE [do' ({y}, [{pred}' ({y})]) ∧ PROC {participio}' ({y}) ∧ FIN {participio}' ({y})]"
+            pred = peticion(f"Escribe en infinitivo la actividad realizada por «{y}» (ej: «comer»): ", "actividad").lower().replace(" ", ".")
+            participio = peticion(f"Escribe el participio de «{pred}» (ej: «comido»): ", "participio").lower().replace(" ", ".")
+            return causa(predicado("do", x, "Ø"), realizacion_activa(y, predicado(pred, y), predicado(participio, y), predicado(participio, y)))
     else:
         if y != "Ø":
-            participio = peticion(f"Escribe el participio de «{pred}» (ej: «comido»): ").lower().replace(" ", ".")
-            return f"do' ({x}, [{pred}' ({x}, {y})]) ∧ PROC {participio}' ({y}) ∧ FIN {participio}' ({y})"
-        elif input_si_no(f"¿Alguno de los constituyentes de «{oracion_original}» es un complemento de régimen\n(ej: «en mi amigo» en «Pepe se transformó en mi amigo»)? (s/n): "):
-            participio = peticion(f"Escribe el participio de «{pred}» (ej: «transformado»): ").lower().replace(" ", ".")
-            prep = peticion("Escribe la preposición regida por el verbo (ej: «en»): ").lower().replace(" ", ".")
-            suplemento = peticion("Escribe la información del complemento de régimen (sin preposición) (ej: «mi amigo»): ")
-            return f"do' ({x}, [{pred}.{prep}' ({x}, {suplemento})]) ∧ PROC {participio}.{prep}' ({x}, {suplemento}) ∧ FIN {participio}.{prep}' ({x}, {suplemento})"
+            participio = peticion(f"Escribe el participio de «{pred}» (ej: «comido»): ", "participio").lower().replace(" ", ".")
+            return realizacion_activa(x, predicado(pred, x, y), predicado(participio, y), predicado(participio, y))
+        elif input_si_no(f"¿Alguno de los constituyentes de «{oracion_original}» es un complemento de régimen\n(ej: «en mi amigo» en «Pepe se transformó en mi amigo»)? (s/n): ", "complemento_regimen"):
+            participio = peticion(f"Escribe el participio de «{pred}» (ej: «transformado»): ", "participio").lower().replace(" ", ".")
+            prep = peticion("Escribe la preposición regida por el verbo (ej: «en»): ", "preposicion").lower().replace(" ", ".")
+            suplemento = peticion("Escribe la información del complemento de régimen (sin preposición) (ej: «mi amigo»): ", "suplemento")
+            resultado = predicado(f"{participio}.{prep}", x, suplemento)
+            return realizacion_activa(x, predicado(f"{pred}.{prep}", x, suplemento), resultado, resultado)
         else:
-            participio = peticion(f"Escribe el participio de «{pred}» (ej: «comido»): ").lower().replace(" ", ".")
-            return f"do' ({x}, [{pred}' ({x})]) ∧ PROC {participio}' ({x}) ∧ FIN {participio}' ({x})"
+            participio = peticion(f"Escribe el participio de «{pred}» (ej: «comido»): ", "participio").lower().replace(" ", ".")
+            return realizacion_activa(x, predicado(pred, x), predicado(participio, x), predicado(participio, x))
 
 def manejar_desplazamiento(AKT, x, y, z, pred, locus, es_causativa, oracion_original):
-    categoria_movimiento = buscar_verbo(pred, VERBOS_MOVIMIENTO)
+    categoria_movimiento = buscar_verbo(pred, "VERBOS_MOVIMIENTO")
     if categoria_movimiento:
         pred = categoria_movimiento
     if locus == "Ø":
-        es_consumo = input_si_no(f"¿«{oracion_original[0].upper() + oracion_original[1:]}» es similar a «{x} corrió una maratón»? (s/n): ")
+        es_consumo = input_si_no(f"¿«{oracion_original[0].upper() + oracion_original[1:]}» es similar a «{x} corrió una maratón»? (s/n): ", "desplazamiento_como_consumo")
         if es_consumo:
             return manejar_otros(x, y, z, pred, es_causativa, oracion_original)
         else:
             print("\nNo puede tratarse de una realización activa de desplazamiento sin una ubicación que lo delimite.")
             raise ValueError(f"No es posible generar una estructura lógica para estos parámetros.\nParámetros: aktionsart: «{AKT}»; verbo: «{pred}»; sujeto: «{x}»; c. directo: «{y}»; c. indirecto: «{z}»; locativo: «{locus}».")
-    lugar_tipo = peticion(f"¿«{locus}» es (1) la procedencia o (2) el destino? Escribe 1 o 2: ")
-    fin_loc = "NOT be-loc'" if lugar_tipo == "1" else "be-loc'"
+    lugar_tipo = peticion(f"¿«{locus}» es (1) la procedencia o (2) el destino? Escribe 1 o 2: ", "tipo_lugar")
+    negacion = "NOT" if lugar_tipo == "1" else ""
     if es_causativa:
-        pred = peticion(f"Escribe en infinitivo la actividad realizada por «{y}» (ej: «correr»): ").lower().replace(" ", ".")
-        return f"[do' ({x}, Ø)] CAUSE [do' ({y}, [{pred}' ({y})]) ∧ PROC covering.path.distance' ({y}) ∧ FIN {fin_loc} ({locus}, {y})]"
+        pred = peticion(f"Escribe en infinitivo la actividad realizada por «{y}» (ej: «correr»): ", "actividad").lower().replace(" ", ".")
+        fin_loc = modificador(negacion, predicado("be-loc", locus, y))
+        return causa(predicado("do", x, "Ø"), realizacion_activa(y, predicado(pred, y), predicado("covering.path.distance", y), fin_loc))
     else:
-        return f"do' ({x}, [{pred}' ({x})]) ∧ PROC covering.path.distance' ({x}) ∧ FIN {fin_loc} ({locus}, {x})"
+        fin_loc = modificador(negacion, predicado("be-loc", locus, x))
+        return realizacion_activa(x, predicado(pred, x), predicado("covering.path.distance", x), fin_loc)
 
 
 # Manejo de casos especiales de predicados
+# Las condiciones sobre el aktionsart y los argumentos de cada caso están en REGLAS_LS
 def verbos_doler_gustar(AKT, x, y, z, operador, es_dinamico, oracion_original): #A [OI] le [VERBO] [SUJETO]
-    if "causativ" not in AKT and AKT != "realización activa" and x != "Ø" and y == "Ø" and z != "Ø":
-        if input_si_no(f"¿«{x[0].upper() + x[1:]}» está situado en alguna parte de «{z}»? (s/n): "):
-            pred = peticion("Escribe el infinitivo del verbo: ").lower().replace(" ", ".")
-            if es_dinamico:
-                return f"{operador + ' ' if operador else ''}do' ({x}, [{pred}' ({x})]) ∧ have.as.part' ({z}, {x})"
-            else:
-                return f"{operador + ' ' if operador else ''}{pred}' ({x}) ∧ have.as.part' ({z}, {x})"
-        elif input_si_no(f"¿«{oracion_original[0].upper() + oracion_original[1:]}» tiene una estructura parecida a «A {z} le [verbo] {x}»? (s/n): "):
-            pred = peticion("Escribe el infinitivo del verbo: ").lower().replace(" ", ".")
-            if es_dinamico:
-                return f"{operador + ' ' if operador else ''}do' ({x}, [{pred}' ({x}, {z})]) [MR1]"
-            else:
-                return f"{operador + ' ' if operador else ''}{pred}' ({x}, {z}) [MR1]"
+    if input_si_no(f"¿«{x[0].upper() + x[1:]}» está situado en alguna parte de «{z}»? (s/n): ", "parte_de"):
+        pred = peticion("Escribe el infinitivo del verbo: ", "infinitivo").lower().replace(" ", ".")
+        if es_dinamico:
+            return conjuncion(modificador(operador, predicado("do", x, predicado(pred, x))), predicado("have.as.part", z, x))
+        else:
+            return conjuncion(modificador(operador, predicado(pred, x)), predicado("have.as.part", z, x))
+    elif input_si_no(f"¿«{oracion_original[0].upper() + oracion_original[1:]}» tiene una estructura parecida a «A {z} le [verbo] {x}»? (s/n): ", "estructura_dativa"):
+        pred = peticion("Escribe el infinitivo del verbo: ", "infinitivo").lower().replace(" ", ".")
+        if es_dinamico:
+            return macrorol(modificador(operador, predicado("do", x, predicado(pred, x, z))), "MR1")
+        else:
+            return macrorol(modificador(operador, predicado(pred, x, z)), "MR1")
     return None
 
 def hacer_meteorologico(x, y, oracion_original, operador, es_dinamico):#Hace frío
-    if x == "Ø" and y != "Ø" and input_si_no(f"¿El verbo de «{oracion_original}» es «hacer»? (s/n): "):
-        pred = peticion("Escribe la sensación en forma de adjetivo (ej: «caluroso»): ").lower().replace(" ", ".")
+    if input_si_no(f"¿El verbo de «{oracion_original}» es «hacer»? (s/n): ", "verbo_hacer"):
+        pred = peticion("Escribe la sensación en forma de adjetivo (ej: «caluroso»): ", "sensacion").lower().replace(" ", ".")
         if es_dinamico:
-            return f"{operador + ' ' if operador else ''}do' (weather, [{pred}' (weather)])"
+            return modificador(operador, predicado("do", "weather", predicado(pred, "weather")))
         else:
-            return f"{operador + ' ' if operador else ''}{pred}' (weather)"
+            return modificador(operador, predicado(pred, "weather"))
     return None
 
 def casos_impersonales(x, y, z, operador, es_dinamico): #A alguien le va bien / A alguien le basta/sobra con algo
-    if not es_dinamico and x == "Ø" and y == "Ø" and z != "Ø":
-        verbo = peticion("Escribe el infinitivo del verbo: ")
-        verbo = verbo.lower().replace(" ", ".")
-        if verbo in ["ir", "irme", "irte", "irle", "irnos", "iros", "irles"]:
-            pred = peticion("Escribe el adverbio o equivalente (ej: «bien»): ").lower().replace(" ", ".")
-            return f"{operador + ' ' if operador else ''}{pred}' ({z}) [MR0]"
-        elif verbo in ["bastar", "sobrar"]:
-            suplemento = peticion("Escribe la información del complemento sin preposición (ej: «tu amistad»): ")
-            return f"{operador + ' ' if operador else ''}have.enough.with' ({z}, {suplemento}) [MR0]"
+    verbo = peticion("Escribe el infinitivo del verbo: ", "infinitivo")
+    verbo = verbo.lower().replace(" ", ".")
+    if verbo in ["ir", "irme", "irte", "irle", "irnos", "iros", "irles"]:
+        pred = peticion("Escribe el adverbio o equivalente (ej: «bien»): ", "adverbio").lower().replace(" ", ".")
+        return macrorol(modificador(operador, predicado(pred, z)), "MR0")
+    elif verbo in ["bastar", "sobrar"]:
+        suplemento = peticion("Escribe la información del complemento sin preposición (ej: «tu amistad»): ", "suplemento")
+        return macrorol(modificador(operador, predicado("have.enough.with", z, suplemento)), "MR0")
     return None
 
 def casos_locativo_dativos(AKT, x, y, z, operador, es_dinamico): #Pepe se le aproximó a Ana
-    if "causativ" not in AKT and AKT != "estado" and x != "Ø" and y == "Ø" and z != "Ø" and input_si_no(f"¿«{z[0].upper() + z[1:]}» señala el destino de un desplazamiento por parte de «{x}»? (s/n): "):
+    if input_si_no(f"¿«{z[0].upper() + z[1:]}» señala el destino de un desplazamiento por parte de «{x}»? (s/n): ", "destino_dativo"):
         if AKT == "realización activa":
-            pred = peticion("Escribe el infinitivo del verbo: ").lower().replace(" ", ".")
-            return f"do' ({x}, [{pred}' ({x})]) ∧ PROC covering.path.distance' ({x}) ∧ FIN be-loc' ({z}, {x})"
+            pred = peticion("Escribe el infinitivo del verbo: ", "infinitivo").lower().replace(" ", ".")
+            return realizacion_activa(x, predicado(pred, x), predicado("covering.path.distance", x), predicado("be-loc", z, x))
         elif es_dinamico:
-            return f"{operador + ' ' if operador else ''}do' ({x}, [be-loc' ({x}, {z})])"
+            return modificador(operador, predicado("do", x, predicado("be-loc", x, z)))
         else:
-            return f"{operador + ' ' if operador else ''}be-loc' ({x}, {z})"
+            return modificador(operador, predicado("be-loc", x, z))
     return None
-    
+
 def verbos_OI(AKT, x, y, z, operador): #Verbos triargumentales con complemento indirecto
-    if AKT == "realización activa causativa" or z == "Ø":
-        return None
-    pred = peticion("Escribe el infinitivo del verbo: ").lower().replace(" ", ".")
+    pred = peticion("Escribe el infinitivo del verbo: ", "infinitivo").lower().replace(" ", ".")
     if AKT == "realización activa":
         return manejar_realizacion_activa_diccion(x, y, z, pred)
-    
+
     es_transferencia = manejar_verbos_transferencia(x, y, z, pred, operador, AKT)
-    
+
     if es_transferencia:
         return es_transferencia
-    if input_si_no(f"¿Es «{pred}» un verbo de dicción? (s/n): "):
+    if input_si_no(f"¿Es «{pred}» un verbo de dicción? (s/n): ", "diccion"):
         return manejar_verbo_diccion(x, y, z, pred, operador)
     return manejar_otros_verbos(AKT, x, y, z, pred, operador)
 
 def manejar_realizacion_activa_diccion(x, y, z, pred):
-    if not input_si_no(f"¿Es «{pred}» un verbo de dicción? (s/n): "):
+    if not input_si_no(f"¿Es «{pred}» un verbo de dicción? (s/n): ", "diccion"):
         return None
-    
+
     # SANITIZACIÓN + SOMETHING
     y_clean = "something" if y in ["Ø", "0"] else y.replace(" ", ".")
     z_clean = z.replace(" ", ".")
-    
-    if pred in VERBOS_DICCION["preguntar"]:
-        return f"[do' ({x}, [express.question.to.{z_clean}' ({x}, pregunta)]) ∧ PROC being.created' (pregunta) ∧ FIN exist' (pregunta)] PURP [do' ({z}, [express.{y_clean}.to.{x}' ({z}, {y})])]"
-    elif pred in VERBOS_DICCION["agradecer"]:
+
+    if en_clase(pred, "VERBOS_DICCION", "preguntar"):
+        expresion = realizacion_activa(x, predicado(f"express.question.to.{z_clean}", x, "pregunta"), predicado("being.created", "pregunta"), predicado("exist", "pregunta"))
+        return proposito(expresion, predicado("do", z, predicado(f"express.{y_clean}.to.{x}", z, y)))
+    elif en_clase(pred, "VERBOS_DICCION", "agradecer"):
         arg_incorporado = VERBOS_DICCION["agradecer"][pred]
-        return f"[do' ({x}, [express.{arg_incorporado}.because.of.{y_clean}.to.{z_clean}' ({x}, {y})]) ∧ PROC being.created' ({arg_incorporado}) ∧ FIN exist' ({arg_incorporado})] PURP [know' ({z}, {arg_incorporado} por {y})]"
-    elif pred in VERBOS_DICCION["bendecir"]:
+        expresion = realizacion_activa(x, predicado(f"express.{arg_incorporado}.because.of.{y_clean}.to.{z_clean}", x, y),
+                                       predicado("being.created", arg_incorporado), predicado("exist", arg_incorporado))
+        return proposito(expresion, predicado("know", z, f"{arg_incorporado} por {y}"))
+    elif en_clase(pred, "VERBOS_DICCION", "bendecir"):
         arg_incorporado = VERBOS_DICCION["bendecir"][pred]
-        return f"[do' ({x}, [express.{arg_incorporado}.of.{y_clean}.to.{z_clean}' ({x}, {y})]) ∧ PROC being.created' ({arg_incorporado}) ∧ FIN exist' ({arg_incorporado})] PURP [know' ({z}, {arg_incorporado} de {y})]"
+        expresion = realizacion_activa(x, predicado(f"express.{arg_incorporado}.of.{y_clean}.to.{z_clean}", x, y),
+                                       predicado("being.created", arg_incorporado), predicado("exist", arg_incorporado))
+        return proposito(expresion, predicado("know", z, f"{arg_incorporado} de {y}"))
     else:
-        return f"[do' ({x}, [express.something.to.{z_clean}' ({x}, {y})]) ∧ PROC being.created' ({y}) ∧ FIN exist' ({y})] PURP [know' ({z}, {y})]"
+        expresion = realizacion_activa(x, predicado(f"express.something.to.{z_clean}", x, y), predicado("being.created", y), predicado("exist", y))
+        return proposito(expresion, predicado("know", z, y))
 
 def manejar_verbos_transferencia(x, y, z, pred, operador, AKT): # Añadimos AKT en los argumentos
-    if pred in VERBOS_TRANSFERENCIA["sacar"]:
-        
+    if en_clase(pred, "VERBOS_TRANSFERENCIA", "sacar"):
+
         if pred == "arrancar" and "causativ" not in AKT:
             return None
 
-        return f"[do' ({x}, Ø)] CAUSE [{operador + ' ' if operador else ''}NOT have' ({z}, {y})] PURP [have' ({x}, {y})]"
-    
-    elif (pred in VERBOS_TRANSFERENCIA["dar_poner"] or input_si_no(f"¿El significado típico de «{pred}» es la transferencia de un objeto físico? (s/n): ")) or (pred == "pegar" and y!= "Ø"):
-        return f"[do' ({x}, Ø)] CAUSE [{operador + ' ' if operador else ''}have' ({z}, {y})]"
+        return proposito(causa(predicado("do", x, "Ø"), modificador(operador, modificador("NOT", predicado("have", z, y)))),
+                         predicado("have", x, y))
+
+    elif (en_clase(pred, "VERBOS_TRANSFERENCIA", "dar_poner") or input_si_no(f"¿El significado típico de «{pred}» es la transferencia de un objeto físico? (s/n): ", "transferencia")) or (pred == "pegar" and y!= "Ø"):
+        return causa(predicado("do", x, "Ø"), modificador(operador, predicado("have", z, y)))
     return None
 
 def manejar_verbo_diccion(x, y, z, pred, operador):
@@ -645,150 +703,154 @@ def manejar_verbo_diccion(x, y, z, pred, operador):
     y_clean = "something" if y in ["Ø", "0"] else y.replace(" ", ".")
     z_clean = z.replace(" ", ".")
 
-    if pred in VERBOS_DICCION["preguntar"]:
-        return f"[{operador + ' ' if operador else ''}do' ({x}, [express.question.to.{z_clean}' ({x})])] PURP [do' ({z}, [express.{y_clean}.to.{x}' ({z}, {y})])]"
-    elif pred in VERBOS_DICCION["agradecer"]:
+    if en_clase(pred, "VERBOS_DICCION", "preguntar"):
+        return proposito(modificador(operador, predicado("do", x, predicado(f"express.question.to.{z_clean}", x))),
+                         predicado("do", z, predicado(f"express.{y_clean}.to.{x}", z, y)))
+    elif en_clase(pred, "VERBOS_DICCION", "agradecer"):
         arg_incorporado = VERBOS_DICCION["agradecer"][pred]
-        return f"[{operador + ' ' if operador else ''}do' ({x}, [express.{arg_incorporado}.because.of.{y_clean}.to.{z_clean}' ({x}, {y})])] PURP [know' ({z}, {arg_incorporado} por {y})]"
-    elif pred in VERBOS_DICCION["bendecir"]:
+        return proposito(modificador(operador, predicado("do", x, predicado(f"express.{arg_incorporado}.because.of.{y_clean}.to.{z_clean}", x, y))),
+                         predicado("know", z, f"{arg_incorporado} por {y}"))
+    elif en_clase(pred, "VERBOS_DICCION", "bendecir"):
         arg_incorporado = VERBOS_DICCION["bendecir"][pred]
-        return f"[{operador + ' ' if operador else ''}do' ({x}, [express.{arg_incorporado}.of.{y_clean}.to.{z_clean}' ({x}, {y})])] PURP [know' ({z}, {arg_incorporado} de {y})]"
+        return proposito(modificador(operador, predicado("do", x, predicado(f"express.{arg_incorporado}.of.{y_clean}.to.{z_clean}", x, y))),
+                         predicado("know", z, f"{arg_incorporado} de {y}"))
     else:
-        return f"[{operador + ' ' if operador else ''}do' ({x}, [express.something.to.{z_clean}' ({x}, {y})])] PURP [know' ({z}, {y})]"
+        return proposito(modificador(operador, predicado("do", x, predicado(f"express.something.to.{z_clean}", x, y))),
+                         predicado("know", z, y))
 
 def manejar_otros_verbos(AKT, x, y, z, pred, operador):
     if AKT == "realización activa causativa": #enseñar de a poco algo específico a alguien
-        return f"[do' ({x}, [{pred}' ({x}, {y}])] CAUSE [do' ({z}, [know' ({z}, {y})]) ∧ PROC being.created' ({y}) ∧ FIN exist' ({y})]"
-    elif pred in VERBOS_TRI_NEG["desatribuir"]:
-        return f"[do' ({x}, Ø)] CAUSE [{operador + ' ' if operador else ''}NOT have' ({z}, {y})]"
-    elif pred in VERBOS_TRI_NEG["ocultar"]:
-        return f"[do' ({x}, Ø)] CAUSE [{operador + ' ' if operador else ''}NOT know' ({z}, {y})]"
-    elif input_si_no(f"¿Es «{pred}» un verbo como «enseñar» o «mostrar»? (s/n): "):
-        return f"[do' ({x}, Ø)] CAUSE [{operador + ' ' if operador else ''}know' ({z}, {y})]"
+        return causa(predicado("do", x, predicado(pred, x, y)),
+                     realizacion_activa(z, predicado("know", z, y), predicado("being.created", y), predicado("exist", y)))
+    elif en_clase(pred, "VERBOS_TRI_NEG", "desatribuir"):
+        return causa(predicado("do", x, "Ø"), modificador(operador, modificador("NOT", predicado("have", z, y))))
+    elif en_clase(pred, "VERBOS_TRI_NEG", "ocultar"):
+        return causa(predicado("do", x, "Ø"), modificador(operador, modificador("NOT", predicado("know", z, y))))
+    elif input_si_no(f"¿Es «{pred}» un verbo como «enseñar» o «mostrar»? (s/n): ", "transmision_conocimiento"):
+        return causa(predicado("do", x, "Ø"), modificador(operador, predicado("know", z, y)))
     elif pred in ["pegar", "pegarle"]:
-        return f"{operador + ' ' if operador else ''}do' ({x}, [hit' ({x}, {z})]) [MR1]"
+        return macrorol(modificador(operador, predicado("do", x, predicado("hit", x, z))), "MR1")
     else:
         raise ValueError(f"Asegúrate de que «{z}» sea un argumento de «{pred}» y de que no se trate de una construcción aplicativa.\nParámetros: aktionsart: «{AKT}»; verbo: «{pred}»; sujeto: «{x}»; c. directo: «{y}»; c. indirecto: «{z}».")
 
 def casos_especiales_estado(AKT, x, y, oracion_original): #Maneja propiedades inherentes y sensaciones
     if AKT == "estado":
         # sin objeto directo
-        if y == "Ø": 
-            if x == "Ø": 
-                if input_si_no(f"¿«{oracion_original[0].upper() + oracion_original[1:]}» describe una sensación o fenómeno climático usando «estar» como verbo no auxiliar (ej: «está nublado»)? (s/n): "):
-                    pred = peticion("Escribe la sensación o fenómeno climático (ej: «frío», «nublado»): ").lower().replace(" ", ".")
-                    return f"{pred}' (weather)"
-            elif input_si_no(f"¿«{oracion_original[0].upper() + oracion_original[1:]}» expresa un atributo esencial del sujeto usando «ser» (ej: «Ana es alta»)? (s/n): "):
-                pred = peticion("Escribe el atributo: ").lower().replace(" ", ".")
-                return f"be' ({x}, [{pred}'])"
-            if input_si_no("¿El estado es un tipo de sensación o sentimiento (ej: «frío» o «amor»)? \n(Si es un verbo de percepción sensorial, responde que no) (s/n): "):
-                pred = peticion("Escribe esa sensación o sentimiento (ej: «frío» o «enamorado»): ").lower().replace(" ", ".")
-                return f"feel' ({x}, [{pred}'])"
+        if y == "Ø":
+            if x == "Ø":
+                if input_si_no(f"¿«{oracion_original[0].upper() + oracion_original[1:]}» describe una sensación o fenómeno climático usando «estar» como verbo no auxiliar (ej: «está nublado»)? (s/n): ", "estado_climatico"):
+                    pred = peticion("Escribe la sensación o fenómeno climático (ej: «frío», «nublado»): ", "sensacion").lower().replace(" ", ".")
+                    return predicado(pred, "weather")
+            elif input_si_no(f"¿«{oracion_original[0].upper() + oracion_original[1:]}» expresa un atributo esencial del sujeto usando «ser» (ej: «Ana es alta»)? (s/n): ", "atributo_esencial"):
+                pred = peticion("Escribe el atributo: ", "atributo").lower().replace(" ", ".")
+                return predicado("be", x, predicado(pred))
+            if input_si_no("¿El estado es un tipo de sensación o sentimiento (ej: «frío» o «amor»)? \n(Si es un verbo de percepción sensorial, responde que no) (s/n): ", "sentimiento"):
+                pred = peticion("Escribe esa sensación o sentimiento (ej: «frío» o «enamorado»): ", "sensacion").lower().replace(" ", ".")
+                return predicado("feel", x, predicado(pred))
         # con objeto directo
         else:
-            if input_si_no(f"¿«{y[0].upper() + y[1:]}» expresa una sensación o sentimiento? (s/n): "):
+            if input_si_no(f"¿«{y[0].upper() + y[1:]}» expresa una sensación o sentimiento? (s/n): ", "sentimiento"):
                 # Sanitización del OD para convertirlo en predicado
                 y_clean = y.replace(" ", ".")
-                return f"feel' ({x}, [{y_clean}'])" 
-    
-    elif AKT == "estado causativo" and input_si_no("¿El estado es un tipo de sensación o sentimiento (ej: «frío» o «amor»)? (s/n): "):
-            pred = peticion("Escribe esa sensación o sentimiento (ej: «frío» o «enamorado»): ").lower().replace(" ", ".")
-            return f"[do' ({x}, Ø)] CAUSE [feel' ({y}, [{pred}'])]"
+                return predicado("feel", x, predicado(y_clean))
+
+    elif AKT == "estado causativo" and input_si_no("¿El estado es un tipo de sensación o sentimiento (ej: «frío» o «amor»)? (s/n): ", "sentimiento"):
+            pred = peticion("Escribe esa sensación o sentimiento (ej: «frío» o «enamorado»): ", "sensacion").lower().replace(" ", ".")
+            return causa(predicado("do", x, "Ø"), predicado("feel", y, predicado(pred)))
     return None
 
 def informacion_mente(AKT, x, y, operador, es_dinamico, oracion_original):
-    if y == "Ø" or "causativ" in AKT or AKT == "realización activa":
-        return None
     pregunta = f"¿«{oracion_original[0].upper() + oracion_original[1:]}» describe que «{x}» conoce o llega a conocer lo expresado en «{y}»?\n(Si se trata de un verbo de dicción o de percepción sensorial, responde que no). (s/n): "
-    if input_si_no(pregunta):
+    if input_si_no(pregunta, "conocimiento"):
         if es_dinamico:
-            return f"{operador + ' ' if operador else ''}do' ({x}, [know' ({x}, {y})])"
-        return f"{operador + ' ' if operador else ''}know' ({x}, {y})"
+            return modificador(operador, predicado("do", x, predicado("know", x, y)))
+        return modificador(operador, predicado("know", x, y))
     return None
 
 def complemento_regimen(AKT, x, y, operador, es_dinamico, oracion_original):
-    if AKT in ["estado", "actividad", "proceso", "logro", "realización", "semelfactivo"] and y == "Ø" and input_si_no(f"¿Alguno de los constituyentes de «{oracion_original}» es un complemento de régimen\n(ej: «de defectos» en «la obra carece de defectos»)? (s/n): "):
-        
-        entrada_verbo = peticion("Escribe el infinitivo del verbo: ").lower().strip()
-        
+    if input_si_no(f"¿Alguno de los constituyentes de «{oracion_original}» es un complemento de régimen\n(ej: «de defectos» en «la obra carece de defectos»)? (s/n): ", "complemento_regimen"):
+
+        entrada_verbo = peticion("Escribe el infinitivo del verbo: ", "infinitivo").lower().strip()
+
         # --- FILTRO DE SEGURIDAD PARA VERBOS RECÍPROCOS ---
         verbo_aislado = entrada_verbo.split()[0]
-        
+
         # Si el verbo está en la lista de dicción recíproca (conversar, discutir, hablar...),
-        # ABORTAMOS esta función para que lo maneje 'predicados_especiales' más adelante.
-        categoria = buscar_verbo(verbo_aislado, VERBOS_DICCION)
+        # ABORTAMOS esta función para que lo maneje la regla «verbos_conversar» más adelante.
+        categoria = buscar_verbo(verbo_aislado, "VERBOS_DICCION")
         if categoria == "conversar":
             return None
         # --------------------------------------------------
 
         pred = entrada_verbo.replace(" ", ".")
-        suplemento = peticion("Escribe la información del complemento de régimen (sin preposición): ")
-        
+        suplemento = peticion("Escribe la información del complemento de régimen (sin preposición): ", "suplemento")
+
         if es_dinamico:
-            estructura_logica = f"{operador + ' ' if operador else ''}do' ({x}, [{pred}' ({x}, {suplemento})]) [MR1]"
-        else:        
-            estructura_logica = f"{operador + ' ' if operador else ''}{pred}' ({x}, {suplemento}) [MR1]"
-        
+            estructura_logica = macrorol(modificador(operador, predicado("do", x, predicado(pred, x, suplemento))), "MR1")
+        else:
+            estructura_logica = macrorol(modificador(operador, predicado(pred, x, suplemento)), "MR1")
+
         return estructura_logica
     return None
 
 def casos_locativos(estructura_logica, AKT, x, y, z, operador, es_dinamico, oracion_original):
     locus = "Ø"
-    if input_si_no(f"Considera la cláusula «{oracion_original}». \n¿Alguno de sus constituyentes argumentales (no periféricos)\nindica la ubicación, el destino o el punto de partida de «{x}»{' o «' + y + '»' if y != 'Ø' else ''}? (s/n): "):
-        locus = peticion("Escribe la información del lugar, sin preposición: ")
-        pred = peticion("Escribe el infinitivo del verbo: ").lower().replace(" ", ".")
-        
+    if input_si_no(f"Considera la cláusula «{oracion_original}». \n¿Alguno de sus constituyentes argumentales (no periféricos)\nindica la ubicación, el destino o el punto de partida de «{x}»{' o «' + y + '»' if y != 'Ø' else ''}? (s/n): ", "locativo"):
+        locus = peticion("Escribe la información del lugar, sin preposición: ", "lugar")
+        pred = peticion("Escribe el infinitivo del verbo: ", "infinitivo").lower().replace(" ", ".")
+
         # verbo "haber" con locativo
         if pred == "haber":
-            return f"be-loc' ({y}, {locus})", locus
-            
+            return predicado("be-loc", y, locus), locus
+
         # verbo "tener" con locativo
-        elif pred in VERBOS_POSESION["tener"]:
-            if input_si_no(f"¿«{y[0].upper() + y[1:]}» está situado en alguna parte de «{x}»? (s/n): "):
-                return f"have.as.part' ({x}, {y}) ∧ be-loc' ({y}, {locus})", locus
-            elif pred in ["tener", "poseer", "ostentar", "lucir"] and input_si_no(f"¿«{y[0].upper() + y[1:]}» indica una relación de parentesco? (s/n): "):
-                return f"have.as.kin' ({x}, {y}) ∧ be-loc' ({y}, {locus})", locus
+        elif en_clase(pred, "VERBOS_POSESION", "tener"):
+            ubicacion = predicado("be-loc", y, locus)
+            if input_si_no(f"¿«{y[0].upper() + y[1:]}» está situado en alguna parte de «{x}»? (s/n): ", "parte_de"):
+                return conjuncion(predicado("have.as.part", x, y), ubicacion), locus
+            elif pred in ["tener", "poseer", "ostentar", "lucir"] and input_si_no(f"¿«{y[0].upper() + y[1:]}» indica una relación de parentesco? (s/n): ", "parentesco"):
+                return conjuncion(predicado("have.as.kin", x, y), ubicacion), locus
             else:
-                return f"{pred}' ({x}, {y}) ∧ be-loc' ({y}, {locus})", locus
-        
+                return conjuncion(predicado(pred, x, y), ubicacion), locus
+
         # verbos tipo "irse" (MOVIMIENTO)
-        elif AKT in ("actividad", "logro", "realización", "proceso", "semelfactivo") and (buscar_verbo(pred, VERBOS_MOVIMIENTO) or input_si_no(f"¿Como resultado del evento, «{x}» dejó de estar o llegó a estar en «{locus}»? (s/n): ")):
+        elif AKT in ("actividad", "logro", "realización", "proceso", "semelfactivo") and (buscar_verbo(pred, "VERBOS_MOVIMIENTO") or input_si_no(f"¿Como resultado del evento, «{x}» dejó de estar o llegó a estar en «{locus}»? (s/n): ", "cambio_de_lugar")):
             if es_dinamico:
-                lugar_tipo = peticion(f"¿«{locus[0].upper() + locus[1:]}» es (1) la procedencia o (2) el destino? Escribe 1 o 2: ")
+                lugar_tipo = peticion(f"¿«{locus[0].upper() + locus[1:]}» es (1) la procedencia o (2) el destino? Escribe 1 o 2: ", "tipo_lugar")
                 if lugar_tipo == "1":
-                    return f"{operador + ' ' if operador else ''}do' ({x}, [NOT be-loc' ({x}, {locus})])", locus
+                    return modificador(operador, predicado("do", x, modificador("NOT", predicado("be-loc", x, locus)))), locus
                 if lugar_tipo == "2":
-                    return f"{operador + ' ' if operador else ''}do' ({x}, [be-loc' ({x}, {locus})])", locus
+                    return modificador(operador, predicado("do", x, predicado("be-loc", x, locus))), locus
             else:
-                lugar_tipo = peticion(f"¿«{locus[0].upper() + locus[1:]}» es (1) la procedencia o (2) el destino? Escribe 1 o 2: ")
+                lugar_tipo = peticion(f"¿«{locus[0].upper() + locus[1:]}» es (1) la procedencia o (2) el destino? Escribe 1 o 2: ", "tipo_lugar")
                 if lugar_tipo == "1":
-                    return f"{operador + ' ' if operador else ''}NOT be-loc' ({x}, {locus})", locus
+                    return modificador(operador, modificador("NOT", predicado("be-loc", x, locus))), locus
                 if lugar_tipo == "2":
-                    return f"{operador + ' ' if operador else ''}be-loc' ({x}, {locus})", locus
-        
+                    return modificador(operador, predicado("be-loc", x, locus)), locus
+
         # verbos tipo "echar"
-        elif AKT in ("logro causativo", "realización causativa", "proceso causativo", "semelfactivo causativo") and input_si_no(f"¿Como resultado del evento, «{y}» dejó de estar o llegó a estar en «{locus}»? (s/n): "):
+        elif AKT in ("logro causativo", "realización causativa", "proceso causativo", "semelfactivo causativo") and input_si_no(f"¿Como resultado del evento, «{y}» dejó de estar o llegó a estar en «{locus}»? (s/n): ", "cambio_de_lugar"):
             if es_dinamico:
-                lugar_tipo = peticion(f"¿«{locus[0].upper() + locus[1:]}» es (1) la procedencia o (2) el destino? Escribe 1 o 2: ")
+                lugar_tipo = peticion(f"¿«{locus[0].upper() + locus[1:]}» es (1) la procedencia o (2) el destino? Escribe 1 o 2: ", "tipo_lugar")
                 if lugar_tipo == "1":
-                    return f"[do' ({x}, Ø)] CAUSE [{operador + ' ' if operador else ''}do' ({y}, [NOT be-loc' ({locus}, {y})])]", locus
+                    return causa(predicado("do", x, "Ø"), modificador(operador, predicado("do", y, modificador("NOT", predicado("be-loc", locus, y))))), locus
                 if lugar_tipo == "2":
-                    return f"[do' ({x}, Ø)] CAUSE [{operador + ' ' if operador else ''}do' ({y}, [be-loc' ({locus}, {y})])]", locus
+                    return causa(predicado("do", x, "Ø"), modificador(operador, predicado("do", y, predicado("be-loc", locus, y)))), locus
             else:
-                lugar_tipo = peticion(f"¿«{locus[0].upper() + locus[1:]}» es (1) la procedencia o (2) el destino? Escribe 1 o 2: ")
+                lugar_tipo = peticion(f"¿«{locus[0].upper() + locus[1:]}» es (1) la procedencia o (2) el destino? Escribe 1 o 2: ", "tipo_lugar")
                 if lugar_tipo == "1":
-                    return f"[do' ({x}, Ø)] CAUSE [{operador + ' ' if operador else ''}NOT be-loc' ({locus}, {y})]", locus
+                    return causa(predicado("do", x, "Ø"), modificador(operador, modificador("NOT", predicado("be-loc", locus, y)))), locus
                 if lugar_tipo == "2":
-                    return f"[do' ({x}, Ø)] CAUSE [{operador + ' ' if operador else ''}be-loc' ({locus}, {y})]", locus
-        
+                    return causa(predicado("do", x, "Ø"), modificador(operador, predicado("be-loc", locus, y))), locus
+
         # verbos tipo "sacar" (TRANSFERENCIA)
-        elif pred in VERBOS_TRANSFERENCIA["sacar"] and not ((pred == "arrancar" or pred == "retirar") and "causativ" not in AKT):
-            return f"[do' ({x}, Ø)] CAUSE [{operador + ' ' if operador else ''}NOT be-loc' ({locus}, {y})]", locus
-        
+        elif en_clase(pred, "VERBOS_TRANSFERENCIA", "sacar") and not ((pred == "arrancar" or pred == "retirar") and "causativ" not in AKT):
+            return causa(predicado("do", x, "Ø"), modificador(operador, modificador("NOT", predicado("be-loc", locus, y)))), locus
+
         # "olvidar" algo en un lugar
         elif pred == "olvidar":
-            return f"{operador + ' ' if operador else ''}NOT know' ({x}, {y}) ∧ be-loc' ({y}, {locus})", locus
-        
+            return conjuncion(modificador(operador, modificador("NOT", predicado("know", x, y))), predicado("be-loc", y, locus)), locus
+
         # Otros casos locativos
         else:
             if AKT != "realización activa":
@@ -798,146 +860,399 @@ def casos_locativos(estructura_logica, AKT, x, y, z, operador, es_dinamico, orac
     return estructura_logica, locus
 
 
-def predicados_especiales(AKT, x, y, z, pred, operador, es_dinamico, oracion_original):
-    # casos como "algo huele mal"
-    if pred in VERBOS_PERCEPCION_IMPERSONAL and not es_dinamico and y == "Ø":
-        verbo_infinitivo = VERBOS_PERCEPCION_IMPERSONAL[pred]
-        cualidad = peticion(f"Escribe la cualidad percibida en «{oracion_original}» (ej: «mal», «raro», «a chocolate»): ").lower().replace(" ", ".")
-        return f"{operador + ' ' if operador else ''}{verbo_infinitivo}.{cualidad}' ({x})", False
-    
-    # verbos meteorológicos propios
-    if x == "Ø" and pred in VERBOS_METEOROLOGICOS:
-        return f"{operador + ' ' if operador else ''}do' ([{pred}'])", False
-    
-    if pred in VERBOS_DICCION["conversar"] and input_si_no(f"¿Hay un interlocutor en «{oracion_original}»? (s/n): "):
-        z = peticion("Escribe quién es el interlocutor: ")
-        
-        # SANITIZACIÓN
-        x_clean = x.replace(" ", ".")
-        y_clean = y.replace(" ", ".")
-        z_clean = z.replace(" ", ".")
-        
-        parte1 = f"[do' ({x}, [express.something.to.{z_clean}' ({x}, {y})])] PURP [{operador + ' ' if operador else ''}know' ({z}, {y})]"
-        parte2 = f"[do' ({z}, [express.something.to.{x_clean}' ({z}, {y})])] PURP [{operador + ' ' if operador else ''}know' ({x}, {y})]"
-        
-        if input_si_no(f"¿Tanto «{x}» como «{z}» actuaron de manera intencional en la conversación? (s/n): "):
-            return f"DO ({parte1}) ∧ DO ({parte2})", True
-        else:
-            return f"{parte1} ∧ {parte2}", True
-            
-    # verbos de olvido
-    if pred in ["olvidar", "desaprender"]:
-        if es_dinamico:
-            return f"{operador + ' ' if operador else ''}do' ({x}, [NOT know' ({x}, {y})])", False
-        else:
-            return f"{operador + ' ' if operador else ''}NOT know' ({x}, {y})", False
-    
-    # verbos como "perder"
-    if pred in VERBOS_POSESION["perder"]:
-        if es_dinamico:
-            return f"{operador + ' ' if operador else ''}do' ({x}, [NOT have' ({x}, {y})])", False
-        else:
-            return f"{operador + ' ' if operador else ''}NOT have' ({x}, {y})", False
-    
-    # verbos como "obtener"
-    if pred in VERBOS_POSESION["obtener"] and y != "Ø":
-        if es_dinamico:
-            return f"{operador + ' ' if operador else ''}do' ({x}, [INGR have' ({x}, {y})])", False
-        else:
-            return f"{operador + ' ' if operador else ''}have' ({x}, {y})", False
-    
-    # estados especiales
-    if AKT == "estado":
-        #verbos de desconocimiento
-        if pred in ["ignorar", "desconocer"]:
-            return f"NOT know' ({x}, {y})", False
-        #verbos de existencia con sujeto
-        elif pred in VERBOS_EXISTENCIA and y == "Ø":
-            return f"exist' ({x})", False
-        #verbos de existencia sin sujeto ("haber")
-        elif pred == "haber":
-            return f"exist' ({y})", False
-        #posesión alienable, inalienable y de parentesco
-        elif pred in VERBOS_POSESION["tener"] and y != "Ø":
-            if input_si_no(f"¿«{y[0].upper() + y[1:]}» es una parte constituyente de «{x}»? (s/n): "):
-                return f"have.as.part' ({x}, {y})", False
-            elif pred in ["tener", "poseer", "ostentar", "lucir"] and input_si_no(f"¿«{y[0].upper() + y[1:]}» indica una relación de parentesco? (s/n): "):
-                return f"have.as.kin' ({x}, {y})", False
-            else:
-                return f"have' ({x}, {y})", False
-    return None, False
+# Predicados especiales, identificados por el infinitivo que escribió el usuario
+def percepcion_impersonal(x, pred, operador, oracion_original): # casos como "algo huele mal"
+    verbo_infinitivo = VERBOS_PERCEPCION_IMPERSONAL[pred]
+    cualidad = peticion(f"Escribe la cualidad percibida en «{oracion_original}» (ej: «mal», «raro», «a chocolate»): ", "cualidad").lower().replace(" ", ".")
+    return modificador(operador, predicado(f"{verbo_infinitivo}.{cualidad}", x))
+
+def meteorologico_propio(pred, operador):
+    return modificador(operador, predicado("do", predicado(pred)))
+
+def verbos_conversar(x, y, operador, oracion_original):
+    if not input_si_no(f"¿Hay un interlocutor en «{oracion_original}»? (s/n): ", "hay_interlocutor"):
+        return None
+    z = peticion("Escribe quién es el interlocutor: ", "interlocutor")
+
+    # SANITIZACIÓN
+    x_clean = x.replace(" ", ".")
+    y_clean = y.replace(" ", ".")
+    z_clean = z.replace(" ", ".")
+
+    parte1 = proposito(predicado("do", x, predicado(f"express.something.to.{z_clean}", x, y)), modificador(operador, predicado("know", z, y)))
+    parte2 = proposito(predicado("do", z, predicado(f"express.something.to.{x_clean}", z, y)), modificador(operador, predicado("know", x, y)))
+
+    if input_si_no(f"¿Tanto «{x}» como «{z}» actuaron de manera intencional en la conversación? (s/n): ", "intencional"):
+        return conjuncion(intencional(parte1), intencional(parte2))
+    else:
+        return conjuncion(parte1, parte2)
+
+def verbos_olvido(x, y, operador, es_dinamico):
+    if es_dinamico:
+        return modificador(operador, predicado("do", x, modificador("NOT", predicado("know", x, y))))
+    else:
+        return modificador(operador, modificador("NOT", predicado("know", x, y)))
+
+def verbos_perder(x, y, operador, es_dinamico):
+    if es_dinamico:
+        return modificador(operador, predicado("do", x, modificador("NOT", predicado("have", x, y))))
+    else:
+        return modificador(operador, modificador("NOT", predicado("have", x, y)))
+
+def verbos_obtener(x, y, operador, es_dinamico):
+    if es_dinamico:
+        return modificador(operador, predicado("do", x, modificador("INGR", predicado("have", x, y))))
+    else:
+        return modificador(operador, predicado("have", x, y))
 
-def traducir_ls_a_ingles(ls_string):
+def estado_posesion(x, y, pred): #posesión alienable, inalienable y de parentesco
+    if input_si_no(f"¿«{y[0].upper() + y[1:]}» es una parte constituyente de «{x}»? (s/n): ", "parte_de"):
+        return predicado("have.as.part", x, y)
+    elif pred in ["tener", "poseer", "ostentar", "lucir"] and input_si_no(f"¿«{y[0].upper() + y[1:]}» indica una relación de parentesco? (s/n): ", "parentesco"):
+        return predicado("have.as.kin", x, y)
+    else:
+        return predicado("have", x, y)
+
+
+# --- REGISTRO DE REGLAS ---
+@dataclass
+class ContextoLS:
+    AKT: str
+    x: str
+    y: str
+    z: str
+    operador: str
+    es_dinamico: typing.Optional[bool]  # None (realización, proceso) cuenta como no dinámico
+    oracion_original: str
+    pred: str = ""
+    locus: str = "Ø"
+    es_verbo_reciproco: bool = False
+
+
+@dataclass(frozen=True)
+class Regla:
     """
-    Traduce constantes al inglés y las pone en NEGRITA.
-    Incluye un diccionario de correcciones ampliado para evitar ambigüedades 
-    donde el traductor confunde participios con sustantivos.
+    Caso especial de estructura lógica. «aktionsarts» vacío admite cualquiera; en
+    «argumentos», True exige el argumento (x, y, z), False exige Ø y None admite ambos.
+    «clases» y «lemas» restringen la regla a ciertos infinitivos (fase «predicado»).
+    El manejador devuelve la estructura lógica o None si, tras sus preguntas, no aplica.
+    Las reglas aplicables se prueban por «prioridad» creciente, que reproduce el orden de la
+    antigua cadena de manejadores: varias se solapan (p. ej. verbos_OI y casos_locativos con
+    cualquier z) y hacen preguntas distintas, así que el orden no se deriva de sus condiciones.
     """
-    if not ls_string:
-        return ls_string
+    nombre: str
+    fase: str
+    prioridad: int
+    manejador: typing.Callable[[ContextoLS], typing.Optional[Nodo]]
+    aktionsarts: typing.FrozenSet[str] = frozenset()
+    argumentos: typing.Tuple[typing.Optional[bool], typing.Optional[bool], typing.Optional[bool]] = (None, None, None)
+    dinamico: typing.Optional[bool] = None
+    clases: typing.FrozenSet[ClaseVerbal] = frozenset()
+    lemas: typing.FrozenSet[str] = frozenset()
+    reciproco: bool = False
+
+    def admite_patron(self, patron) -> bool:
+        return all(exigido is None or exigido == presente for exigido, presente in zip(self.argumentos, patron))
+
+
+def _locativos(ctx: ContextoLS) -> typing.Optional[Nodo]:
+    estructura_logica, ctx.locus = casos_locativos(None, ctx.AKT, ctx.x, ctx.y, ctx.z, ctx.operador, ctx.es_dinamico, ctx.oracion_original)
+    return estructura_logica
 
-    # Códigos ANSI para formato en terminal
-    NEGRITA = "\033[1m"
-    RESET = "\033[0m"
-    
-    # --- DICCIONARIO DE CORRECCIONES MANUALES ---
-    CORRECCIONES = {
-        "pintada": "painted", "pintado": "painted",
-        "comida": "eaten", "comido": "eaten",
-        "bebida": "drunk", "bebido": "drunk",
-        "parada": "stopped", "parado": "stopped",
-        "herida": "wounded", "herido": "wounded",
-        "llamada": "called", "llamado": "called",
-        "vista": "seen", "visto": "seen",
-        "hecha": "made", "hecho": "made",
-        "vuelta": "returned", "vuelto": "returned",
-        "puesta": "put", "puesto": "put",
-        "escrito": "written", "escrita": "written",
-        "abierto": "open", "abierta": "open", 
-        "rota": "broken", "roto": "broken",
-        "muerto": "dead", "muerta": "dead", 
-        "dicho": "said", "dicha": "said"
-    }
 
-    translator = GoogleTranslator(source='es', target='en')
+NO_CAUSATIVOS = frozenset(akt for akt in AKTIONSART_OPCIONES.values() if "causativ" not in akt)
+SI, NO = True, False  # argumento presente / ausente (Ø)
+
+REGLAS_LS = (
+    # Fase «argumentos»: antes de pedir el infinitivo
+    Regla("verbos_doler_gustar", "argumentos", 10,
+          lambda c: verbos_doler_gustar(c.AKT, c.x, c.y, c.z, c.operador, c.es_dinamico, c.oracion_original),
+          aktionsarts=NO_CAUSATIVOS - {"realización activa"}, argumentos=(SI, NO, SI)),
+    Regla("hacer_meteorologico", "argumentos", 20,
+          lambda c: hacer_meteorologico(c.x, c.y, c.oracion_original, c.operador, c.es_dinamico),
+          argumentos=(NO, SI, None)),
+    Regla("casos_impersonales", "argumentos", 30,
+          lambda c: casos_impersonales(c.x, c.y, c.z, c.operador, c.es_dinamico),
+          argumentos=(NO, NO, SI), dinamico=False),
+    Regla("casos_locativo_dativos", "argumentos", 40,
+          lambda c: casos_locativo_dativos(c.AKT, c.x, c.y, c.z, c.operador, c.es_dinamico),
+          aktionsarts=NO_CAUSATIVOS - {"estado"}, argumentos=(SI, NO, SI)),
+    Regla("verbos_OI", "argumentos", 50,
+          lambda c: verbos_OI(c.AKT, c.x, c.y, c.z, c.operador),
+          aktionsarts=frozenset(AKTIONSART_OPCIONES.values()) - {"realización activa causativa"}, argumentos=(None, None, SI)),
+    Regla("casos_especiales_estado", "argumentos", 60,
+          lambda c: casos_especiales_estado(c.AKT, c.x, c.y, c.oracion_original),
+          aktionsarts=frozenset({"estado", "estado causativo"})),
+    Regla("informacion_mente", "argumentos", 70,
+          lambda c: informacion_mente(c.AKT, c.x, c.y, c.operador, c.es_dinamico, c.oracion_original),
+          aktionsarts=NO_CAUSATIVOS - {"realización activa"}, argumentos=(None, SI, None)),
+    Regla("casos_locativos", "argumentos", 80, _locativos),
+    Regla("complemento_regimen", "argumentos", 90,
+          lambda c: complemento_regimen(c.AKT, c.x, c.y, c.operador, c.es_dinamico, c.oracion_original),
+          aktionsarts=frozenset({"estado", "actividad", "proceso", "logro", "realización", "semelfactivo"}), argumentos=(None, NO, None)),
+
+    # Fase «predicado»: según el infinitivo escrito por el usuario
+    Regla("percepcion_impersonal", "predicado", 110,
+          lambda c: percepcion_impersonal(c.x, c.pred, c.operador, c.oracion_original),
+          argumentos=(None, NO, None), dinamico=False, clases=frozenset({("VERBOS_PERCEPCION_IMPERSONAL", None)})),
+    Regla("meteorologico_propio", "predicado", 120,
+          lambda c: meteorologico_propio(c.pred, c.operador),
+          argumentos=(NO, None, None), clases=frozenset({("VERBOS_METEOROLOGICOS", None)})),
+    Regla("verbos_conversar", "predicado", 130,
+          lambda c: verbos_conversar(c.x, c.y, c.operador, c.oracion_original),
+          clases=frozenset({("VERBOS_DICCION", "conversar")}), reciproco=True),
+    Regla("verbos_olvido", "predicado", 140,
+          lambda c: verbos_olvido(c.x, c.y, c.operador, c.es_dinamico),
+          lemas=frozenset({"olvidar", "desaprender"})),
+    Regla("verbos_perder", "predicado", 150,
+          lambda c: verbos_perder(c.x, c.y, c.operador, c.es_dinamico),
+          clases=frozenset({("VERBOS_POSESION", "perder")})),
+    Regla("verbos_obtener", "predicado", 160,
+          lambda c: verbos_obtener(c.x, c.y, c.operador, c.es_dinamico),
+          argumentos=(None, SI, None), clases=frozenset({("VERBOS_POSESION", "obtener")})),
+    Regla("estado_desconocimiento", "predicado", 170,
+          lambda c: modificador("NOT", predicado("know", c.x, c.y)),
+          aktionsarts=frozenset({"estado"}), lemas=frozenset({"ignorar", "desconocer"})),
+    Regla("estado_existencia", "predicado", 180,
+          lambda c: predicado("exist", c.x),
+          aktionsarts=frozenset({"estado"}), argumentos=(None, NO, None), clases=frozenset({("VERBOS_EXISTENCIA", None)})),
+    Regla("estado_haber", "predicado", 190,
+          lambda c: predicado("exist", c.y),
+          aktionsarts=frozenset({"estado"}), lemas=frozenset({"haber"})),
+    Regla("estado_posesion", "predicado", 200,
+          lambda c: estado_posesion(c.x, c.y, c.pred),
+          aktionsarts=frozenset({"estado"}), argumentos=(None, SI, None), clases=frozenset({("VERBOS_POSESION", "tener")})),
+)
+
+
+def indexar_reglas(reglas) -> typing.Mapping[typing.Tuple[str, str, typing.Tuple[bool, bool, bool]], typing.Tuple[Regla, ...]]:
+    """
+    Índice (fase, aktionsart, patrón de argumentos) -> reglas aplicables, en orden de prioridad.
+    """
+    patrones = [(px, py, pz) for px in (True, False) for py in (True, False) for pz in (True, False)]
+    indice = {}
+    for fase in ("argumentos", "predicado"):
+        for AKT in AKTIONSART_OPCIONES.values():
+            for patron in patrones:
+                aplicables = [regla for regla in reglas if regla.fase == fase
+                              and (not regla.aktionsarts or AKT in regla.aktionsarts) and regla.admite_patron(patron)]
+                aplicables.sort(key=lambda regla: regla.prioridad)
+                indice[fase, AKT, patron] = tuple(aplicables)
+    return MappingProxyType(indice)
+
+
+INDICE_REGLAS = indexar_reglas(REGLAS_LS)
+
+
+def reglas_aplicables(ctx: ContextoLS, fase: str) -> typing.List[Regla]:
+    patron = (ctx.x != "Ø", ctx.y != "Ø", ctx.z != "Ø")
+    clases = clases_verbo(ctx.pred)
+    return [regla for regla in INDICE_REGLAS.get((fase, ctx.AKT, patron), ())
+            if (regla.dinamico is None or regla.dinamico == bool(ctx.es_dinamico))
+            and (not (regla.clases or regla.lemas) or ctx.pred in regla.lemas or regla.clases & clases)]
+
+
+def aplicar_reglas(ctx: ContextoLS, fase: str) -> typing.Optional[Nodo]:
+    """Ejecuta las reglas aplicables de la fase hasta que una devuelva una estructura lógica."""
+    for regla in reglas_aplicables(ctx, fase):
+        estructura_logica = regla.manejador(ctx)
+        if estructura_logica is not None:
+            ctx.es_verbo_reciproco = regla.reciproco
+            return estructura_logica
+    return None
 
-    def reemplazar_match(match):
-        constante = match.group(1) 
-        
-        # Variable para guardar la palabra final
-        palabra_final = constante
-        constante_lower = constante.lower()
+# --- DICCIONARIO DE CORRECCIONES MANUALES ---
+# Evita ambigüedades donde el traductor confunde participios con sustantivos
+CORRECCIONES = {
+    "pintada": "painted", "pintado": "painted",
+    "comida": "eaten", "comido": "eaten",
+    "bebida": "drunk", "bebido": "drunk",
+    "parada": "stopped", "parado": "stopped",
+    "herida": "wounded", "herido": "wounded",
+    "llamada": "called", "llamado": "called",
+    "vista": "seen", "visto": "seen",
+    "hecha": "made", "hecho": "made",
+    "vuelta": "returned", "vuelto": "returned",
+    "puesta": "put", "puesto": "put",
+    "escrito": "written", "escrita": "written",
+    "abierto": "open", "abierta": "open", 
+    "rota": "broken", "roto": "broken",
+    "muerto": "dead", "muerta": "dead", 
+    "dicho": "said", "dicha": "said"
+}
+
+# Glosario precompilado con todos los verbos de los léxicos y sus participios
+# (se regenera con construir_glosario.py); permite traducir sin conexión
+RUTA_GLOSARIO = os.path.join(os.path.dirname(os.path.abspath(__file__)), "glosario_en.json")
 
+
+def cargar_glosario(ruta: str = RUTA_GLOSARIO) -> typing.Dict[str, str]:
+    try:
+        with open(ruta, encoding="utf-8") as archivo:
+            return json.load(archivo)
+    except (OSError, ValueError) as e:
+        logging.warning(f"No se pudo cargar el glosario «{ruta}»: {e}")
+        return {}
+
+
+# Se carga en obtener_glosario, la primera vez que se traduce
+GLOSARIO: typing.Optional[typing.Dict[str, str]] = None
+
+
+def obtener_glosario() -> typing.Dict[str, str]:
+    global GLOSARIO
+    if GLOSARIO is None:
+        GLOSARIO = cargar_glosario()
+    return GLOSARIO
+
+
+def obtener_cache() -> "CacheTraduccion":
+    global CACHE_TRADUCCION
+    if CACHE_TRADUCCION is None:
+        from cache_traduccion import CacheTraduccion
+        CACHE_TRADUCCION = CacheTraduccion()
+    return CACHE_TRADUCCION
+
+# Google admite hasta 5000 caracteres por consulta; se deja margen
+MAX_CARACTERES_CONSULTA = 4500
+
+_traductor = None
+
+
+def obtener_traductor():
+    """Traductor con tiempo límite y cortacircuitos (ver backends_traduccion.py)."""
+    global _traductor
+    if _traductor is None:
+        from backends_traduccion import crear_traductor
+        _traductor = crear_traductor()
+    return _traductor
+
+
+def traducir_en_lote(textos: typing.List[str]) -> typing.List[typing.Optional[str]]:
+    """
+    Traduce varios textos con una sola consulta por bloque, uniéndolos con saltos de línea.
+    Devuelve None en la posición de los textos que no pudieron traducirse.
+    """
+    resultados: typing.List[typing.Optional[str]] = []
+    bloque: typing.List[str] = []
+    largo = 0
+    for texto in textos:
+        if bloque and largo + len(texto) + 1 > MAX_CARACTERES_CONSULTA:
+            resultados.extend(_traducir_bloque(bloque))
+            bloque, largo = [], 0
+        bloque.append(texto)
+        largo += len(texto) + 1
+    if bloque:
+        resultados.extend(_traducir_bloque(bloque))
+    return resultados
+
+
+def _traducir_bloque(bloque: typing.List[str]) -> typing.List[typing.Optional[str]]:
+    try:
+        respuesta = obtener_traductor().translate("\n".join(bloque))
+    except Exception:
+        return [None] * len(bloque)
+    partes = respuesta.split("\n") if respuesta else []
+    if len(partes) == len(bloque):
+        return partes
+    # El traductor fusionó o separó líneas: se consulta cada texto por separado
+    resultados: typing.List[typing.Optional[str]] = []
+    for texto in bloque:
+        try:
+            resultados.append(obtener_traductor().translate(texto))
+        except Exception:
+            resultados.append(None)
+    return resultados
+
+
+def traducir_constantes(constantes: typing.Iterable[str]) -> typing.Dict[str, str]:
+    """
+    Devuelve un diccionario constante -> constante en inglés. Primero se resuelven las
+    palabras reservadas, el glosario, las correcciones y la caché; las constantes restantes se
+    traducen juntas en una sola consulta. Si la traducción falla, se conserva el español.
+    """
+    traducciones: typing.Dict[str, str] = {}
+    pendientes: typing.Dict[str, typing.List[str]] = {}
+    glosario = obtener_glosario()
+    cache = obtener_cache()
+
+    for constante in dict.fromkeys(constantes):
+        constante_lower = constante.lower()
         # 1. Si está en la lista de palabras reservadas RRG, no tocar
         if constante_lower in RRG_KEYWORDS:
-            pass
-            
-        # 2. Si está en nuestro DICCIONARIO DE CORRECCIONES, usar esa versión
+            traducciones[constante] = constante
+        # 2. Si está en el glosario precompilado, no hace falta consultar la red
+        elif constante_lower in glosario:
+            traducciones[constante] = glosario[constante_lower]
+        # 3. Si está en nuestro DICCIONARIO DE CORRECCIONES, usar esa versión
         elif constante_lower in CORRECCIONES:
-            palabra_final = CORRECCIONES[constante_lower]
-            
-        # 3. Si no, intentar traducción normal
+            traducciones[constante] = CORRECCIONES[constante_lower]
+        # 4. Si no, buscar en la caché o dejarla pendiente para la traducción en lote
         else:
             texto_limpio = constante.replace(".", " ")
-            if texto_limpio in CACHE_TRADUCCION:
-                palabra_final = CACHE_TRADUCCION[texto_limpio]
+            en_cache = cache.obtener(texto_limpio)
+            if en_cache is not None:
+                traducciones[constante] = en_cache
             else:
-                try:
-                    traduccion = translator.translate(texto_limpio)
-                    if traduccion:
-                        palabra_final = traduccion.lower().strip().replace(" ", ".")
-                        CACHE_TRADUCCION[texto_limpio] = palabra_final
-                except Exception:
-                    pass 
+                traducciones[constante] = constante
+                pendientes.setdefault(texto_limpio, []).append(constante)
 
-        return f"{NEGRITA}{palabra_final}'{RESET}"
+    if pendientes:
+        textos = list(pendientes)
+        for texto_limpio, traduccion in zip(textos, traducir_en_lote(textos)):
+            if not traduccion:
+                continue
+            palabra_final = traduccion.lower().strip().replace(" ", ".")
+            cache.guardar(texto_limpio, palabra_final)
+            for constante in pendientes[texto_limpio]:
+                traducciones[constante] = palabra_final
 
-    patron = r"\b([a-zA-Zñáéíóúü\._Ø0-9\-]+)'"
-    ls_traducida = re.sub(patron, reemplazar_match, ls_string)
-    return ls_traducida
+    return traducciones
 
-def main():
-    set_spanish_locale()
+
+_ejecutor_traduccion: typing.Optional["ThreadPoolExecutor"] = None
+
+
+def _ejecutor() -> "ThreadPoolExecutor":
+    # Un solo hilo: las traducciones se encolan en orden y la segunda aprovecha la caché de la primera
+    global _ejecutor_traduccion
+    if _ejecutor_traduccion is None:
+        from concurrent.futures import ThreadPoolExecutor
+        _ejecutor_traduccion = ThreadPoolExecutor(max_workers=1, thread_name_prefix="traduccion")
+    return _ejecutor_traduccion
+
+
+def precargar_traducciones(estructura_logica: Nodo) -> "Future":
+    """Traduce en segundo plano las constantes de la estructura para tenerlas en caché cuando se necesiten."""
+    return _ejecutor().submit(traducir_constantes, constantes(estructura_logica))
+
+
+def traducir_en_segundo_plano(estructura_logica: Nodo) -> "Future":
+    return _ejecutor().submit(traducir_estructura, estructura_logica)
+
+
+def resultado_traduccion(futuro: "Future", respaldo, espera: typing.Optional[float] = None):
+    """
+    Devuelve la traducción de «futuro»; si falla (ej. sin internet) o no termina en
+    «espera» segundos, devuelve «respaldo». Con espera=None se espera hasta el final.
+    """
+    try:
+        return futuro.result(timeout=espera)
+    except Exception:
+        return respaldo
+
+
+def traducir_estructura(estructura_logica: Nodo) -> Nodo:
+    """Devuelve una copia del árbol con las constantes traducidas al inglés (una sola consulta de red)."""
+    return reemplazar_constantes(estructura_logica, traducir_constantes(constantes(estructura_logica)))
+
+
+def run():
+    """Punto de entrada para el menú principal (main.py)."""
+    main()
+
+
+def mostrar_presentacion():
     limpiar_consola()
     print("""
 Este programa puede asistirte en la formalización de la estructura lógica básica
@@ -946,87 +1261,373 @@ de una cláusula.
 Advertencia: el programa solo maneja cláusulas simples, con su estructura argumental
 típica, y puede dar resultados inexactos en construcciones que las alteran.
     """)
-    
+
+
+def obtener_estructura_logica(AKT, oracion_original, es_dinamico, precargar: bool = True) -> Nodo:
+    """
+    Pregunta por los argumentos y el predicado de la cláusula y devuelve su estructura lógica en español.
+    Con precargar=False no se adelanta la traducción (el modo por lotes traduce por bloques).
+    """
+    x, y, z = obtener_argumentos(oracion_original)
+    ctx = ContextoLS(AKT, x, y, z, MODIFICADORES_AKT.get(AKT, ""), es_dinamico, oracion_original)
+
+    # Casos especiales según el aktionsart y los argumentos (ver REGLAS_LS)
+    estructura_logica = aplicar_reglas(ctx, "argumentos")
+    # Casos especiales según el infinitivo ingresado por el usuario
+    if estructura_logica is None:
+        ctx.pred = obtener_predicado(AKT, y, es_dinamico)
+        estructura_logica = aplicar_reglas(ctx, "predicado")
+    # Genera la estructura lógica si no se ha hecho hasta el momento
+    if estructura_logica is None:
+        estructura_logica = generar_estructura_logica(AKT, x, y, z, ctx.pred, ctx.locus, es_dinamico, oracion_original)
+    # Las constantes se traducen mientras el usuario responde las preguntas restantes
+    if precargar:
+        precargar_traducciones(estructura_logica)
+
+    # Adición de la capa de intencionalidad DO
+    if not ctx.es_verbo_reciproco and x != "Ø":
+        estructura_logica = aplicar_DO(oracion_original, x, estructura_logica, es_dinamico, AKT)
+    # Verificación de construcción anticausativa (se + verbo con contraparte causativa)
+    if AKT in ["realización", "logro", "proceso", "semelfactivo"] and y == "Ø":
+        if input_si_no(f"¿El verbo de la cláusula está construido con el clítico «se» \ny tiene una contraparte causativa (ej: «romperse» / «romper»)? (s/n): ", "anticausativo"):
+            estructura_logica = causa(predicado("do", "Ø", "Ø"), estructura_logica)
+    return estructura_logica
+
+
+def mostrar_estructura_logica(estructura_logica: Nodo) -> str:
+    """Muestra la estructura traducida al inglés, añade los operadores elegidos y devuelve el resultado final."""
+    # --- TRADUCCIÓN AUTOMÁTICA (en segundo plano) ---
+    # Si algo falla (ej. sin internet), usamos la versión en español
+    traduccion = traducir_en_segundo_plano(estructura_logica)
+    ls_ingles = resultado_traduccion(traduccion, None, espera=0.2)
+    traduccion_mostrada = ls_ingles is not None
+    if traduccion_mostrada:
+        print(f"\nLa estructura lógica es: {ANSI.renderizar(ls_ingles)}")
+    else:
+        print(f"\nLa estructura lógica es: {estructura_logica} \033[2m(traducción al inglés en curso...)\033[0m")
+
+    # Los operadores se eligen mientras termina la traducción y se añaden sobre la versión traducida
+    operadores_con_valores = seleccionar_operadores()
+    if not traduccion_mostrada:
+        ls_ingles = resultado_traduccion(traduccion, estructura_logica)
+    if operadores_con_valores:
+        ls_ingles = con_operadores(ls_ingles, operadores_con_valores)
+        print(f"\nLa estructura lógica con operadores es: {ANSI.renderizar(ls_ingles)}")
+    elif not traduccion_mostrada:
+        print(f"\nLa estructura lógica es: {ANSI.renderizar(ls_ingles)}")
+    return ANSI.renderizar(ls_ingles)
+
+
+def procesar_clausula(AKT, oracion_original, es_dinamico) -> typing.Optional[str]:
+    try:
+        return mostrar_estructura_logica(obtener_estructura_logica(AKT, oracion_original, es_dinamico))
+    except (RespuestaNoDisponible, EOFError):
+        raise
+    except ValueError as ve:
+        print(f"\nError: {ve}")
+    except Exception as e:
+        print(f"\nHa ocurrido un error inesperado: {e}")
+        print(f"Tipo de error: {type(e).__name__}")
+    return None
+
+
+def generar_ls(aktionsart: typing.Union["Aktionsart", str], oracion_original: str,
+               rasgos: typing.Optional["RasgosPred"] = None,
+               datos_clausula: typing.Optional["DatosClause"] = None) -> typing.Optional[str]:
+    """
+    Obtiene la estructura lógica de una cláusula ya clasificada por aktionsart.py, sin
+    volver a preguntar lo que ya se sabe: la dinamicidad se toma de «rasgos» y el sujeto,
+    el infinitivo y el participio detectados en «datos_clausula» se ofrecen como respuesta.
+    Devuelve la estructura lógica final (traducida y con operadores) o None si hubo un error.
+    """
+    AKT = getattr(aktionsart, "value", aktionsart)
+    set_spanish_locale()
+    mostrar_presentacion()
+    print(f"El aktionsart que obtuviste en «{oracion_original}» fue: {AKT.upper()}")
+    if rasgos is None:
+        es_dinamico = verificar_dinamicidad(AKT, oracion_original)
+    else:
+        es_dinamico = rasgos.dinamico and AKT not in ["estado", "estado causativo"]
+
+    conocidos = {}
+    if datos_clausula is not None:
+        conocidos = {
+            "sujeto": datos_clausula.sujeto,
+            "infinitivo": datos_clausula.infinitivo,
+            "participio": datos_clausula.participio,
+        }
+    with sugerencias(conocidos):
+        return procesar_clausula(AKT, oracion_original, es_dinamico)
+
+
+# --- MODO POR LOTES ---
+
+ESTADOS = ("estado", "estado causativo")
+VALORES_SI = {"s", "si", "sí", "true", "1", "dinamico", "dinámico"}
+VALORES_NO = {"n", "no", "false", "0", "estatico", "estático"}
+
+
+@dataclass
+class RegistroLS:
+    """
+    Cláusula del modo por lotes con lo que el modo interactivo preguntaría: los argumentos,
+    el infinitivo («predicado») y, si hace falta, el participio o atributo. «respuestas»
+    contesta las demás preguntas, en orden (lista) o por clave (diccionario). Claves:
+
+        dinamicidad, evento_resultante: prueba de dinamicidad (si no viene «dinamico»)
+        intencional, anticausativo: capa DO y construcción anticausativa con «se»
+        percepcion, sentido (1-5): verbos de percepción sensorial
+        locativo, lugar, cambio_de_lugar, tipo_lugar (1 procedencia, 2 destino): locativos
+        parte_de, parentesco: posesión inalienable y de parentesco
+        complemento_regimen, preposicion, suplemento: complementos de régimen
+        tipo_realizacion_activa (1-4), actividad, alimento, desplazamiento_como_consumo:
+            realizaciones activas
+        estructura_dativa, destino_dativo, diccion, transferencia, transmision_conocimiento:
+            construcciones con complemento indirecto
+        conocimiento, estado_climatico, atributo_esencial, atributo, sentimiento, sensacion:
+            estados de conocimiento, clima, atributos y sensaciones
+        verbo_hacer, adverbio, cualidad: meteorológicos con «hacer», impersonales
+            («le va bien») y percepción impersonal («huele mal»)
+        hay_interlocutor, interlocutor: verbos recíprocos de dicción («conversar»)
+    """
+    aktionsart: str
+    oracion: str
+    x: str = "0"
+    y: str = "0"
+    z: str = "0"
+    predicado: str = ""
+    participio: str = ""
+    dinamico: typing.Optional[bool] = None
+    respuestas: typing.Union[typing.List[str], typing.Dict[str, str]] = field(default_factory=list)
+    operadores: typing.List[typing.Tuple[str, typing.Optional[str]]] = field(default_factory=list)
+
+    @classmethod
+    def desde_dict(cls, datos: typing.Mapping[str, typing.Any]) -> "RegistroLS":
+        """Crea el registro a partir de una línea JSONL o una fila CSV (donde todo es texto)."""
+        if not datos.get("aktionsart") or not datos.get("oracion"):
+            raise ValueError("El registro debe indicar «aktionsart» y «oracion».")
+        return cls(
+            aktionsart=str(datos["aktionsart"]).strip().lower(),
+            oracion=str(datos["oracion"]).strip(),
+            x=str(datos.get("x") or "0").strip(),
+            y=str(datos.get("y") or "0").strip(),
+            z=str(datos.get("z") or "0").strip(),
+            predicado=str(datos.get("predicado") or "").strip(),
+            participio=str(datos.get("participio") or "").strip(),
+            dinamico=_leer_dinamicidad(datos.get("dinamico")),
+            respuestas=_leer_respuestas(datos.get("respuestas")),
+            operadores=_leer_operadores(datos.get("operadores")),
+        )
+
+
+def _leer_dinamicidad(valor) -> typing.Optional[bool]:
+    if valor is None or isinstance(valor, bool):
+        return valor
+    texto = str(valor).strip().lower()
+    if not texto:
+        return None
+    if texto in VALORES_SI:
+        return True
+    if texto in VALORES_NO:
+        return False
+    raise ValueError(f"Valor de «dinamico» no válido: «{valor}».")
+
+
+def _leer_respuestas(valor) -> typing.Union[typing.List[str], typing.Dict[str, str]]:
+    # En CSV: una lista u objeto JSON, o las respuestas separadas por «|»
+    if isinstance(valor, str):
+        valor = valor.strip()
+        if valor.startswith(("[", "{")):
+            valor = json.loads(valor)
+        else:
+            return [respuesta.strip() for respuesta in valor.split("|")] if valor else []
+    if isinstance(valor, dict):
+        return {str(clave): str(respuesta) for clave, respuesta in valor.items()}
+    return [str(respuesta) for respuesta in valor or []]
+
+
+def _leer_operadores(valor) -> typing.List[typing.Tuple[str, typing.Optional[str]]]:
+    # En CSV: «TNS:PAST|IF:DEC»; en JSONL: [["TNS", "PAST"], ["IF", "DEC"]]
+    if isinstance(valor, str):
+        valor = [parte.split(":", 1) for parte in valor.split("|") if parte.strip()]
+    codigos = {op.codigo: op for op in OPERADORES}
+    operadores = []
+    for par in valor or []:
+        codigo = str(par[0]).strip().upper()
+        if codigo not in codigos:
+            raise ValueError(f"Operador desconocido: «{codigo}». Opciones: {', '.join(codigos)}.")
+        op = codigos[codigo]
+        valor_op = str(par[1]).strip().upper() if len(par) > 1 and par[1] else None
+        if op.requiere_valor and not valor_op:
+            raise ValueError(f"El operador «{codigo}» requiere un valor (ej: {op.ejemplos}).")
+        if codigo == "STA" and valor_op == "NEG":
+            valor_op = "NEG +"
+        operadores.append((codigo, valor_op if op.requiere_valor else None))
+    # Mismo orden que en el modo interactivo: de la capa clausular a la nuclear
+    operadores.sort(key=lambda par: OPERADORES.index(codigos[par[0]]))
+    return operadores
+
+
+def estructura_de_registro(registro: RegistroLS) -> Nodo:
+    """Genera, sin preguntar nada, la estructura lógica en español (sin operadores) de «registro»."""
+    AKT = registro.aktionsart
+    if AKT not in AKTIONSART_OPCIONES.values():
+        raise ValueError(f"Aktionsart desconocido: «{AKT}».")
+    reglas = {"sujeto": registro.x, "complemento_directo": registro.y, "complemento_indirecto": registro.z}
+    if registro.predicado:
+        reglas["infinitivo"] = registro.predicado
+    if registro.participio:
+        reglas["participio"] = registro.participio
+    if isinstance(registro.respuestas, dict):
+        proveedor = ProveedorReglas({**reglas, **registro.respuestas})
+    else:
+        proveedor = ProveedorReglas(reglas, ProveedorReproduccion(registro.respuestas))
+
+    # Los avisos de los manejadores van a stderr para no mezclarse con la salida JSONL
+    with usar_proveedor(proveedor), redirect_stdout(sys.stderr):
+        if registro.dinamico is None:
+            es_dinamico = verificar_dinamicidad(AKT, registro.oracion)
+        else:
+            es_dinamico = registro.dinamico and AKT not in ESTADOS
+        return obtener_estructura_logica(AKT, registro.oracion, es_dinamico, precargar=False)
+
+
+def leer_registros(entrada: typing.TextIO, formato: str) -> typing.Iterator[typing.Mapping[str, typing.Any]]:
+    if formato == "csv":
+        import csv
+        yield from csv.DictReader(entrada)
+        return
+    for linea in entrada:
+        if linea.strip():
+            yield json.loads(linea)
+
+
+def generar_lote(registros: typing.Iterable[typing.Mapping[str, typing.Any]], salida: typing.TextIO,
+                 traducir: bool = True, tamano_bloque: int = 500) -> typing.Tuple[int, int]:
+    """
+    Genera la estructura lógica de cada registro y escribe en «salida» un objeto JSON por
+    registro, en el mismo orden. Los registros se procesan por bloques: las constantes de
+    todo el bloque se traducen juntas, de modo que cada constante se consulta una sola vez.
+    Devuelve (registros procesados, registros con error).
+    """
+    procesados = errores = 0
+    bloque: typing.List[typing.Mapping[str, typing.Any]] = []
+    for datos in registros:
+        bloque.append(datos)
+        if len(bloque) >= tamano_bloque:
+            errores += _generar_bloque(bloque, salida, traducir)
+            procesados += len(bloque)
+            bloque = []
+    if bloque:
+        errores += _generar_bloque(bloque, salida, traducir)
+        procesados += len(bloque)
+    return procesados, errores
+
+
+def _generar_bloque(bloque, salida: typing.TextIO, traducir: bool) -> int:
+    resultados = []
+    for datos in bloque:
+        registro = estructura = error = None
+        try:
+            registro = RegistroLS.desde_dict(datos)
+            estructura = estructura_de_registro(registro)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}" if not isinstance(e, ValueError) else str(e)
+        resultados.append((datos, registro, estructura, error))
+
+    traducciones: typing.Dict[str, str] = {}
+    if traducir:
+        traducciones = traducir_constantes(constante for _, _, estructura, _ in resultados
+                                           if estructura is not None for constante in constantes(estructura))
+
+    errores = 0
+    for datos, registro, estructura, error in resultados:
+        salida_registro = {"oracion": datos.get("oracion"), "aktionsart": datos.get("aktionsart"), "exito": error is None}
+        if estructura is not None:
+            final = con_operadores(reemplazar_constantes(estructura, traducciones), registro.operadores)
+            salida_registro.update({
+                "estructura_logica_es": str(estructura),
+                "estructura_logica": str(final),
+                "arbol": a_dict(final),
+            })
+        else:
+            salida_registro["error"] = error
+            errores += 1
+        salida.write(json.dumps(salida_registro, ensure_ascii=False) + "\n")
+    return errores
+
+
+def main_lote(argumentos: typing.Sequence[str]) -> int:
+    import argparse
+    import csv
+
+    parser = argparse.ArgumentParser(
+        description="Estructuras lógicas por lotes a partir de registros CSV o JSONL, sin preguntas."
+    )
+    parser.add_argument("--lote", required=True, metavar="ARCHIVO",
+                        help="archivo de registros («-» para leer de la entrada estándar)")
+    parser.add_argument("--salida", default="-", metavar="ARCHIVO",
+                        help="archivo JSONL de salida («-» para la salida estándar)")
+    parser.add_argument("--formato", choices=["csv", "jsonl"], default=None,
+                        help="formato de los registros (por defecto, según la extensión; JSONL si no es .csv)")
+    parser.add_argument("--tamano-bloque", type=int, default=500, metavar="N",
+                        help="registros cuyas constantes se traducen juntas (por defecto: 500)")
+    parser.add_argument("--sin-traduccion", action="store_true",
+                        help="deja las constantes en español")
+    args = parser.parse_args(argumentos)
+    establecer_ritmo("cero")
+
+    formato = args.formato or ("csv" if args.lote.lower().endswith(".csv") else "jsonl")
+    entrada = sys.stdin if args.lote == "-" else open(args.lote, encoding="utf-8", newline="")
+    salida = sys.stdout if args.salida == "-" else open(args.salida, "w", encoding="utf-8")
+    try:
+        procesados, errores = generar_lote(leer_registros(entrada, formato), salida,
+                                           not args.sin_traduccion, args.tamano_bloque)
+    except (ValueError, csv.Error) as e:
+        print(f"Error al leer «{args.lote}»: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if entrada is not sys.stdin:
+            entrada.close()
+        if salida is not sys.stdout:
+            salida.close()
+
+    print(f"Registros procesados: {procesados} (con error: {errores})", file=sys.stderr)
+    return 0
+
+
+def main(AKT=None, oracion_original=None, es_dinamico=None):
+    set_spanish_locale()
+    mostrar_presentacion()
+
     while True:
-        if len(sys.argv) > 3:
-            AKT = sys.argv[1]
-            oracion_original = sys.argv[2]
-            flag = sys.argv[3]
-            es_dinamico = True if flag == "dinamico" else False
+        if AKT is not None and oracion_original is not None:
             print(f"El aktionsart que obtuviste en «{oracion_original}» fue: {AKT.upper()}")
-            sys.argv = sys.argv[:1]
+            if es_dinamico is None:
+                es_dinamico = verificar_dinamicidad(AKT, oracion_original)
         else:
             AKT = obtener_aktionsart()
-            oracion_original = peticion("\nEscribe la cláusula de la que quieres obtener su estructura lógica: ")
+            oracion_original = peticion("\nEscribe la cláusula de la que quieres obtener su estructura lógica: ", "clausula")
             es_dinamico = verificar_dinamicidad(AKT, oracion_original)
 
-        x, y, z = obtener_argumentos(oracion_original)
-        operador = MODIFICADORES_AKT.get(AKT, "")
-        pred = ""
-        locus = "Ø"
-        estructura_logica = None
-
-        try:
-            if estructura_logica is None:
-                estructura_logica = verbos_doler_gustar(AKT, x, y, z, operador, es_dinamico, oracion_original)
-            if estructura_logica is None:
-                estructura_logica = hacer_meteorologico(x, y, oracion_original, operador, es_dinamico)
-            if estructura_logica is None:
-                estructura_logica = casos_impersonales(x, y, z, operador, es_dinamico)
-            if estructura_logica is None:
-                estructura_logica = casos_locativo_dativos(AKT, x, y, z, operador, es_dinamico)
-            if estructura_logica is None:
-                estructura_logica = verbos_OI(AKT, x, y, z, operador)
-            if estructura_logica is None:
-                estructura_logica = casos_especiales_estado(AKT, x, y, oracion_original)
-            if estructura_logica is None:
-                estructura_logica = informacion_mente(AKT, x, y, operador, es_dinamico, oracion_original)
-            if estructura_logica is None:
-                estructura_logica, locus = casos_locativos(estructura_logica, AKT, x, y, z, operador, es_dinamico, oracion_original)
-            if estructura_logica is None:
-                estructura_logica = complemento_regimen(AKT, x, y, operador, es_dinamico, oracion_original)
-            # Obtener el valor de pred si no es un caso especial
-            if estructura_logica is None and not pred:
-                pred = obtener_predicado(AKT, y, es_dinamico)
-            # Manejo de verbos especiales ingresados por el usuario
-            es_verbo_reciproco = False
-            if estructura_logica is None:
-                estructura_logica, es_verbo_reciproco = predicados_especiales(AKT, x, y, z, pred, operador, es_dinamico, oracion_original)
-            # Genera la estructura lógica si no se ha hecho hasta el momento
-            if estructura_logica is None:
-                estructura_logica = generar_estructura_logica(AKT, x, y, z, pred, locus, es_dinamico, oracion_original)
-            # Adición de la capa de intencionalidad DO
-            if not es_verbo_reciproco and x != "Ø":
-                estructura_logica = aplicar_DO(oracion_original, x, estructura_logica, es_dinamico, AKT)
-            # Verificación de construcción anticausativa (se + verbo con contraparte causativa)
-            if AKT in ["realización", "logro", "proceso", "semelfactivo"] and y == "Ø":
-                if input_si_no(f"¿El verbo de la cláusula está construido con el clítico «se» \ny tiene una contraparte causativa (ej: «romperse» / «romper»)? (s/n): "):
-                    estructura_logica = f"[do' (Ø, Ø)] CAUSE [{estructura_logica}]"    
-
-            # --- TRADUCCIÓN AUTOMÁTICA ---
-            try:
-                ls_ingles = traducir_ls_a_ingles(estructura_logica)
-            except Exception as e:
-                # Si algo falla (ej. sin internet), usamos la versión en español
-                ls_ingles = estructura_logica
-            
-            print(f"\nLa estructura lógica es: {ls_ingles}")
-            
-            # Usamos ls_ingles para que los operadores se añadan sobre la versión traducida
-            añadir_operadores(ls_ingles)
-
-        except ValueError as ve:
-            print(f"\nError: {ve}")
-        except Exception as e:
-            print(f"\nHa ocurrido un error inesperado: {e}")
-            print(f"Tipo de error: {type(e).__name__}")
+        procesar_clausula(AKT, oracion_original, es_dinamico)
+        AKT = oracion_original = es_dinamico = None
 
-        if not input_si_no("\n¿Quieres obtener la estructura lógica de otra cláusula? (s/n): "):
-            time.sleep(1)
+        if not input_si_no("\n¿Quieres obtener la estructura lógica de otra cláusula? (s/n): ", "otra_clausula"):
+            pausa(1)
             return
         else:
-            time.sleep(0.5)
+            pausa(0.5)
             limpiar_consola()
 
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    argumentos = procesar_argumento_ritmo(sys.argv[1:])
+    if argumentos == ["--solapamientos"]:
+        print("\n".join(informe_solapamientos()))
+    elif any(argumento.split("=")[0] == "--lote" for argumento in argumentos):
+        sys.exit(main_lote(argumentos))
+    elif len(argumentos) > 2:
+        main(argumentos[0], argumentos[1], argumentos[2] == "dinamico")
+    else:
+        main()
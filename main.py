@@ -1,23 +1,32 @@
+import importlib
 import os
 import sys
-import subprocess
 
 # 1. ANCLA: Obligar a Python a trabajar en la carpeta donde está este archivo
 # Esto soluciona el error "No such file or directory"
 os.chdir(os.path.dirname(os.path.abspath(__file__)))
 
-# 2. CONFIGURACIÓN: Textos originales y archivos asociados
+# 2. CONFIGURACIÓN: Textos originales y módulos asociados
+# Los programas se ejecutan en este mismo proceso: los modelos de spaCy se cargan
+# una sola vez (ver modelos.py) y cambiar de opción no reinicia el intérprete.
 PROGRAMAS = {
-    "1": ("Identificar el aktionsart de un predicado (y, opcionalmente, obtener su estructura lógica)", "aktionsart.py"),
-    "2": ("Obtener la estructura lógica de una cláusula (si ya conoces el aktionsart de su predicado)", "ls.py"),
-    "3": ("English version (only for Aktionsart detection)", "english.py"),
-    "4": ("Mostrar información sobre el programa", "info.py")
+    "1": ("Identificar el aktionsart de un predicado (y, opcionalmente, obtener su estructura lógica)", "aktionsart"),
+    "2": ("Obtener la estructura lógica de una cláusula (si ya conoces el aktionsart de su predicado)", "ls"),
+    "3": ("English version (only for Aktionsart detection)", "english"),
+    "4": ("Mostrar información sobre el programa", "info")
 }
 
 def limpiar():
     os.system('cls' if os.name == 'nt' else 'clear')
 
 def main():
+    try:
+        menu()
+    except EOFError:
+        # Entrada redirigida que se terminó
+        print()
+
+def menu():
     while True:
         limpiar()
         print("\n¿Qué quieres hacer?:\n")
@@ -33,11 +42,12 @@ def main():
             break
         
         if opcion in PROGRAMAS:
-            archivo_py = PROGRAMAS[opcion][1]
+            nombre_modulo = PROGRAMAS[opcion][1]
             try:
                 print(f"\nEjecutando la opción elegida...\n")
-                # Ejecutar usando el mismo Python del sistema (-u para salida inmediata)
-                subprocess.run([sys.executable, "-u", archivo_py], check=True)
+                importlib.import_module(nombre_modulo).run()
+            except KeyboardInterrupt:
+                print("\n\nEjecución interrumpida.")
             except Exception as e:
                 print(f"\nERROR: {e}")
             
@@ -47,4 +57,6 @@ def main():
             input("\nOpción no válida. Por favor, intenta de nuevo.")
 
 if __name__ == "__main__":
+    from ritmo import procesar_argumento_ritmo
+    procesar_argumento_ritmo(sys.argv[1:])
     main()
\ No newline at end of file
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+"""
+Registro de modelos de spaCy compartido por todos los programas.
+
+Cada modelo se carga una sola vez por proceso y perfil; como main.py ejecuta los
+programas en el mismo intérprete, cambiar de opción en el menú no vuelve a cargarlo.
+
+Los perfiles indican qué componentes de la tubería se excluyen al cargar el modelo,
+según lo que necesita cada modo de uso (ver PERFILES). Se elige con la variable de
+entorno VENDLER_PERFIL o, si no está definida, con el perfil que pide cada programa.
+
+El tamaño del modelo de cada idioma (sm, md o lg) se elige con VENDLER_MODELO_ES y
+VENDLER_MODELO_EN, que también aceptan el nombre completo de un paquete. Si el modelo
+pedido no está instalado se usa el siguiente más pequeño.
+
+La carga puede empezar en segundo plano (precargar_modelo) mientras el usuario
+responde las primeras preguntas; obtener_modelo solo bloquea si todavía no ha
+terminado. Con la variable de entorno VENDLER_TIEMPOS=1 los programas muestran al
+salir cuánto tardaron en arrancar, cuánto tardó cada modelo y cuánto se esperó por él.
+"""
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+# Componentes excluidos en cada perfil. El análisis automático usa categorías, dependencias,
+# lemas y rasgos morfológicos, pero nunca entidades nombradas; como el modo por lotes lee lo
+# mismo que las preguntas, ambos usan el perfil «interactivo». El perfil «lemas» sirve para
+# lematizar sin dependencias (el lematizador solo necesita las categorías gramaticales).
+PERFILES: Dict[str, Tuple[str, ...]] = {
+    "completo": (),
+    "interactivo": ("ner",),
+    "lemas": ("ner", "parser"),
+}
+PERFIL_POR_DEFECTO = "interactivo"
+
+# Paquetes de spaCy por idioma; «{}» se reemplaza por el tamaño del modelo
+PAQUETES = {"es": "es_core_news_{}", "en": "en_core_web_{}"}
+NIVELES = ("sm", "md", "lg")
+NIVEL_POR_DEFECTO = "sm"
+
+_MODELOS: Dict[Tuple[str, str], Optional[Any]] = {}
+_CARGAS: Dict[Tuple[str, str], threading.Thread] = {}
+_TIEMPOS_CARGA: Dict[Tuple[str, str], float] = {}
+_TIEMPOS_ESPERA: Dict[Tuple[str, str], float] = {}
+_TIEMPOS_ARRANQUE: Dict[str, float] = {}
+_PERFILES_DESCONOCIDOS = set()
+_RESUELTOS: Dict[Tuple[str, str, str], Optional[str]] = {}
+_AVISADOS = set()
+_candado = threading.Lock()
+
+
+def perfil_configurado(por_defecto: str = PERFIL_POR_DEFECTO) -> str:
+    """Devuelve el perfil de VENDLER_PERFIL o, si no está definido o no existe, «por_defecto»."""
+    perfil = os.environ.get("VENDLER_PERFIL", "") or por_defecto
+    if perfil not in PERFILES:
+        if perfil not in _PERFILES_DESCONOCIDOS:
+            _PERFILES_DESCONOCIDOS.add(perfil)
+            logging.warning(f"Perfil de tubería desconocido «{perfil}»; se usará «{por_defecto}».")
+        return por_defecto
+    return perfil
+
+
+def _cargar(nombre: str, perfil: str) -> None:
+    inicio = time.perf_counter()
+    try:
+        import spacy
+        modelo = spacy.load(nombre, exclude=list(PERFILES[perfil]))
+    except (ImportError, OSError) as e:
+        logging.debug(f"No se pudo cargar el modelo «{nombre}»: {e}")
+        modelo = None
+    _MODELOS[nombre, perfil] = modelo
+    _TIEMPOS_CARGA[nombre, perfil] = time.perf_counter() - inicio
+
+
+def precargar_modelo(nombre: str, perfil: Optional[str] = None) -> None:
+    """Empieza a cargar «nombre» en un hilo secundario, si no está cargado ni cargándose."""
+    clave = (nombre, perfil or perfil_configurado())
+    with _candado:
+        if clave in _MODELOS or clave in _CARGAS:
+            return
+        hilo = threading.Thread(target=_cargar, args=clave, name=f"carga-{nombre}-{clave[1]}", daemon=True)
+        _CARGAS[clave] = hilo
+        hilo.start()
+
+
+def obtener_modelo(nombre: str, perfil: Optional[str] = None) -> Optional[Any]:
+    """
+    Devuelve el modelo «nombre» ya cargado con el perfil indicado, o lo carga. Si spaCy o el
+    modelo no están instalados devuelve None, y los programas funcionan en modo manual.
+    """
+    clave = (nombre, perfil or perfil_configurado())
+    if clave not in _MODELOS:
+        precargar_modelo(*clave)
+        inicio = time.perf_counter()
+        _CARGAS[clave].join()
+        _TIEMPOS_ESPERA[clave] = _TIEMPOS_ESPERA.get(clave, 0.0) + time.perf_counter() - inicio
+    return _MODELOS[clave]
+
+
+def nivel_configurado(idioma: str) -> str:
+    return os.environ.get(f"VENDLER_MODELO_{idioma.upper()}", "") or NIVEL_POR_DEFECTO
+
+
+def candidatos_modelo(idioma: str, nivel: Optional[str] = None) -> List[str]:
+    """
+    Paquetes que se prueban, en orden, para «idioma»: el del nivel pedido y luego los más
+    pequeños. Un nombre de paquete completo se prueba antes que todos los niveles.
+    """
+    nivel = nivel or nivel_configurado(idioma)
+    if nivel in NIVELES:
+        return [PAQUETES[idioma].format(n) for n in reversed(NIVELES[:NIVELES.index(nivel) + 1])]
+    return [nivel] + [PAQUETES[idioma].format(n) for n in reversed(NIVELES)]
+
+
+def _resolver_modelo(idioma: str, nivel: str, perfil: str, medir_espera: bool) -> Optional[str]:
+    """Devuelve el nombre del primer candidato que se pudo cargar, o None."""
+    clave = (idioma, nivel, perfil)
+    if clave not in _RESUELTOS:
+        elegido = None
+        for nombre in candidatos_modelo(idioma, nivel):
+            modelo = obtener_modelo(nombre, perfil) if medir_espera else _esperar_sin_medir(nombre, perfil)
+            if modelo is not None:
+                elegido = nombre
+                break
+        _RESUELTOS[clave] = elegido
+    return _RESUELTOS[clave]
+
+
+def _esperar_sin_medir(nombre: str, perfil: str) -> Optional[Any]:
+    precargar_modelo(nombre, perfil)
+    _CARGAS[nombre, perfil].join()
+    return _MODELOS[nombre, perfil]
+
+
+def precargar_modelo_idioma(idioma: str, perfil: Optional[str] = None, nivel: Optional[str] = None) -> None:
+    """Como precargar_modelo, pero recorre en segundo plano los niveles de respaldo del idioma."""
+    argumentos = (idioma, nivel or nivel_configurado(idioma), perfil or perfil_configurado(), False)
+    threading.Thread(target=_resolver_modelo, args=argumentos, name=f"resolucion-{idioma}", daemon=True).start()
+
+
+def obtener_modelo_idioma(idioma: str, perfil: Optional[str] = None, nivel: Optional[str] = None) -> Optional[Any]:
+    """Devuelve el modelo configurado para «idioma» (o el más grande instalado por debajo de él), o None."""
+    nivel = nivel or nivel_configurado(idioma)
+    perfil = perfil or perfil_configurado()
+    nombre = _resolver_modelo(idioma, nivel, perfil, True)
+    pedido = candidatos_modelo(idioma, nivel)[0]
+    if nombre is not None and nombre != pedido and pedido not in _AVISADOS:
+        _AVISADOS.add(pedido)
+        logging.warning(f"El modelo {pedido} no está instalado; se usará {nombre}.")
+    return _MODELOS[nombre, perfil] if nombre is not None else None
+
+
+def modelos_cargados() -> Dict[str, bool]:
+    return {f"{nombre} [{perfil}]": modelo is not None for (nombre, perfil), modelo in _MODELOS.items()}
+
+
+def registrar_arranque(programa: str, inicio: float) -> None:
+    """Anota el tiempo transcurrido desde «inicio» (time.perf_counter) hasta la primera pregunta."""
+    _TIEMPOS_ARRANQUE[programa] = time.perf_counter() - inicio
+    logging.debug(f"Arranque de {programa}: {_TIEMPOS_ARRANQUE[programa]:.3f} s")
+
+
+def informe_tiempos() -> List[str]:
+    lineas = [f"Arranque de {programa}: {segundos:.3f} s" for programa, segundos in _TIEMPOS_ARRANQUE.items()]
+    for clave in _CARGAS:
+        if clave in _TIEMPOS_CARGA:
+            estado = "cargado" if _MODELOS.get(clave) is not None else "no disponible"
+            carga = f"{_TIEMPOS_CARGA[clave]:.3f} s ({estado})"
+        else:
+            carga = "en curso"
+        lineas.append(f"Modelo {clave[0]} [{clave[1]}]: carga {carga}, espera {_TIEMPOS_ESPERA.get(clave, 0.0):.3f} s")
+    return lineas
+
+
+def mostrar_tiempos() -> None:
+    if os.environ.get("VENDLER_TIEMPOS", "") not in ("", "0"):
+        print("\n" + "\n".join(informe_tiempos()))
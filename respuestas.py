@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""
+Proveedores de respuestas para las preguntas de los programas.
+
+Por defecto las respuestas se leen de la consola, pero el mismo flujo de pruebas
+diagnósticas puede alimentarse desde un archivo de reproducción, una función de
+Python o un conjunto de reglas, lo que permite clasificar predicados sin intervención.
+Cada pregunta lleva una «clave» estable (ej: «estatividad») que identifica la prueba.
+Para datos ya conocidos (ej: el sujeto detectado por el análisis automático) se pueden
+registrar sugerencias por clave, que la consola muestra como texto editable.
+"""
+import json
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, Mapping, Optional, Union
+
+
+class RespuestaNoDisponible(ValueError):
+    """El proveedor no tiene una respuesta (válida) para la pregunta solicitada."""
+
+
+class ProveedorRespuestas:
+    # Los proveedores no interactivos no pueden volver a preguntar ante una respuesta inválida
+    interactivo = False
+
+    def responder(self, clave: str, pregunta: str) -> str:
+        raise NotImplementedError
+
+
+class ProveedorConsola(ProveedorRespuestas):
+    interactivo = True
+
+    def responder(self, clave: str, pregunta: str) -> str:
+        import readline  # edición de línea en input(); se importa con la primera pregunta
+        readline.set_startup_hook(lambda: readline.insert_text(sugerencia(clave)))
+        try:
+            # Si el prompt es largo o multilínea, imprímelo y usa input() vacío
+            if "\n" in pregunta or len(pregunta) > 60:
+                print(pregunta, end="", flush=True)
+                respuesta = input().strip()
+            else:
+                respuesta = input(pregunta).strip()
+            return respuesta.encode('utf-8').decode('utf-8')
+        finally:
+            readline.set_startup_hook()
+
+
+class ProveedorReproduccion(ProveedorRespuestas):
+    """Entrega, en orden, respuestas grabadas previamente (una por pregunta)."""
+
+    def __init__(self, respuestas: Iterable[str]):
+        self._respuestas = iter(respuestas)
+
+    @classmethod
+    def desde_archivo(cls, ruta: str) -> "ProveedorReproduccion":
+        with open(ruta, encoding="utf-8") as archivo:
+            return cls([linea.rstrip("\n") for linea in archivo])
+
+    def responder(self, clave: str, pregunta: str) -> str:
+        try:
+            return next(self._respuestas).strip()
+        except StopIteration:
+            raise RespuestaNoDisponible(f"Se agotaron las respuestas grabadas (pregunta: «{clave or pregunta.strip()}»).")
+
+
+class ProveedorFuncion(ProveedorRespuestas):
+    """Delega cada pregunta en una función «funcion(clave, pregunta) -> respuesta»."""
+
+    def __init__(self, funcion: Callable[[str, str], str]):
+        self._funcion = funcion
+
+    def responder(self, clave: str, pregunta: str) -> str:
+        return str(self._funcion(clave, pregunta)).strip()
+
+
+class ProveedorReglas(ProveedorRespuestas):
+    """
+    Responde según un diccionario «clave -> respuesta». La respuesta puede ser un texto
+    o una función que recibe la pregunta. Las claves sin regla se derivan al proveedor
+    de respaldo, si existe.
+    """
+
+    def __init__(self, reglas: Mapping[str, Union[str, Callable[[str], str]]],
+                 respaldo: Optional[ProveedorRespuestas] = None):
+        self._reglas = dict(reglas)
+        self._respaldo = respaldo
+
+    @classmethod
+    def desde_json(cls, ruta: str, respaldo: Optional[ProveedorRespuestas] = None) -> "ProveedorReglas":
+        with open(ruta, encoding="utf-8") as archivo:
+            return cls(json.load(archivo), respaldo)
+
+    @property
+    def interactivo(self) -> bool:
+        return self._respaldo is not None and self._respaldo.interactivo
+
+    def responder(self, clave: str, pregunta: str) -> str:
+        if clave in self._reglas:
+            regla = self._reglas[clave]
+            return (regla(pregunta) if callable(regla) else str(regla)).strip()
+        if self._respaldo is not None:
+            return self._respaldo.responder(clave, pregunta)
+        raise RespuestaNoDisponible(f"No hay una regla para la pregunta «{clave or pregunta.strip()}».")
+
+
+_proveedor_actual: ProveedorRespuestas = ProveedorConsola()
+_sugerencias: Dict[str, str] = {}
+
+
+def proveedor_actual() -> ProveedorRespuestas:
+    return _proveedor_actual
+
+
+def establecer_proveedor(proveedor: ProveedorRespuestas) -> ProveedorRespuestas:
+    """Instala un nuevo proveedor y devuelve el anterior."""
+    global _proveedor_actual
+    anterior, _proveedor_actual = _proveedor_actual, proveedor
+    return anterior
+
+
+@contextmanager
+def usar_proveedor(proveedor: ProveedorRespuestas) -> Iterator[ProveedorRespuestas]:
+    anterior = establecer_proveedor(proveedor)
+    try:
+        yield proveedor
+    finally:
+        establecer_proveedor(anterior)
+
+
+def sugerencia(clave: str) -> str:
+    return _sugerencias.get(clave, "") if clave else ""
+
+
+@contextmanager
+def sugerencias(valores: Mapping[str, str]) -> Iterator[None]:
+    """Registra respuestas sugeridas por clave mientras dure el bloque."""
+    anteriores = dict(_sugerencias)
+    _sugerencias.update({clave: valor for clave, valor in valores.items() if valor})
+    try:
+        yield
+    finally:
+        _sugerencias.clear()
+        _sugerencias.update(anteriores)
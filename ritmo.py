@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""
+Ritmo de las pausas entre preguntas y resultados.
+
+En la consola, las pausas breves dan tiempo a leer cada resultado antes del siguiente,
+pero en una ejecución con guion, con la entrada redirigida o por lotes solo la hacen
+más lenta. Modos (ver MODOS):
+
+    interactivo   pausas completas (por defecto en la consola)
+    rapido        pausas cortas
+    cero          sin pausas (por defecto si la entrada estándar no es una terminal,
+                  en el modo por lotes y con proveedores de respuestas no interactivos)
+
+Se elige con la opción «--ritmo MODO» de cada programa o con la variable de entorno
+VENDLER_RITMO; la opción tiene prioridad y ambas, sobre la detección automática.
+"""
+import os
+import sys
+import time
+from typing import List, Optional, Sequence
+
+# Fracción de cada pausa que se respeta en cada modo
+MODOS = {
+    "interactivo": 1.0,
+    "rapido": 0.2,
+    "cero": 0.0,
+}
+
+_ritmo_elegido: Optional[str] = None
+_MODOS_DESCONOCIDOS = set()
+
+
+def _entrada_es_terminal() -> bool:
+    try:
+        return sys.stdin is not None and sys.stdin.isatty()
+    except ValueError:  # entrada estándar cerrada
+        return False
+
+
+def ritmo_configurado() -> str:
+    """Modo vigente: el elegido con establecer_ritmo, el de VENDLER_RITMO o el automático."""
+    if _ritmo_elegido is not None:
+        return _ritmo_elegido
+    modo = os.environ.get("VENDLER_RITMO", "")
+    if modo in MODOS:
+        return modo
+    if modo and modo not in _MODOS_DESCONOCIDOS:
+        import logging
+        _MODOS_DESCONOCIDOS.add(modo)
+        logging.warning(f"Ritmo desconocido «{modo}»; opciones: {', '.join(MODOS)}.")
+    if not _entrada_es_terminal():
+        return "cero"
+    # Con respuestas de un archivo, una función o reglas no hay nadie leyendo la consola
+    from respuestas import proveedor_actual
+    return "interactivo" if proveedor_actual().interactivo else "cero"
+
+
+def establecer_ritmo(modo: Optional[str]) -> None:
+    """Fija el modo para el resto de la ejecución; None vuelve a la configuración automática."""
+    global _ritmo_elegido
+    if modo is not None and modo not in MODOS:
+        raise ValueError(f"Ritmo desconocido «{modo}». Opciones: {', '.join(MODOS)}.")
+    _ritmo_elegido = modo
+
+
+def procesar_argumento_ritmo(argumentos: Sequence[str]) -> List[str]:
+    """Aplica «--ritmo MODO» (o «--ritmo=MODO») si está en «argumentos» y devuelve los argumentos restantes."""
+    restantes = []
+    iterador = iter(argumentos)
+    for argumento in iterador:
+        if argumento == "--ritmo":
+            establecer_ritmo(next(iterador, ""))
+        elif argumento.startswith("--ritmo="):
+            establecer_ritmo(argumento.split("=", 1)[1])
+        else:
+            restantes.append(argumento)
+    return restantes
+
+
+def pausa(segundos: float) -> None:
+    """Espera «segundos» escalados según el modo vigente (nada en el modo «cero»)."""
+    factor = MODOS[ritmo_configurado()]
+    if factor:
+        time.sleep(segundos * factor)
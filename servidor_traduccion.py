@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""
+Servidor HTTP local que imita un servicio de traducción, para pruebas y mediciones
+de latencia sin salir a internet. Traduce cada línea con el glosario de ls.py
+(o la devuelve tal cual) y puede simular demoras y fallos.
+
+Uso: python servidor_traduccion.py [--puerto 8765] [--retardo 0.5] [--tasa-fallos 0.2]
+Luego: VENDLER_TRADUCTOR=http://127.0.0.1:8765 python ls.py
+"""
+import argparse
+import json
+import os
+import random
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+
+RUTA_GLOSARIO = os.path.join(os.path.dirname(os.path.abspath(__file__)), "glosario_en.json")
+
+
+def crear_manejador(glosario: Dict[str, str], retardo: float, tasa_fallos: float):
+    class ManejadorTraduccion(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urllib.parse.urlparse(self.path)
+            if url.path != "/traducir":
+                self._responder(404, {"error": "ruta desconocida"})
+                return
+            if retardo:
+                time.sleep(retardo)
+            if tasa_fallos and random.random() < tasa_fallos:
+                self._responder(503, {"error": "fallo simulado"})
+                return
+            texto = urllib.parse.parse_qs(url.query).get("q", [""])[0]
+            lineas = [glosario.get(linea.strip().lower().replace(" ", "."), linea) for linea in texto.split("\n")]
+            self._responder(200, {"traduccion": "\n".join(lineas)})
+
+        def _responder(self, codigo: int, cuerpo: dict):
+            datos = json.dumps(cuerpo, ensure_ascii=False).encode("utf-8")
+            try:
+                self.send_response(codigo)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(datos)))
+                self.end_headers()
+                self.wfile.write(datos)
+            except (BrokenPipeError, ConnectionResetError):
+                # El cliente agotó su tiempo límite y cerró la conexión (escenario «lento»)
+                self.close_connection = True
+
+        def log_message(self, formato, *args):
+            pass
+
+    return ManejadorTraduccion
+
+
+def iniciar_servidor(puerto: int = 0, retardo: float = 0.0, tasa_fallos: float = 0.0,
+                     glosario: Optional[Dict[str, str]] = None) -> Tuple[ThreadingHTTPServer, str]:
+    """Inicia el servidor en un hilo secundario y devuelve (servidor, url). Con puerto 0 se elige uno libre."""
+    if glosario is None:
+        with open(RUTA_GLOSARIO, encoding="utf-8") as archivo:
+            glosario = json.load(archivo)
+    servidor = ThreadingHTTPServer(("127.0.0.1", puerto), crear_manejador(glosario, retardo, tasa_fallos))
+    threading.Thread(target=servidor.serve_forever, daemon=True).start()
+    return servidor, f"http://127.0.0.1:{servidor.server_address[1]}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Servidor local de traducción simulada.")
+    parser.add_argument("--puerto", type=int, default=8765)
+    parser.add_argument("--retardo", type=float, default=0.0, help="segundos de espera antes de cada respuesta")
+    parser.add_argument("--tasa-fallos", type=float, default=0.0, help="probabilidad (0-1) de responder con error 503")
+    args = parser.parse_args()
+
+    servidor, url = iniciar_servidor(args.puerto, args.retardo, args.tasa_fallos)
+    print(f"Servidor de traducción escuchando en {url} (Ctrl+C para detenerlo)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        servidor.shutdown()
+
+
+if __name__ == "__main__":
+    main()